@@ -0,0 +1 @@
+"""Initialisation file for the benchmarks package."""
@@ -0,0 +1,31 @@
+"""Shared fixtures for the mortgagepy benchmarks."""
+
+import numpy as np
+import pytest
+
+from mortgagepy import MortgagePortfolio
+
+PORTFOLIO_SIZE = 100_000
+
+
+@pytest.fixture(scope="session")
+def loans() -> tuple:
+    """fixture of mortgage, interest rate and term arrays for a book of
+    loans."""
+    rng = np.random.default_rng(2023)
+    mortgages = np.round(rng.uniform(50_000, 1_000_000, PORTFOLIO_SIZE), 2)
+    interest_rates = np.round(rng.uniform(0.5, 9.5, PORTFOLIO_SIZE), 2)
+    terms = rng.integers(60, 481, PORTFOLIO_SIZE).astype(np.float64)
+    return mortgages, interest_rates, terms
+
+
+@pytest.fixture(scope="session")
+def portfolio(loans: tuple) -> MortgagePortfolio:
+    """fixture of a portfolio of the book of loans."""
+    mortgages, interest_rates, terms = loans
+    return MortgagePortfolio(
+        property_values=mortgages * 1.25,
+        mortgages=mortgages,
+        term_months=terms,
+        interest_rates=interest_rates,
+    )
@@ -0,0 +1,86 @@
+"""Benchmarks for the mortgagepy.calculator and mortgagepy.batch modules."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from mortgagepy import batch, instrumentation, kernels
+from mortgagepy.calculator import (
+    capital_overpayment,
+    monthly_capital_repayment,
+)
+from mortgagepy.projection import OverpaymentProjection
+
+
+def test_monthly_capital_repayment(benchmark: BenchmarkFixture) -> None:
+    """benchmark a single capital repayment calculation."""
+    benchmark(monthly_capital_repayment, 210_000, 3.89, 300)
+
+
+def test_monthly_capital_repayment_instrumented(
+    benchmark: BenchmarkFixture,
+) -> None:
+    """benchmark a single capital repayment calculation with
+    instrumentation enabled."""
+    instrumentation.enable_instrumentation()
+    try:
+        benchmark(monthly_capital_repayment, 210_000, 3.89, 300)
+    finally:
+        instrumentation.disable_instrumentation()
+
+
+@pytest.mark.parametrize("term_months", [300, 480])
+def test_capital_overpayment(
+    benchmark: BenchmarkFixture, term_months: int
+) -> None:
+    """benchmark a single overpayment projection."""
+    benchmark(
+        capital_overpayment,
+        mortgage=210_000,
+        interest_rate=3.89,
+        mortgage_length_months=term_months,
+        monthly_overpayment=100,
+        lump_sum_payment=10_000,
+        lump_sum_payment_month=12,
+    )
+
+
+@pytest.mark.parametrize("from_month", [1, 240])
+def test_reproject(benchmark: BenchmarkFixture, from_month: int) -> None:
+    """benchmark changing the monthly overpayment part way through."""
+    projection = OverpaymentProjection(210_000, 3.89, 300, 100)
+    benchmark(projection.reproject, 250, from_month)
+
+
+def test_batch_monthly_capital_repayment(
+    benchmark: BenchmarkFixture, loans: tuple
+) -> None:
+    """benchmark capital repayments for a book of loans."""
+    benchmark(batch.monthly_capital_repayment, *loans)
+
+
+def test_batch_capital_overpayment(
+    benchmark: BenchmarkFixture, loans: tuple
+) -> None:
+    """benchmark overpayment projections for a book of loans."""
+    mortgages, interest_rates, terms = (values[:10_000] for values in loans)
+    benchmark.pedantic(
+        batch.capital_overpayment,
+        args=(mortgages, interest_rates, terms),
+        kwargs={"monthly_overpayment": 100},
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize("backend", kernels.available_backends())
+def test_batch_capital_overpayment_backend(
+    benchmark: BenchmarkFixture, loans: tuple, backend: str
+) -> None:
+    """benchmark overpayment projections for a book of loans with each
+    kernel backend."""
+    mortgages, interest_rates, terms = (values[:10_000] for values in loans)
+    benchmark.pedantic(
+        batch.capital_overpayment,
+        args=(mortgages, interest_rates, terms),
+        kwargs={"monthly_overpayment": 100, "backend": backend},
+        rounds=3,
+    )
@@ -0,0 +1,42 @@
+"""Benchmarks for the mortgagepy.compare module."""
+
+import numpy as np
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from mortgagepy.compare import (
+    compare_capital_repayment_rates,
+    compare_interest_only_rates,
+    sweep_capital_repayment_rates,
+)
+
+INTEREST_RATES = np.linspace(0.5, 10, 100).tolist()
+
+
+def test_compare_capital_repayment_rates(benchmark: BenchmarkFixture) -> None:
+    """benchmark comparing capital repayments over 100 interest rates."""
+    benchmark(
+        compare_capital_repayment_rates,
+        mortgage=210_000,
+        interest_rates=INTEREST_RATES,
+        mortgage_length_months=300,
+    )
+
+
+def test_compare_interest_only_rates(benchmark: BenchmarkFixture) -> None:
+    """benchmark comparing interest only repayments over 100 interest
+    rates."""
+    benchmark(
+        compare_interest_only_rates,
+        mortgage=210_000,
+        interest_rates=INTEREST_RATES,
+    )
+
+
+def test_sweep_capital_repayment_rates(benchmark: BenchmarkFixture) -> None:
+    """benchmark a 100 x 40 x 200 rate, term and mortgage sweep."""
+    benchmark(
+        sweep_capital_repayment_rates,
+        mortgages=np.linspace(50_000, 1_000_000, 200),
+        interest_rates=INTEREST_RATES,
+        mortgage_length_months=np.arange(12, 492, 12),
+    )
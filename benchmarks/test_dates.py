@@ -0,0 +1,40 @@
+"""Benchmarks for the mortgagepy.dates module."""
+
+from datetime import date
+
+import numpy as np
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from mortgagepy import dates
+from mortgagepy.utils import mortgage_term_remaining
+
+
+def _start_dates(n_loans: int) -> np.ndarray:
+    rng = np.random.default_rng(2023)
+    return np.datetime64("2000-01-01") + rng.integers(0, 9_000, n_loans)
+
+
+def test_term_remaining(benchmark: BenchmarkFixture) -> None:
+    """benchmark the remaining terms of a million loans."""
+    start_dates = _start_dates(1_000_000)
+    benchmark(dates.term_remaining, start_dates, 300, date(2025, 1, 1))
+
+
+def test_mortgage_term_remaining(benchmark: BenchmarkFixture) -> None:
+    """benchmark the remaining terms of 10,000 loans one at a time."""
+    start_dates = _start_dates(10_000).tolist()
+
+    def run() -> list:
+        remaining = []
+        for start_date in start_dates:
+            elapsed = mortgage_term_remaining(start_date, date(2025, 1, 1))
+            remaining.append(max(300 - elapsed.years * 12 - elapsed.months, 0))
+        return remaining
+
+    benchmark.pedantic(run, rounds=3)
+
+
+def test_payment_dates(benchmark: BenchmarkFixture) -> None:
+    """benchmark a year of payment dates for 100,000 loans."""
+    start_dates = _start_dates(100_000)
+    benchmark(dates.payment_dates, start_dates, 12, 28)
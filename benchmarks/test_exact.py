@@ -0,0 +1,36 @@
+"""Benchmarks comparing the float and exact decimal calculators."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from mortgagepy import calculator, exact
+
+MODES = {"float": calculator, "decimal": exact}
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_mode_monthly_capital_repayment(
+    benchmark: BenchmarkFixture, loans: tuple, mode: str
+) -> None:
+    """benchmark capital repayments of 10,000 loans in each mode."""
+    module = MODES[mode]
+    book = list(zip(*(values[:10_000].tolist() for values in loans)))
+
+    def run() -> list:
+        return [module.monthly_capital_repayment(*loan) for loan in book]
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_mode_capital_overpayment(
+    benchmark: BenchmarkFixture, loans: tuple, mode: str
+) -> None:
+    """benchmark overpayment projections of 200 loans in each mode."""
+    module = MODES[mode]
+    book = list(zip(*(values[:200].tolist() for values in loans)))
+
+    def run() -> list:
+        return [module.capital_overpayment(*loan, 100) for loan in book]
+
+    benchmark.pedantic(run, rounds=3)
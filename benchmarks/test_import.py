@@ -0,0 +1,18 @@
+"""Benchmarks for importing the mortgagepy package."""
+
+import os
+import subprocess
+import sys
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_import(benchmark: BenchmarkFixture) -> None:
+    """benchmark a cold import of the package in a fresh interpreter."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", "import mortgagepy"],),
+        kwargs={"check": True, "env": env},
+        rounds=10,
+    )
@@ -0,0 +1,65 @@
+"""Benchmarks for the mortgagepy.mortgage and mortgagepy.portfolio
+modules."""
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from mortgagepy import CapitalRepaymentMortgage, MortgagePortfolio
+
+
+def _mortgage() -> CapitalRepaymentMortgage:
+    return CapitalRepaymentMortgage(
+        property_value=280_000,
+        mortgage=210_000,
+        term_months=300,
+        interest_rate=1.8,
+    )
+
+
+def test_summarise(benchmark: BenchmarkFixture) -> None:
+    """benchmark creating and summarising a mortgage."""
+    benchmark(lambda: _mortgage().summarise())
+
+
+def test_overpayment_projection(benchmark: BenchmarkFixture) -> None:
+    """benchmark an overpayment projection of a mortgage."""
+    mortgage = _mortgage()
+    benchmark(mortgage.overpayment_projection, monthly_overpayment=100)
+
+
+def test_portfolio_summarise(
+    benchmark: BenchmarkFixture, portfolio: MortgagePortfolio
+) -> None:
+    """benchmark summarising a portfolio."""
+    benchmark(portfolio.summarise)
+
+
+def test_portfolio_ltv_distribution(
+    benchmark: BenchmarkFixture, portfolio: MortgagePortfolio
+) -> None:
+    """benchmark the loan to value distribution of a portfolio."""
+    benchmark(portfolio.ltv_distribution)
+
+
+def test_construct_one_by_one(
+    benchmark: BenchmarkFixture, loans: tuple
+) -> None:
+    """benchmark constructing a book of mortgages one at a time."""
+    mortgages, interest_rates, terms = (values.tolist() for values in loans)
+
+    def run() -> list:
+        return [
+            CapitalRepaymentMortgage(mortgage * 1.25, mortgage, term, rate)
+            for mortgage, rate, term in zip(mortgages, interest_rates, terms)
+        ]
+
+    benchmark.pedantic(run, rounds=3)
+
+
+def test_from_arrays(benchmark: BenchmarkFixture, loans: tuple) -> None:
+    """benchmark constructing a book of mortgages from columns."""
+    mortgages, interest_rates, terms = loans
+    benchmark.pedantic(
+        CapitalRepaymentMortgage.from_arrays,
+        args=(mortgages * 1.25, mortgages, terms, interest_rates),
+        rounds=3,
+    )
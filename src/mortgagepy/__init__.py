@@ -1,26 +1,110 @@
-"""mortgagepy - A Python package for mortgage calculations."""
+"""mortgagepy - A Python package for mortgage calculations.
 
-from importlib.metadata import PackageNotFoundError, version
+Only the mortgage classes and calculator are imported with the package, the
+other modules (and their dependencies such as NumPy) are imported the first
+time they are used.
+"""
 
-from . import calculator, compare, exceptions, utils
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from . import calculator, daycount, exceptions, instrumentation
+from .exceptions import IncorrectType
 from .mortgage import (
     CapitalRepaymentMortgage,
     InterestOnlyMortgage,
     MortgageBase,
 )
 
-try:
-    __version__ = version("mortgagepy")
-except PackageNotFoundError:
-    pass
+if TYPE_CHECKING:
+    from . import (
+        batch,
+        cache,
+        compare,
+        dates,
+        exact,
+        io,
+        kernels,
+        portfolio,
+        projection,
+        scenarios,
+        schedule,
+        server,
+        solvers,
+        stress,
+        utils,
+    )
+    from .portfolio import MortgagePortfolio
+    from .projection import OverpaymentProjection
+
+_LAZY_MODULES = {
+    "batch",
+    "cache",
+    "compare",
+    "dates",
+    "exact",
+    "io",
+    "kernels",
+    "portfolio",
+    "projection",
+    "scenarios",
+    "schedule",
+    "server",
+    "solvers",
+    "stress",
+    "utils",
+}
+_LAZY_ATTRIBUTES = {
+    "MortgagePortfolio": "portfolio",
+    "OverpaymentProjection": "projection",
+}
 
 __all__ = [
     "IncorrectType",
     "CapitalRepaymentMortgage",
     "InterestOnlyMortgage",
     "MortgageBase",
+    "MortgagePortfolio",
+    "OverpaymentProjection",
+    "batch",
+    "cache",
     "calculator",
     "compare",
+    "dates",
+    "daycount",
+    "exact",
     "exceptions",
+    "instrumentation",
+    "io",
+    "kernels",
+    "portfolio",
+    "projection",
+    "scenarios",
+    "schedule",
+    "server",
+    "solvers",
+    "stress",
     "utils",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import submodules, their attributes and the version on first use."""
+    if name in _LAZY_MODULES:
+        return import_module(f".{name}", __name__)
+    if name in _LAZY_ATTRIBUTES:
+        module = import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        return getattr(module, name)
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            return version("mortgagepy")
+        except PackageNotFoundError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    """Attributes of the package, including those imported on first use."""
+    return sorted(set(globals()) | _LAZY_MODULES | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,7 @@
+"""Run the mortgagepy command line interface with `python -m mortgagepy`."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,575 @@
+"""Vectorised mortgage calculations module for mortgagepy package.
+
+Every function in this module mirrors a scalar function in
+`mortgagepy.calculator` but accepts NumPy arrays (or anything array-like) and
+broadcasts its arguments against each other, so a whole loan book can be
+priced in a single call. Results are rounded exactly as the scalar functions
+round them.
+
+Projections walk every loan of the book forward together, one month per
+step, so the per-month work is a handful of array operations rather than a
+Python loop per loan. Interest is charged daily and rounded to the penny each
+month, exactly like `calculator.capital_overpayment`, so the balance of each
+month depends on the rounding of the previous one and a projection cannot be
+collapsed into a closed form without changing its results.
+"""
+
+from datetime import datetime
+from math import ceil
+from typing import Callable, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from . import calculator, dates, instrumentation, kernels
+from .daycount import DEFAULT_CONVENTION, day_count_array, day_count_arrays
+from .exceptions import IncorrectType
+
+SCHEDULE_FIELDS = (
+    "opening_balance",
+    "interest",
+    "principal",
+    "overpayment",
+    "closing_balance",
+)
+
+
+def _round(
+    values: np.ndarray,
+    ndigits: int = 2,
+    exact: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> np.ndarray:
+    """Round element-wise so the result matches the builtin `round`.
+
+    `np.round` scales by 10**ndigits before rounding, which can land on the
+    other side of a half when the scaled value is not exactly representable.
+    The (rare) values that sit within a few ulps of a half are re-rounded in
+    Python, optionally by recomputing them from scratch with `exact`.
+
+    Args:
+        values (np.ndarray): unrounded values.
+        ndigits (int, optional): number of decimal places. Default is 2.
+        exact (Callable, optional): given a boolean mask, returns the exactly
+            rounded values for the masked elements. Default is None which
+            re-rounds the masked elements of `values` with the builtin.
+
+    Returns:
+        (np.ndarray): rounded values.
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * 10**ndigits
+    with np.errstate(invalid="ignore"):
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) <= 4 * np.spacing(
+            np.abs(scaled)
+        )
+    if near_half.any():
+        if exact is None:
+            rounded[near_half] = [
+                round(float(value), ndigits) for value in values[near_half]
+            ]
+        else:
+            rounded[near_half] = exact(near_half)
+    return rounded
+
+
+def monthly_capital_repayment(
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+) -> np.ndarray:
+    """Vectorised `calculator.monthly_capital_repayment`.
+
+    Args:
+        mortgages (ArrayLike): outstanding mortgage values.
+        interest_rates (ArrayLike): current interest rates as a percentage.
+        mortgage_length_months (ArrayLike): number of months remaining of
+            each mortgage.
+
+    Returns:
+        (np.ndarray): monthly mortgage repayments.
+    """
+    mortgages, interest_rates, mortgage_length_months = np.broadcast_arrays(
+        np.asarray(mortgages, dtype=np.float64),
+        np.asarray(interest_rates, dtype=np.float64),
+        np.asarray(mortgage_length_months, dtype=np.float64),
+    )
+
+    r = (interest_rates / 100) / 12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = (1 + r) ** mortgage_length_months
+        unrounded = mortgages * (r * rate / (rate - 1))
+
+    def exact(mask: np.ndarray) -> list:
+        return [
+            calculator.monthly_capital_repayment(float(m), float(i), float(n))
+            for m, i, n in zip(
+                mortgages[mask],
+                interest_rates[mask],
+                mortgage_length_months[mask],
+            )
+        ]
+
+    return _round(unrounded, exact=exact)
+
+
+def total_cost_of_mortgage(
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+) -> np.ndarray:
+    """Vectorised `calculator.total_cost_of_mortgage`.
+
+    Args:
+        mortgages (ArrayLike): outstanding mortgage values.
+        interest_rates (ArrayLike): current interest rates as a percentage.
+        mortgage_length_months (ArrayLike): number of months remaining of
+            each mortgage.
+
+    Returns:
+        (np.ndarray): total cost of each mortgage.
+    """
+    monthly_repayments = monthly_capital_repayment(
+        mortgages, interest_rates, mortgage_length_months
+    )
+
+    return _round(monthly_repayments * np.asarray(mortgage_length_months))
+
+
+def monthly_interest_only_repayment(
+    mortgages: npt.ArrayLike, interest_rates: npt.ArrayLike
+) -> np.ndarray:
+    """Vectorised `calculator.monthly_interest_only_repayment`.
+
+    Args:
+        mortgages (ArrayLike): outstanding mortgage values.
+        interest_rates (ArrayLike): current interest rates as a percentage.
+
+    Returns:
+        (np.ndarray): monthly cost of each mortgage.
+    """
+    interest_rates_dec = np.asarray(interest_rates, dtype=np.float64) / 100
+
+    return _round(
+        (np.asarray(mortgages, dtype=np.float64) * interest_rates_dec) / 12
+    )
+
+
+def ltv(property_values: npt.ArrayLike, deposits: npt.ArrayLike) -> np.ndarray:
+    """Vectorised `calculator.ltv`.
+
+    Args:
+        property_values (ArrayLike): current property prices.
+        deposits (ArrayLike): current equity or deposits.
+
+    Returns:
+        (np.ndarray): loan to value as an integer percentage.
+    """
+    deposits_dec = np.asarray(deposits, dtype=np.float64) / np.asarray(
+        property_values, dtype=np.float64
+    )
+    loans_dec = 1 - deposits_dec
+
+    return np.trunc(loans_dec * 100).astype(np.int64)
+
+
+def rate_path(segments: npt.ArrayLike, n_months: int) -> np.ndarray:
+    """Interest rate of every month of products whose rate changes part way
+    through the term, such as a fixed rate reverting to a variable rate.
+
+    Args:
+        segments (ArrayLike): (start month, interest rate) pairs of the rate
+            segments of one loan, or a (loan, segment, 2) array for many
+            loans. Start months are 1-based and the first is 1. Loans with
+            fewer segments can repeat their last segment.
+        n_months (int): number of months of the path.
+
+    Raises:
+        IncorrectType: If the segments are not (start month, rate) pairs or
+            their start months do not begin at 1 and increase.
+
+    Returns:
+        (np.ndarray): 2-D (loan, month) array of interest rates, to pass as
+            the interest rates of `capital_overpayment` or
+            `schedule.amortisation_schedule`.
+    """
+    segments = np.asarray(segments, dtype=np.float64)
+    if segments.ndim == 2:
+        segments = segments[np.newaxis]
+    if segments.ndim != 3 or segments.shape[2] != 2 or not segments.shape[1]:
+        raise IncorrectType(
+            "segments must be (start month, interest rate) pairs."
+        )
+
+    start_months, rates = segments[..., 0], segments[..., 1]
+    if (start_months[:, 0] != 1).any() or (np.diff(start_months) < 0).any():
+        raise IncorrectType(
+            "Segment start months must begin at 1 and increase."
+        )
+
+    months = np.arange(1, n_months + 1)
+    paths = np.repeat(rates[:, :1], n_months, axis=1)
+    for segment in range(1, segments.shape[1]):
+        paths = np.where(
+            months >= start_months[:, segment, np.newaxis],
+            rates[:, segment, np.newaxis],
+            paths,
+        )
+    return paths
+
+
+def _project(
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+    monthly_overpayment: npt.ArrayLike = 0,
+    lump_sum_payment: npt.ArrayLike = 0,
+    lump_sum_payment_month: npt.ArrayLike = 1,
+    record: bool = False,
+    aggregate: bool = False,
+    day_count: str = DEFAULT_CONVENTION,
+    backend: Optional[str] = None,
+    start_date: Optional[npt.ArrayLike] = None,
+) -> dict:
+    """Project a book of capital repayment mortgages month by month.
+
+    A 2-D (loan, month) array of interest rates is a rate path per loan,
+    see `rate_path`. Whenever a loan's rate changes its monthly repayment is
+    recalculated from the balance and the months remaining, only for the
+    loans resetting that month.
+
+    Flat rate projections which are not recorded or aggregated are run by a
+    kernel backend, see `kernels`.
+
+    Args:
+        mortgages (ArrayLike): outstanding mortgage values.
+        interest_rates (ArrayLike): interest rates as a percentage, or a 2-D
+            (loan, month) array of the interest rate of every month.
+        mortgage_length_months (ArrayLike): original number of months of
+            each mortgage.
+        monthly_overpayment (ArrayLike, optional): additional monthly
+            overpayment amounts. Default is 0.
+        lump_sum_payment (ArrayLike, optional): one-time lump sum payment
+            amounts. Default is 0.
+        lump_sum_payment_month (ArrayLike, optional): the month in which each
+            lump sum payment is made. Default is 1.
+        record (bool, optional): keep the per-month schedule as well as the
+            totals. Default is False.
+        aggregate (bool, optional): keep the per-month schedule summed over
+            every loan. Default is False.
+        day_count (str, optional): day count convention of the daily
+            interest. Default is "actual/actual".
+        backend (str, optional): kernel backend of flat rate projections.
+            Default is None which uses the default backend.
+        start_date (ArrayLike, optional): date of the first month of the
+            projection, or of each loan. Default is None which uses the
+            current month.
+
+    Returns:
+        (dict): the first month of the projection (of each loan when the
+            loans start in different months), 1-D arrays of the months
+            taken to repay, the unrounded total interest paid and the
+            broadcast terms, plus 2-D (loan, month) arrays of each of
+            SCHEDULE_FIELDS when record is True and a "totals" dict of 1-D
+            arrays of each of SCHEDULE_FIELDS when aggregate is True.
+    """
+    rate_paths = None
+    if np.ndim(interest_rates) == 2:
+        rate_paths = np.asarray(interest_rates, dtype=np.float64)
+        interest_rates = rate_paths[:, 0]
+
+    (
+        mortgages,
+        interest_rates,
+        terms,
+        monthly_overpayment,
+        lump_sum_payment,
+        lump_sum_payment_month,
+    ) = (
+        np.array(arr, dtype=np.float64).ravel()
+        for arr in np.broadcast_arrays(
+            mortgages,
+            interest_rates,
+            mortgage_length_months,
+            monthly_overpayment,
+            lump_sum_payment,
+            lump_sum_payment_month,
+        )
+    )
+    n_loans = mortgages.size
+    n_months = max(1, ceil(terms.max())) if n_loans else 0
+
+    standard_payments = monthly_capital_repayment(
+        mortgages, interest_rates, terms
+    )
+
+    if rate_paths is not None:
+        # (month, loan) so each month's rates are contiguous, with the last
+        # rate of a short path carried on to the end of the term
+        rate_paths = np.broadcast_to(
+            rate_paths, (n_loans, rate_paths.shape[1])
+        )[:, :n_months]
+        rate_paths = np.pad(
+            rate_paths, ((0, 0), (0, n_months - rate_paths.shape[1])), "edge"
+        ).T.copy()
+    start_months = dates.to_months(
+        datetime.now() if start_date is None else start_date
+    )
+    if start_months.ndim == 0:
+        # the day counts of every loan's months are the same slice
+        offsets = 0
+        start_months = start_months[()]
+        start = start_months.item()
+        days_in_month, days_in_year = day_count_array(
+            n_months, month=start.month, year=start.year, convention=day_count
+        )
+    else:
+        # each loan's months are looked up from its own start in the table
+        start_months = np.broadcast_to(start_months, (n_loans,))
+        offsets = dates.month_indices(start_months, n_months)
+        days_in_month, days_in_year = day_count_arrays(day_count)
+
+    projection = {"start_month": start_months, "terms": terms}
+
+    if (
+        rate_paths is None
+        and not record
+        and not aggregate
+        and np.ndim(offsets) == 0
+    ):
+        (
+            projection["months_to_repay"],
+            projection["total_interest_paid"],
+        ) = kernels.get_backend(backend)(
+            mortgages,
+            interest_rates,
+            terms,
+            standard_payments,
+            monthly_overpayment,
+            lump_sum_payment,
+            lump_sum_payment_month,
+            days_in_month,
+            days_in_year,
+        )
+    else:
+        projection.update(
+            _project_months(
+                mortgages,
+                interest_rates,
+                terms,
+                standard_payments,
+                monthly_overpayment,
+                lump_sum_payment,
+                lump_sum_payment_month,
+                days_in_month,
+                days_in_year,
+                offsets=offsets,
+                rate_paths=rate_paths,
+                record=record,
+                aggregate=aggregate,
+            )
+        )
+
+    instrumentation.count(
+        "batch.projection.months",
+        int(projection["months_to_repay"].max(initial=0)),
+    )
+    return projection
+
+
+def _project_months(
+    mortgages: np.ndarray,
+    interest_rates: np.ndarray,
+    terms: np.ndarray,
+    standard_payments: np.ndarray,
+    monthly_overpayment: np.ndarray,
+    lump_sum_payment: np.ndarray,
+    lump_sum_payment_month: np.ndarray,
+    days_in_month: np.ndarray,
+    days_in_year: np.ndarray,
+    offsets: Union[int, np.ndarray] = 0,
+    rate_paths: Optional[np.ndarray] = None,
+    record: bool = False,
+    aggregate: bool = False,
+) -> dict:
+    """Walk every loan forward together, one month per step. This is also
+    the "numpy" kernel backend.
+
+    Args:
+        mortgages (np.ndarray): outstanding mortgage values.
+        interest_rates (np.ndarray): interest rates as a percentage.
+        terms (np.ndarray): original number of months of each mortgage.
+        standard_payments (np.ndarray): monthly repayments, recalculated in
+            place whenever a loan's rate changes.
+        monthly_overpayment (np.ndarray): monthly overpayment amounts.
+        lump_sum_payment (np.ndarray): lump sum payment amounts.
+        lump_sum_payment_month (np.ndarray): month of each lump sum.
+        days_in_month (np.ndarray): days in each month of the table.
+        days_in_year (np.ndarray): days in the year of each month.
+        offsets (int | np.ndarray, optional): index of the first month of
+            each loan in the day count arrays. Default is 0.
+        rate_paths (np.ndarray, optional): 2-D (month, loan) interest rates.
+            Default is None which keeps the rates flat.
+        record (bool, optional): keep the per-month schedule. Default is
+            False.
+        aggregate (bool, optional): keep the per-month schedule summed over
+            every loan. Default is False.
+
+    Returns:
+        (dict): "months_to_repay" and "total_interest_paid", plus the
+            schedule and "totals" as described in `_project`.
+    """
+    n_loans = mortgages.size
+    n_months = max(1, ceil(terms.max())) if n_loans else 0
+    total_payments = standard_payments + monthly_overpayment
+    interest_rates_dec = interest_rates / 100
+
+    balances = mortgages.copy()
+    months_to_repay = np.zeros(n_loans, dtype=np.int64)
+    total_interest_paid = np.zeros(n_loans)
+    active = np.ones(n_loans, dtype=bool)
+
+    if record:
+        schedule = {
+            field: np.zeros((n_loans, n_months)) for field in SCHEDULE_FIELDS
+        }
+    if aggregate:
+        totals = {field: np.zeros(n_months) for field in SCHEDULE_FIELDS}
+
+    for month in range(1, n_months + 1):
+        months_to_repay[active] = month
+        opening_balances = balances
+
+        if rate_paths is not None and month > 1:
+            rates = rate_paths[month - 1]
+            resets = active & (rates != rate_paths[month - 2])
+            if resets.any():
+                standard_payments[resets] = monthly_capital_repayment(
+                    balances[resets],
+                    rates[resets],
+                    terms[resets] - (month - 1),
+                )
+                total_payments = standard_payments + monthly_overpayment
+                interest_rates_dec = rates / 100
+
+        # Apply lump sum payments due this month, a lump sum larger than the
+        # balance repays the mortgage without any interest being charged
+        lump_sums = np.where(
+            active & (lump_sum_payment_month == month), lump_sum_payment, 0.0
+        )
+        balances = balances - lump_sums
+        repaid_by_lump_sum = balances < 0
+        charged = active & ~repaid_by_lump_sum
+
+        interest = np.where(
+            charged,
+            _round(
+                (
+                    (balances * interest_rates_dec)
+                    / days_in_year[offsets + month - 1]
+                )
+                * days_in_month[offsets + month - 1]
+            ),
+            0.0,
+        )
+        total_interest_paid += interest
+
+        payments = np.where(
+            balances < total_payments, balances + interest, total_payments
+        )
+        closing_balances = np.where(
+            charged, balances + interest - payments, balances
+        )
+
+        if record or aggregate:
+            lump_sums = np.where(
+                repaid_by_lump_sum, opening_balances, lump_sums
+            )
+            payments = np.where(charged, payments, 0.0)
+            regular_payments = np.minimum(standard_payments, payments)
+            fields = {
+                "opening_balance": opening_balances,
+                "interest": interest,
+                "principal": regular_payments - interest,
+                "overpayment": lump_sums + payments - regular_payments,
+                "closing_balance": np.maximum(closing_balances, 0.0),
+            }
+            for field, values in fields.items():
+                if record:
+                    schedule[field][active, month - 1] = values[active]
+                if aggregate:
+                    totals[field][month - 1] = values[active].sum()
+
+        balances = np.where(active, closing_balances, opening_balances)
+        active &= charged & (balances > 0) & (month < terms)
+
+        if not active.any():
+            break
+
+    projection = {
+        "months_to_repay": months_to_repay,
+        "total_interest_paid": total_interest_paid,
+    }
+    if record:
+        projection.update(schedule)
+    if aggregate:
+        projection["totals"] = totals
+
+    return projection
+
+
+def capital_overpayment(
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+    monthly_overpayment: npt.ArrayLike = 0,
+    lump_sum_payment: npt.ArrayLike = 0,
+    lump_sum_payment_month: npt.ArrayLike = 1,
+    day_count: str = DEFAULT_CONVENTION,
+    backend: Optional[str] = None,
+    start_date: Optional[npt.ArrayLike] = None,
+) -> dict:
+    """Vectorised `calculator.capital_overpayment`.
+
+    Args:
+        mortgages (ArrayLike): outstanding mortgage values.
+        interest_rates (ArrayLike): interest rates as a percentage, or a 2-D
+            (loan, month) rate path from `rate_path`, recalculating the
+            repayment whenever the rate changes.
+        mortgage_length_months (ArrayLike): original number of months of
+            each mortgage.
+        monthly_overpayment (ArrayLike, optional): additional monthly
+            overpayment amounts. Default is 0.
+        lump_sum_payment (ArrayLike, optional): one-time lump sum payment
+            amounts. Default is 0.
+        lump_sum_payment_month (ArrayLike, optional): the month in which each
+            lump sum payment is made. Default is 1.
+        day_count (str, optional): day count convention of the daily
+            interest. Default is "actual/actual".
+        backend (str, optional): kernel backend of flat rate projections,
+            one of `kernels.available_backends`. Default is None which uses
+            Numba when it is installed and NumPy otherwise.
+        start_date (ArrayLike, optional): date of the first month of the
+            projection, or of each loan. Default is None which uses the
+            current month.
+
+    Returns:
+        (dict): A dictionary containing an array of each impact detail.
+    """
+    projection = _project(
+        mortgages,
+        interest_rates,
+        mortgage_length_months,
+        monthly_overpayment=monthly_overpayment,
+        lump_sum_payment=lump_sum_payment,
+        lump_sum_payment_month=lump_sum_payment_month,
+        day_count=day_count,
+        backend=backend,
+        start_date=start_date,
+    )
+
+    return {
+        "time to repay (months)": projection["months_to_repay"],
+        "time saved (months)": projection["terms"]
+        - projection["months_to_repay"],
+        "total interest paid (£)": _round(projection["total_interest_paid"]),
+    }
@@ -0,0 +1,478 @@
+"""Caching utilities for the mortgagepy package."""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import wraps
+from threading import Lock
+from typing import Callable, Hashable, NamedTuple, Optional, Union
+
+from . import daycount, instrumentation
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, mirroring `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Thread-safe least recently used cache with a size limit and an
+    optional time to live."""
+
+    def __init__(
+        self, maxsize: int = 1024, ttl: Optional[float] = None
+    ) -> None:
+        """Initialises the LRUCache class.
+
+        Args:
+            maxsize (int, optional): maximum number of entries to keep.
+                Default is 1024.
+            ttl (float, optional): seconds an entry stays valid for. Default
+                is None which keeps entries until they are evicted.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Number of entries in the cache."""
+        return len(self._data)
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        """Look up a key, marking it as recently used.
+
+        Args:
+            key (Hashable): key to look up.
+            default (object, optional): value returned on a miss. Default is
+                None.
+
+        Returns:
+            (object): the cached value or default.
+        """
+        with self._lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: object) -> None:
+        """Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key (Hashable): key to store the value under.
+            value (object): value to store.
+        """
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = value, expires
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Cache statistics.
+
+        Returns:
+            (CacheInfo): hits, misses, maxsize and current size.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+
+class SQLiteCache:
+    """Least recently used cache persisted to a local SQLite database, so a
+    warm cache survives restarts. Keys are stored as a SHA-256 digest of
+    their repr and values must be JSON serialisable."""
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        maxsize: int = 100_000,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Initialises the SQLiteCache class.
+
+        Args:
+            path (str | PathLike): path of the database file, created if it
+                does not exist.
+            maxsize (int, optional): maximum number of entries to keep.
+                Default is 100_000.
+            ttl (float, optional): seconds an entry stays valid for. Default
+                is None which keeps entries until they are evicted.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+
+        self.path = os.fspath(path)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        import sqlite3
+
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT, expires REAL, used REAL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_used ON results (used)"
+        )
+        (self._size,) = self._connection.execute(
+            "SELECT COUNT(*) FROM results"
+        ).fetchone()
+
+    @staticmethod
+    def _default(value: object) -> object:
+        """Convert NumPy scalars in results to their Python equivalents."""
+        item = getattr(value, "item", None)
+        if item is None:
+            raise TypeError(
+                f"Object of type {type(value).__name__} is not JSON "
+                "serializable"
+            )
+        return item()
+
+    @staticmethod
+    def _digest(key: Hashable) -> str:
+        import hashlib
+
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def __len__(self) -> int:
+        """Number of entries in the cache."""
+        return self._size
+
+    def get(self, key: Hashable, default: object = None) -> object:
+        """Look up a key, marking it as recently used.
+
+        Args:
+            key (Hashable): key to look up.
+            default (object, optional): value returned on a miss. Default is
+                None.
+
+        Returns:
+            (object): the cached value or default.
+        """
+        digest = self._digest(key)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires FROM results WHERE key = ?", (digest,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] < now):
+                self.misses += 1
+                return default
+            self._connection.execute(
+                "UPDATE results SET used = ? WHERE key = ?", (now, digest)
+            )
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: Hashable, value: object) -> None:
+        """Store a value, evicting the least recently used entries when full.
+
+        Args:
+            key (Hashable): key to store the value under.
+            value (object): JSON serialisable value to store, NumPy scalars
+                being stored as Python numbers.
+        """
+        digest = self._digest(key)
+        serialised = json.dumps(value, default=self._default)
+        now = time.time()
+        expires = None if self.ttl is None else now + self.ttl
+        with self._lock:
+            updated = self._connection.execute(
+                "UPDATE results SET value = ?, expires = ?, used = ? "
+                "WHERE key = ?",
+                (serialised, expires, now, digest),
+            ).rowcount
+            if updated:
+                return
+            self._connection.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?)",
+                (digest, serialised, expires, now),
+            )
+            self._size += 1
+            if self._size > self.maxsize:
+                self._connection.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM "
+                    "results ORDER BY used LIMIT ?)",
+                    (self._size - self.maxsize,),
+                )
+                self._size = self.maxsize
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Cache statistics.
+
+        Returns:
+            (CacheInfo): hits, misses, maxsize and current size.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+_shared_cache: Optional[LRUCache] = None
+_calculator_cache: Optional[Union[LRUCache, SQLiteCache]] = None
+
+
+def enable_shared_cache(maxsize: int = 1024) -> LRUCache:
+    """Share results of the mortgage methods between every mortgage object
+    of the process, so identical mortgages are only calculated once.
+
+    Args:
+        maxsize (int, optional): maximum number of results to keep.
+            Default is 1024.
+
+    Returns:
+        (LRUCache): the shared cache.
+    """
+    global _shared_cache
+    _shared_cache = LRUCache(maxsize=maxsize)
+    return _shared_cache
+
+
+def disable_shared_cache() -> None:
+    """Stop sharing results of the mortgage methods between objects."""
+    global _shared_cache
+    _shared_cache = None
+
+
+def shared_cache_info() -> Optional[CacheInfo]:
+    """Statistics of the shared cache.
+
+    Returns:
+        (CacheInfo, optional): hits, misses, maxsize and current size, or
+            None if the shared cache is disabled.
+    """
+    if _shared_cache is None:
+        return None
+    return _shared_cache.info()
+
+
+def memoised_method(
+    method: Callable[[object], object],
+) -> Callable[[object], object]:
+    """Memoise a method without arguments on the instance.
+
+    Results are stored in the instance's `_memo` dict, created on first use,
+    which the instance resets to None whenever its inputs change, so nothing
+    outlives the instance and no result goes stale. When the shared cache is
+    enabled, results are also looked up in and stored to it, keyed on the
+    instance's `_cache_key()`.
+
+    Args:
+        method (Callable): method to memoise.
+
+    Returns:
+        (Callable): memoised method.
+    """
+    name = method.__name__
+    metric = f"{method.__module__.rsplit('.', 1)[-1]}.{method.__qualname__}"
+    hits, misses = f"{metric}.hits", f"{metric}.misses"
+
+    @wraps(method)
+    def wrapper(self: object) -> object:
+        memo = self._memo
+        if memo is None:
+            memo = self._memo = {}
+        elif name in memo:
+            instrumentation.count(hits)
+            return memo[name]
+
+        shared_cache = _shared_cache
+        if shared_cache is not None:
+            key = (type(self).__qualname__, name, self._cache_key())
+            value = shared_cache.get(key, _MISSING)
+            if value is _MISSING:
+                instrumentation.count(misses)
+                value = method(self)
+                shared_cache.set(key, value)
+            else:
+                instrumentation.count(hits)
+        else:
+            instrumentation.count(misses)
+            value = method(self)
+
+        memo[name] = value
+        return value
+
+    return wrapper
+
+
+def enable_calculator_cache(
+    maxsize: int = 1024,
+    ttl: Optional[float] = None,
+    path: Optional[Union[str, os.PathLike]] = None,
+) -> Union[LRUCache, SQLiteCache]:
+    """Memoise the calculator functions on their (normalised) inputs, so
+    repeated quotes for the same products are only calculated once.
+
+    Args:
+        maxsize (int, optional): maximum number of results to keep.
+            Default is 1024.
+        ttl (float, optional): seconds a result stays valid for. Default is
+            None which keeps results until they are evicted.
+        path (str | PathLike, optional): SQLite database to persist results to.
+            Default is None which keeps results in memory.
+
+    Returns:
+        (LRUCache | SQLiteCache): the calculator cache.
+    """
+    global _calculator_cache
+    if path is None:
+        _calculator_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+    else:
+        _calculator_cache = SQLiteCache(path, maxsize=maxsize, ttl=ttl)
+    return _calculator_cache
+
+
+def disable_calculator_cache() -> None:
+    """Stop memoising the calculator functions."""
+    global _calculator_cache
+    if isinstance(_calculator_cache, SQLiteCache):
+        _calculator_cache.close()
+    _calculator_cache = None
+
+
+def clear_calculator_cache() -> None:
+    """Remove every result of the calculator cache, when enabled."""
+    if _calculator_cache is not None:
+        _calculator_cache.clear()
+
+
+# results depend on the day count tables of their convention
+daycount._register_derived_cache(clear_calculator_cache)
+
+
+def calculator_cache_info() -> Optional[CacheInfo]:
+    """Statistics of the calculator cache.
+
+    Returns:
+        (CacheInfo, optional): hits, misses, maxsize and current size, or
+            None if the calculator cache is disabled.
+    """
+    if _calculator_cache is None:
+        return None
+    return _calculator_cache.info()
+
+
+def _current_month() -> tuple:
+    """Year and month of today, for calculations anchored to the current
+    date."""
+    today = datetime.now()
+    return today.year, today.month
+
+
+def cached_calculation(
+    func: Optional[Callable] = None, *, dated: bool = False
+) -> Callable:
+    """Memoise a calculator function in the calculator cache, when enabled.
+
+    Arguments are normalised by binding them to the function's signature, so
+    positional and keyword calls share results. Types are part of the key
+    as `300` and `300.0` can give differently typed results. Calls with
+    unhashable arguments, such as NumPy arrays, are not cached.
+
+    Args:
+        func (Callable, optional): function to memoise.
+        dated (bool, optional): the result depends on the current month,
+            which is added to the key unless an explicit "start_date" is
+            passed. Default is False.
+
+    Returns:
+        (Callable): memoised function.
+    """
+    if func is None:
+        return lambda func: cached_calculation(func, dated=dated)
+
+    name = func.__qualname__
+    signature = None
+
+    @wraps(func)
+    def wrapper(*args: object, **kwargs: object) -> object:
+        calculator_cache = _calculator_cache
+        if calculator_cache is None:
+            return func(*args, **kwargs)
+
+        nonlocal signature
+        if signature is None:
+            import inspect
+
+            signature = inspect.signature(func)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (
+            name,
+            tuple(
+                (type(value).__name__, value)
+                for value in bound.arguments.values()
+            ),
+        )
+        if dated and bound.arguments.get("start_date") is None:
+            key += _current_month()
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        value = calculator_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = func(*args, **kwargs)
+            calculator_cache.set(key, value)
+
+        # callers are free to modify the dicts they are given
+        if isinstance(value, dict):
+            return dict(value)
+        return value
+
+    return wrapper
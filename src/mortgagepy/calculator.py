@@ -1,10 +1,15 @@
 """Mortgage calculations module for mortgagepy package."""
 
-from calendar import isleap, monthrange
-from datetime import datetime
-from typing import Optional
+from math import ceil
+from typing import Callable, Optional
 
+from .cache import cached_calculation
+from .daycount import DEFAULT_CONVENTION, DateLike, day_counts, start_month
+from .instrumentation import count, instrumented
 
+
+@instrumented
+@cached_calculation
 def monthly_capital_repayment(
     mortgage: float,
     interest_rate: float,
@@ -39,6 +44,8 @@ def monthly_capital_repayment(
     return monthly_mortgage_repayment
 
 
+@instrumented
+@cached_calculation
 def total_cost_of_mortgage(
     mortgage: float,
     interest_rate: float,
@@ -67,6 +74,7 @@ def total_cost_of_mortgage(
     return total_cost
 
 
+@instrumented
 def monthly_interest_only_repayment(
     mortgage: float, interest_rate: float
 ) -> float:
@@ -88,6 +96,7 @@ def monthly_interest_only_repayment(
     return monthly_interest_only_repayment
 
 
+@instrumented
 def ltv(property_value: float, deposit: float) -> int:
     """Loan to value percentage calculator.
 
@@ -104,11 +113,13 @@ def ltv(property_value: float, deposit: float) -> int:
     return int(loan_dec * 100)
 
 
+@instrumented
 def monthly_interest(
     balance_at_previous_month: float,
     interest_rate: float,
     month: Optional[int] = 1,
     year: Optional[int] = 2023,
+    day_count: str = DEFAULT_CONVENTION,
 ) -> float:
     """Monthly mortgage interest calculator to work out the exact interest in a
     single month, given the balance at the previous month and interest rate.
@@ -122,18 +133,16 @@ def monthly_interest(
             31 days in the month.
         year (int, optional): year to calculate interest, required to account
             for leap years. Default is 2023 which assumes a non-leap year.
+        day_count (str, optional): day count convention, one of
+            "actual/actual", "actual/365" and "30/360". Default is
+            "actual/actual".
 
     Returns:
         monthly_interest (float): absolute value of monthly interest.
     """
     interest_rate_dec = interest_rate / 100
 
-    _, days_in_month = monthrange(2023, month)
-
-    if isleap(year):
-        days = 366
-    else:
-        days = 365
+    (days_in_month,), (days,) = day_counts(1, month, year, day_count)
 
     monthly_interest = round(
         ((balance_at_previous_month * interest_rate_dec) / days)
@@ -144,6 +153,68 @@ def monthly_interest(
     return monthly_interest
 
 
+def _round_to_penny(value: float) -> float:
+    return round(value, 2)
+
+
+def _make_month_step(round_pennies: Callable) -> Callable:
+    """Build the month step of the overpayment projections around a rounding
+    function, so `kernels` can compile both with Numba and `exact` can round
+    Decimals."""
+
+    def month_step(
+        balance: float,
+        total_payment: float,
+        lump_sum: float,
+        interest_rate_dec: float,
+        days_in_year: float,
+        days_in_month: float,
+    ) -> tuple:
+        """One month of a capital repayment mortgage. Every projection of
+        a single mortgage walks the months with this step, so they all
+        follow the same rules.
+
+        A lump sum is paid first and, if it is larger than the balance,
+        repays the mortgage without any interest being charged. Otherwise
+        the month's daily interest is charged, rounded to the penny, and
+        the payment is capped at the balance plus interest.
+
+        Only uses constructs Numba can compile, and operators which work on
+        Decimals.
+
+        Args:
+            balance (float): balance at the start of the month.
+            total_payment (float): standard payment plus overpayment.
+            lump_sum (float): lump sum paid this month, 0 in other months.
+            interest_rate_dec (float): interest rate as a decimal.
+            days_in_year (float): days in the year of the month.
+            days_in_month (float): days in the month.
+
+        Returns:
+            (tuple): closing balance, negative if repaid by the lump sum,
+                the interest charged and the payment made.
+        """
+        balance = balance - lump_sum
+        if balance < 0:
+            return balance, 0 * balance, 0 * balance
+
+        interest = round_pennies(
+            ((balance * interest_rate_dec) / days_in_year) * days_in_month
+        )
+        payment = total_payment
+        if balance < payment:
+            payment = balance + interest
+
+        return balance + interest - payment, interest, payment
+
+    return month_step
+
+
+_month_step = _make_month_step(_round_to_penny)
+
+
+@instrumented
+@cached_calculation(dated=True)
 def capital_overpayment(
     mortgage: float,
     interest_rate: float,
@@ -151,6 +222,8 @@ def capital_overpayment(
     monthly_overpayment: float = 0,
     lump_sum_payment: float = 0,
     lump_sum_payment_month: int = 1,
+    day_count: str = DEFAULT_CONVENTION,
+    start_date: Optional[DateLike] = None,
 ) -> dict:
     """Calculate the impact of regular monthly overpayments and a lump sum
     payment on a mortgage.
@@ -164,6 +237,11 @@ def capital_overpayment(
         lump_sum_payment (float): one-time lump sum payment amount.
         lump_sum_payment_month (int): the month in which the lump sum payment
             is made (default is 1).
+        day_count (str): day count convention of the daily interest, one of
+            "actual/actual", "actual/365" and "30/360" (default is
+            "actual/actual").
+        start_date (DateLike): date of the first month of the projection
+            (default is None which uses the current month).
 
     Returns:
         dict: A dictionary containing the impact details.
@@ -176,43 +254,36 @@ def capital_overpayment(
     months_to_repay = 0
     total_interest_paid = 0
 
-    year = datetime.now().year
-    month = datetime.now().month
+    interest_rate_dec = interest_rate / 100
+    year, month = start_month(start_date)
+    days_in_month, days_in_year = day_counts(
+        max(1, ceil(mortgage_length_months)),
+        month=month,
+        year=year,
+        convention=day_count,
+    )
+
+    total_payment = standard_payment + monthly_overpayment
 
     while remaining_balance > 0:
         months_to_repay += 1
 
-        # Apply lump sum payment if it's the correct month
-        if months_to_repay == lump_sum_payment_month:
-            remaining_balance -= lump_sum_payment
-            lump_sum_payment = 0
-            if remaining_balance < 0:
-                break
-
-        interest = monthly_interest(
-            balance_at_previous_month=remaining_balance,
-            interest_rate=interest_rate,
-            month=month,
-            year=year,
+        remaining_balance, interest, _ = _month_step(
+            remaining_balance,
+            total_payment,
+            lump_sum_payment
+            if months_to_repay == lump_sum_payment_month
+            else 0,
+            interest_rate_dec,
+            days_in_year[months_to_repay - 1],
+            days_in_month[months_to_repay - 1],
         )
-
         total_interest_paid += interest
-        total_payment = standard_payment + monthly_overpayment
-
-        if remaining_balance < total_payment:
-            total_payment = remaining_balance + interest
-
-        remaining_balance = remaining_balance + interest - total_payment
 
         if months_to_repay >= mortgage_length_months:
             break
 
-        month += 1
-
-        if month == 12:
-            month = 1
-            year += 1
-
+    count("calculator.capital_overpayment.months", months_to_repay)
     time_saved = mortgage_length_months - months_to_repay
 
     return {
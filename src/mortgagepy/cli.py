@@ -0,0 +1,385 @@
+"""Command line interface for mortgagepy package.
+
+Records are read as JSON Lines or CSV from a file or stdin, calculated in
+chunks with the vectorised engine, optionally across a pool of processes,
+and written to stdout as JSON Lines in the order they were read.
+
+Examples:
+    $ mortgagepy summarise loans.csv
+    $ cat loans.jsonl | mortgagepy overpay --workers 4
+    $ mortgagepy overpay loans.csv --start-date 2024-01-01
+    $ mortgagepy compare loans.csv --rates 3.5 4 4.5
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+import numpy as np
+
+from . import batch
+from .exceptions import IncorrectType
+from .io import number_columns, reprice, validate_columns
+from .mortgage import _is_positive
+
+
+def _read_records(file: TextIO, input_format: str) -> Iterator[dict]:
+    """Records of a JSON Lines or CSV file, skipping blank lines and
+    rejecting JSON lines which are not objects."""
+    if input_format == "csv":
+        yield from csv.DictReader(file)
+        return
+    for line_number, line in enumerate(file, start=1):
+        if line.strip():
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise IncorrectType(
+                    f"Line {line_number} must be a JSON object, got "
+                    f"{type(record).__name__}."
+                )
+            yield record
+
+
+def _columns(records: list) -> dict:
+    """Column name to the values of the records, None where missing."""
+    names = dict.fromkeys(name for record in records for name in record)
+    return {name: [record.get(name) for record in records] for name in names}
+
+
+def _rows(results: dict) -> Iterator[dict]:
+    """Rows of a dict of result arrays, as Python scalars."""
+    return (
+        dict(zip(results, values))
+        for values in zip(*(values.tolist() for values in results.values()))
+    )
+
+
+def _summarise_chunk(first_row: int, records: list) -> list:
+    """Summaries of the mortgages of the records, the same as
+    `CapitalRepaymentMortgage.summarise` or `InterestOnlyMortgage.summarise`
+    for interest only records."""
+    loans = validate_columns(_columns(records), first_row=first_row)
+    results = reprice(loans)
+    columns = {
+        "property value (£)": loans["property_value"],
+        "mortgage (£)": loans["mortgage"],
+        "loan to value (%)": results["ltv"],
+        "monthly repayment (£)": results["monthly_repayment"],
+        "term (months)": loans["term_months"],
+        "interest rate (%)": loans["interest_rate"],
+        "interest paid (£)": results["interest_paid"],
+        "total cost (£)": results["total_cost"],
+    }
+
+    summaries = []
+    for interest_only, summary in zip(
+        loans["interest_only"].tolist(), _rows(columns)
+    ):
+        if interest_only:
+            del summary["interest paid (£)"]
+        summaries.append(summary)
+    return summaries
+
+
+def _overpay_chunk(
+    first_row: int, records: list, start_date: Optional[str] = None
+) -> list:
+    """Overpayment projections of the capital repayment mortgages of the
+    records, the same as `CapitalRepaymentMortgage.overpayment_projection`,
+    rejecting interest only records.
+    """
+    columns = _columns(records)
+    loans = validate_columns(
+        columns,
+        first_row=first_row,
+        names=("mortgage", "term_months", "interest_rate"),
+    )
+    interest_only_rows = (
+        np.flatnonzero(loans["interest_only"]) + first_row
+    ).tolist()
+    if interest_only_rows:
+        raise IncorrectType(
+            "Overpayments only apply to capital repayment mortgages, rows "
+            f"{interest_only_rows} are interest only.",
+            errors=interest_only_rows,
+        )
+    defaults = {
+        "monthly_overpayment": 0,
+        "lump_sum_payment": 0,
+        "lump_sum_payment_month": 1,
+    }
+    strategy = {
+        name: [
+            default if value in (None, "") else value
+            for value in columns.get(name, [None] * len(records))
+        ]
+        for name, default in defaults.items()
+    }
+    month = strategy.pop("lump_sum_payment_month")
+    strategy = number_columns(strategy, first_row=first_row, allow_zero=True)
+    strategy.update(
+        number_columns({"lump_sum_payment_month": month}, first_row=first_row)
+    )
+
+    projection = batch.capital_overpayment(
+        loans["mortgage"],
+        loans["interest_rate"],
+        loans["term_months"],
+        start_date=start_date,
+        **strategy,
+    )
+    interest_paid = batch._round(
+        batch.total_cost_of_mortgage(
+            loans["mortgage"], loans["interest_rate"], loans["term_months"]
+        )
+        - loans["mortgage"]
+    )
+    projection["interest saved (£)"] = batch._round(
+        interest_paid - projection["total interest paid (£)"]
+    )
+
+    return [
+        {**record, **result}
+        for record, result in zip(records, _rows(projection))
+    ]
+
+
+def _compare_chunk(first_row: int, records: list, rates: list) -> list:
+    """Monthly repayments of the mortgages of the records at every rate, the
+    same as `compare.compare_capital_repayment_rates` or
+    `compare.compare_interest_only_rates` for interest only records.
+    """
+    loans = validate_columns(
+        _columns(records),
+        first_row=first_row,
+        names=("mortgage", "term_months"),
+    )
+    mortgages = loans["mortgage"][:, np.newaxis]
+    repayments = np.where(
+        loans["interest_only"][:, np.newaxis],
+        batch.monthly_interest_only_repayment(mortgages, rates),
+        batch.monthly_capital_repayment(
+            mortgages, rates, loans["term_months"][:, np.newaxis]
+        ),
+    )
+    return [
+        {
+            **record,
+            "repayments": [
+                {"interest_rate": rate, "repayment": repayment}
+                for rate, repayment in zip(rates, row)
+            ],
+        }
+        for record, row in zip(records, repayments.tolist())
+    ]
+
+
+def _reprice_chunk(first_row: int, records: list) -> list:
+    """Repayment, total cost, interest paid and loan to value of the
+    mortgages of the records, as `io.reprice_tape`."""
+    results = reprice(validate_columns(_columns(records), first_row))
+    return [
+        {**record, **result} for record, result in zip(records, _rows(results))
+    ]
+
+
+def _run(
+    chunk_function: Callable,
+    records: Iterable[dict],
+    chunk_size: int,
+    workers: int,
+) -> Iterator[dict]:
+    """Calculate the records in chunks, in order, keeping at most two
+    chunks per worker in flight so memory stays flat on large inputs.
+
+    Args:
+        chunk_function (Callable): function of the first row number and the
+            records of a chunk, returning a result per record.
+        records (Iterable[dict]): records to calculate.
+        chunk_size (int): number of records per chunk.
+        workers (int): number of processes, 1 runs in the current process.
+
+    Yields:
+        (dict): result of each record.
+    """
+    records = iter(records)
+    chunks = zip(
+        range(1, sys.maxsize, chunk_size),
+        iter(lambda: list(islice(records, chunk_size)), []),
+    )
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from chunk_function(*chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = deque()
+        for chunk in chunks:
+            futures.append(executor.submit(chunk_function, *chunk))
+            if len(futures) >= workers * 2:
+                yield from futures.popleft().result()
+        while futures:
+            yield from futures.popleft().result()
+
+
+def _iso_date(value: str) -> str:
+    """Check a command line date is a valid ISO 8601 date."""
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid date {value!r}, expected YYYY-MM-DD."
+        ) from None
+    return value
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="mortgagepy",
+        description="Bulk mortgage calculations on JSON Lines or CSV records.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    inputs = argparse.ArgumentParser(add_help=False)
+    inputs.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="JSON Lines or CSV file, default is stdin.",
+    )
+    inputs.add_argument(
+        "--format",
+        choices=("jsonl", "csv"),
+        help="input format, default is csv for .csv files and jsonl "
+        "otherwise.",
+    )
+    inputs.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of processes, 0 uses every CPU. Default is 1.",
+    )
+    inputs.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10_000,
+        help="number of records calculated at once. Default is 10000.",
+    )
+
+    subparsers.add_parser(
+        "summarise",
+        parents=[inputs],
+        help="summarise each mortgage, records need property_value, "
+        "mortgage, term_months, interest_rate and optionally interest_only.",
+    )
+    overpay = subparsers.add_parser(
+        "overpay",
+        parents=[inputs],
+        help="project overpayments of capital repayment mortgages, records "
+        "need mortgage, term_months, interest_rate and optionally "
+        "monthly_overpayment, lump_sum_payment and lump_sum_payment_month.",
+    )
+    overpay.add_argument(
+        "--start-date",
+        type=_iso_date,
+        help="date of the first month of the projections, YYYY-MM-DD. "
+        "Default is today.",
+    )
+    compare = subparsers.add_parser(
+        "compare",
+        parents=[inputs],
+        help="compare repayments at several interest rates, records need "
+        "mortgage, term_months and optionally interest_only.",
+    )
+    compare.add_argument(
+        "--rates",
+        type=float,
+        nargs="+",
+        required=True,
+        help="interest rates to compare.",
+    )
+    subparsers.add_parser(
+        "reprice",
+        parents=[inputs],
+        help="reprice a loan tape, records need property_value, mortgage, "
+        "term_months, interest_rate and optionally interest_only.",
+    )
+    return parser
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Run the mortgagepy command line interface.
+
+    Args:
+        argv (list, optional): command line arguments. Default is None which
+            uses sys.argv.
+
+    Returns:
+        (int): exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive integer.")
+    if args.workers < 0:
+        parser.error("--workers must not be negative.")
+    if not all(map(_is_positive, getattr(args, "rates", None) or ())):
+        parser.error("--rates must be positive finite numbers.")
+
+    chunk_function = {
+        "summarise": _summarise_chunk,
+        "overpay": partial(
+            _overpay_chunk,
+            start_date=getattr(args, "start_date", None)
+            or date.today().isoformat(),
+        ),
+        "compare": partial(_compare_chunk, rates=getattr(args, "rates", None)),
+        "reprice": _reprice_chunk,
+    }[args.command]
+    input_format = args.format or (
+        "csv" if args.input.lower().endswith(".csv") else "jsonl"
+    )
+
+    if args.workers == 0:
+        args.workers = os.cpu_count() or 1
+
+    try:
+        file = sys.stdin if args.input == "-" else open(args.input, newline="")
+    except OSError as error:
+        print(f"mortgagepy: error: {error}", file=sys.stderr)
+        return 1
+    try:
+        for result in _run(
+            chunk_function,
+            _read_records(file, input_format),
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+        ):
+            sys.stdout.write(
+                json.dumps(result, ensure_ascii=False, allow_nan=False) + "\n"
+            )
+        sys.stdout.flush()
+    except (IncorrectType, ValueError) as error:
+        # ValueError covers invalid JSON input and NaN or infinite output,
+        # which is not valid JSON
+        print(f"mortgagepy: error: {error}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # the reader, such as head, closed the pipe early, so point stdout at
+        # devnull to stop Python failing again when it flushes on exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        if file is not sys.stdin:
+            file.close()
+    return 0
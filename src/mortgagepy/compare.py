@@ -1,11 +1,38 @@
 """Mortgage comparisons module for mortgagepy package."""
 
+import numpy as np
+import numpy.typing as npt
+
+from . import batch
 from .calculator import (
     monthly_capital_repayment,
     monthly_interest_only_repayment,
 )
 from .exceptions import IncorrectType
 
+RATE_SEQUENCE_TYPES = (list, tuple, range, np.ndarray)
+
+
+def _axis(name: str, values: npt.ArrayLike) -> np.ndarray:
+    """Validate a single axis of a sweep.
+
+    Args:
+        name (str): name of the axis for the error message.
+        values (ArrayLike): values of the axis.
+
+    Raises:
+        IncorrectType: If the values are not a 1-D sequence of numbers.
+
+    Returns:
+        (np.ndarray): values of the axis as a 1-D float64 array.
+    """
+    values = np.atleast_1d(np.asarray(values))
+    if values.ndim != 1 or values.dtype.kind not in "iuf":
+        raise IncorrectType(
+            f"Please ensure you pass a 1-D sequence of {name}."
+        )
+    return values.astype(np.float64)
+
 
 def compare_interest_only_rates(
     mortgage: float,
@@ -16,12 +43,13 @@ def compare_interest_only_rates(
 
     Args:
         mortgage (float): outstanding mortgage value.
-        interest_rates (list): interest rates to compare.
+        interest_rates (list | tuple | range | np.ndarray): interest rates to
+            compare.
 
     Returns:
         (list): all the interest rate and monthly repayment values.
     """
-    if not isinstance(interest_rates, list):
+    if not isinstance(interest_rates, RATE_SEQUENCE_TYPES):
         raise IncorrectType("Please ensure you pass a list of interest rates.")
 
     repayments = list()
@@ -50,14 +78,15 @@ def compare_capital_repayment_rates(
 
     Args:
         mortgage (float): outstanding mortgage value.
-        interest_rates (list): interest rates to compare.
+        interest_rates (list | tuple | range | np.ndarray): interest rates to
+            compare.
         mortgage_length_months (int): number of months remaining of
             the mortgage.
 
     Returns:
         (list): all the interest rate and monthly repayment values.
     """
-    if not isinstance(interest_rates, list):
+    if not isinstance(interest_rates, RATE_SEQUENCE_TYPES):
         raise IncorrectType("Please ensure you pass a list of interest rates.")
 
     repayments = list()
@@ -75,3 +104,66 @@ def compare_capital_repayment_rates(
         )
 
     return repayments
+
+
+def sweep_capital_repayment_rates(
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+) -> dict:
+    """Monthly repayments of a capital repayment mortgage over every
+    combination of interest rate, term and mortgage value, calculated in one
+    broadcast array operation.
+
+    Args:
+        mortgages (ArrayLike): mortgage values to compare.
+        interest_rates (ArrayLike): interest rates to compare.
+        mortgage_length_months (ArrayLike): terms in months to compare.
+
+    Returns:
+        (dict): the "interest_rate", "mortgage_length_months" and "mortgage"
+            axes and a "repayment" array of shape (interest rates, terms,
+            mortgages).
+    """
+    interest_rates = _axis("interest rates", interest_rates)
+    terms = _axis("mortgage lengths", mortgage_length_months)
+    mortgages = _axis("mortgages", mortgages)
+
+    return {
+        "interest_rate": interest_rates,
+        "mortgage_length_months": terms,
+        "mortgage": mortgages,
+        "repayment": batch.monthly_capital_repayment(
+            mortgages[np.newaxis, np.newaxis, :],
+            interest_rates[:, np.newaxis, np.newaxis],
+            terms[np.newaxis, :, np.newaxis],
+        ),
+    }
+
+
+def sweep_interest_only_rates(
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+) -> dict:
+    """Monthly repayments of an interest only mortgage over every
+    combination of interest rate and mortgage value, calculated in one
+    broadcast array operation.
+
+    Args:
+        mortgages (ArrayLike): mortgage values to compare.
+        interest_rates (ArrayLike): interest rates to compare.
+
+    Returns:
+        (dict): the "interest_rate" and "mortgage" axes and a "repayment"
+            array of shape (interest rates, mortgages).
+    """
+    interest_rates = _axis("interest rates", interest_rates)
+    mortgages = _axis("mortgages", mortgages)
+
+    return {
+        "interest_rate": interest_rates,
+        "mortgage": mortgages,
+        "repayment": batch.monthly_interest_only_repayment(
+            mortgages[np.newaxis, :], interest_rates[:, np.newaxis]
+        ),
+    }
@@ -0,0 +1,165 @@
+"""Vectorised date arithmetic module for mortgagepy package.
+
+Dates are handled as `numpy.datetime64` arrays, months as datetime64[M], so
+the remaining terms and payment dates of millions of loans are a handful of
+integer array operations rather than a `relativedelta` per loan.
+"""
+
+from datetime import date, datetime
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .daycount import FIRST_YEAR, LAST_YEAR
+
+_FIRST_MONTH = np.datetime64(f"{FIRST_YEAR}-01", "M")
+_N_MONTHS = (LAST_YEAR - FIRST_YEAR) * 12
+
+
+def to_days(dates: npt.ArrayLike) -> np.ndarray:
+    """Convert dates to days.
+
+    Args:
+        dates (ArrayLike): a date, datetime, datetime64 or ISO 8601 string,
+            or an array of them.
+
+    Returns:
+        (np.ndarray): each date as datetime64[D].
+    """
+    if isinstance(dates, datetime):
+        dates = dates.date()
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+def to_months(dates: npt.ArrayLike) -> np.ndarray:
+    """Convert dates to months.
+
+    Args:
+        dates (ArrayLike): a date, datetime, datetime64 or ISO 8601 string,
+            or an array of them.
+
+    Returns:
+        (np.ndarray): the month of each date as datetime64[M].
+    """
+    return to_days(dates).astype("datetime64[M]")
+
+
+def month_indices(dates: npt.ArrayLike, n_months: int = 1) -> np.ndarray:
+    """Position of the month of each date in the day count tables of
+    `daycount`.
+
+    Args:
+        dates (ArrayLike): dates, see `to_months`.
+        n_months (int, optional): number of months from each date which must
+            be in the tables. Default is 1.
+
+    Raises:
+        ValueError: If any of the months are outside of the tables.
+
+    Returns:
+        (np.ndarray): int64 index of each month.
+    """
+    indices = (to_months(dates) - _FIRST_MONTH).astype(np.int64)
+    if indices.size and (
+        indices.min() < 0 or indices.max() + n_months > _N_MONTHS
+    ):
+        raise ValueError(
+            f"Day counts are only tabulated from {FIRST_YEAR} up to "
+            f"{LAST_YEAR}."
+        )
+    return indices
+
+
+def add_months(dates: npt.ArrayLike, months: npt.ArrayLike) -> np.ndarray:
+    """Move dates by whole calendar months, like adding a `relativedelta`,
+    days past the end of a shorter month moving to its last day.
+
+    Args:
+        dates (ArrayLike): dates, see `to_days`.
+        months (ArrayLike): number of months to add to each date.
+
+    Returns:
+        (np.ndarray): datetime64[D] dates.
+    """
+    days = to_days(dates)
+    first_days = days.astype("datetime64[M]")
+    moved = first_days + np.asarray(months).astype(np.int64)
+    return np.minimum(
+        moved.astype("datetime64[D]") + (days - first_days),
+        (moved + 1).astype("datetime64[D]") - 1,
+    )
+
+
+def months_between(
+    start_dates: npt.ArrayLike, end_dates: npt.ArrayLike
+) -> np.ndarray:
+    """Whole months from each start date to each end date, the years * 12 +
+    months of a `relativedelta`.
+
+    Args:
+        start_dates (ArrayLike): start dates, see `to_days`.
+        end_dates (ArrayLike): end dates, see `to_days`.
+
+    Returns:
+        (np.ndarray): int64 number of months, negative where the end date is
+            before the start date.
+    """
+    start_days = to_days(start_dates)
+    end_days = to_days(end_dates)
+    months = (to_months(end_days) - to_months(start_days)).astype(np.int64)
+
+    # a month is only complete once the start date moved by it is reached
+    moved = add_months(start_days, months)
+    months -= (months > 0) & (moved > end_days)
+    months += (months < 0) & (moved < end_days)
+    return months
+
+
+def term_remaining(
+    start_dates: npt.ArrayLike,
+    term_months: npt.ArrayLike,
+    as_of: Optional[npt.ArrayLike] = None,
+) -> np.ndarray:
+    """Months remaining of the term of each mortgage, the vectorised
+    counterpart of `utils.mortgage_term_remaining`.
+
+    Args:
+        start_dates (ArrayLike): start date of each mortgage.
+        term_months (ArrayLike): original term of each mortgage in months.
+        as_of (ArrayLike, optional): date to count from. Default is None
+            which uses today.
+
+    Returns:
+        (np.ndarray): int64 months remaining, 0 once the term has ended.
+    """
+    if as_of is None:
+        as_of = date.today()
+    elapsed = months_between(start_dates, as_of)
+    return np.clip(
+        np.asarray(term_months).astype(np.int64) - np.maximum(elapsed, 0),
+        0,
+        None,
+    )
+
+
+def payment_dates(
+    start_dates: npt.ArrayLike, n_months: int, day: int = 1
+) -> np.ndarray:
+    """Payment date of every month of each mortgage.
+
+    Args:
+        start_dates (ArrayLike): date of the first month of each mortgage, a
+            single date gives 1-D dates.
+        n_months (int): number of months.
+        day (int, optional): day of the month payments are due, moved to the
+            last day of shorter months. Default is 1.
+
+    Returns:
+        (np.ndarray): datetime64[D] payment dates, 2-D (mortgage, month) for
+            many mortgages.
+    """
+    months = to_months(start_dates)[..., np.newaxis] + np.arange(n_months)
+    first_days = months.astype("datetime64[D]")
+    month_ends = (months + 1).astype("datetime64[D]") - 1
+    return np.minimum(first_days + (day - 1), month_ends)
@@ -0,0 +1,272 @@
+"""Day count conventions module for mortgagepy package.
+
+Interest is charged daily, as the balance times the annual rate divided by
+the days in the year, times the days in the month. The day counts of every
+month from FIRST_YEAR up to LAST_YEAR are tabulated once per convention, so
+charging a month's interest is a lookup rather than a calendar calculation.
+The scalar calculator slices the table as tuples and the vectorised engine
+indexes it as NumPy arrays, so both always agree.
+"""
+
+from calendar import isleap, monthrange
+from datetime import date, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2300
+DEFAULT_CONVENTION = "actual/actual"
+
+# a single date of any form accepted by `dates.to_months`
+DateLike = Union[date, str, "np.datetime64"]
+
+
+def _actual_actual(year: int, month: int) -> tuple:
+    return monthrange(year, month)[1], 366 if isleap(year) else 365
+
+
+def _actual_365(year: int, month: int) -> tuple:
+    return monthrange(year, month)[1], 365
+
+
+def _thirty_360(year: int, month: int) -> tuple:
+    return 30, 360
+
+
+CONVENTIONS = {
+    "actual/actual": _actual_actual,
+    "actual/365": _actual_365,
+    "30/360": _thirty_360,
+}
+
+
+class DayCountTable(NamedTuple):
+    """Days in each month and days in the year of each month, indexed by
+    `month_index`."""
+
+    days_in_month: tuple
+    days_in_year: tuple
+
+
+def register_convention(
+    name: str, function: Callable[[int, int], tuple]
+) -> None:
+    """Add (or replace) a day count convention.
+
+    Args:
+        name (str): name of the convention.
+        function (Callable): function of the year and month (1-12) giving
+            the days in the month and the days in the year.
+    """
+    CONVENTIONS[name] = function
+    _clear_tables()
+
+
+def unregister_convention(name: str) -> None:
+    """Remove a day count convention and the tables built for it.
+
+    Args:
+        name (str): name of the convention.
+
+    Raises:
+        KeyError: If the convention is not registered.
+    """
+    del CONVENTIONS[name]
+    _clear_tables()
+
+
+# functions clearing results calculated from the tables, such as the
+# calculator cache, called whenever a convention changes
+_derived_caches = []
+
+
+def _register_derived_cache(cache_clear: Callable[[], None]) -> None:
+    """Clear a cache of results calculated from the tables whenever a
+    convention is registered or unregistered."""
+    _derived_caches.append(cache_clear)
+
+
+def _clear_tables() -> None:
+    for cached in (day_count_table, day_count_arrays, day_counts):
+        cached.cache_clear()
+    for cache_clear in _derived_caches:
+        cache_clear()
+
+
+def start_month(start_date: Optional[DateLike] = None) -> tuple:
+    """Year and month of the first month of a projection.
+
+    Dates and datetimes are read directly, other dates such as datetime64
+    values and ISO 8601 strings are converted with `dates.to_months`.
+
+    Args:
+        start_date (DateLike, optional): date of the first month. Default is
+            None which uses the current month.
+
+    Raises:
+        ValueError: If start_date is not a single valid date.
+
+    Returns:
+        (tuple): year and month of the year.
+    """
+    if start_date is None:
+        start_date = datetime.now()
+    if isinstance(start_date, date):
+        return start_date.year, start_date.month
+
+    from .dates import to_months
+
+    month = to_months(start_date)
+    if month.ndim or month.item() is None:
+        raise ValueError(f"start_date must be a single date, got {month}.")
+    month = month.item()
+    return month.year, month.month
+
+
+def month_index(year: int, month: int) -> int:
+    """Position of a month in the day count table.
+
+    Args:
+        year (int): year, between FIRST_YEAR and LAST_YEAR.
+        month (int): month of the year, 1-12.
+
+    Raises:
+        ValueError: If the month is not 1-12, rather than rolling it into
+            the next or previous year.
+
+    Returns:
+        (int): index of the month in the table.
+    """
+    if not 1 <= month <= 12:
+        raise ValueError(f"bad month number {month}; must be 1-12")
+    return (year - FIRST_YEAR) * 12 + month - 1
+
+
+@lru_cache(maxsize=None)
+def day_count_table(convention: str = DEFAULT_CONVENTION) -> DayCountTable:
+    """Day counts of every month from FIRST_YEAR up to LAST_YEAR, built on
+    first use.
+
+    Args:
+        convention (str, optional): name of the day count convention, one of
+            CONVENTIONS. Default is "actual/actual".
+
+    Raises:
+        ValueError: If the convention is unknown.
+
+    Returns:
+        (DayCountTable): days in each month and in the year of each month.
+    """
+    try:
+        day_counts = CONVENTIONS[convention]
+    except KeyError:
+        raise ValueError(
+            f"Unknown day count convention {convention!r}, expected one of "
+            f"{sorted(CONVENTIONS)}."
+        ) from None
+
+    days_in_month, days_in_year = zip(
+        *(
+            day_counts(year, month)
+            for year in range(FIRST_YEAR, LAST_YEAR)
+            for month in range(1, 13)
+        )
+    )
+    return DayCountTable(days_in_month, days_in_year)
+
+
+@lru_cache(maxsize=None)
+def day_count_arrays(convention: str = DEFAULT_CONVENTION) -> tuple:
+    """The day count table as read-only float64 arrays, for indexing by
+    arrays of month indices.
+
+    Args:
+        convention (str, optional): name of the day count convention.
+            Default is "actual/actual".
+
+    Returns:
+        (tuple): days in each month and days in the year of each month.
+    """
+    import numpy as np
+
+    arrays = tuple(
+        np.array(column, dtype=np.float64)
+        for column in day_count_table(convention)
+    )
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+def _check_range(start: int, n_months: int) -> None:
+    if start < 0 or start + n_months > (LAST_YEAR - FIRST_YEAR) * 12:
+        raise ValueError(
+            f"Day counts are only tabulated from {FIRST_YEAR} up to "
+            f"{LAST_YEAR}."
+        )
+
+
+@lru_cache(maxsize=256)
+def day_counts(
+    n_months: int,
+    month: int,
+    year: int,
+    convention: str = DEFAULT_CONVENTION,
+) -> tuple:
+    """Day counts of consecutive months of a projection.
+
+    Args:
+        n_months (int): number of months.
+        month (int): month of the year of the first month.
+        year (int): year of the first month.
+        convention (str, optional): name of the day count convention.
+            Default is "actual/actual".
+
+    Raises:
+        ValueError: If the months are outside of the table.
+
+    Returns:
+        (tuple): days in each month and days in the year of each month.
+    """
+    start = month_index(year, month)
+    _check_range(start, n_months)
+    table = day_count_table(convention)
+    return (
+        table.days_in_month[start : start + n_months],
+        table.days_in_year[start : start + n_months],
+    )
+
+
+def day_count_array(
+    n_months: int,
+    month: int,
+    year: int,
+    convention: str = DEFAULT_CONVENTION,
+) -> tuple:
+    """Day counts of consecutive months of a projection as arrays, which
+    are read-only views of the table.
+
+    Args:
+        n_months (int): number of months.
+        month (int): month of the year of the first month.
+        year (int): year of the first month.
+        convention (str, optional): name of the day count convention.
+            Default is "actual/actual".
+
+    Raises:
+        ValueError: If the months are outside of the table.
+
+    Returns:
+        (tuple): days in each month and days in the year of each month as
+            float64 arrays.
+    """
+    start = month_index(year, month)
+    _check_range(start, n_months)
+    days_in_month, days_in_year = day_count_arrays(convention)
+    return (
+        days_in_month[start : start + n_months],
+        days_in_year[start : start + n_months],
+    )
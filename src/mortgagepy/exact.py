@@ -0,0 +1,306 @@
+"""Exact decimal arithmetic module for mortgagepy package.
+
+Every function in this module mirrors a scalar function in
+`mortgagepy.calculator` but calculates with `decimal.Decimal` rather than
+floats, so the penny rounding of each step is exact and can be reconciled
+against a ledger. The float calculator stays the fast default, this module
+is for audits.
+
+Arguments may be ints, strings, Decimals or floats, floats being taken as
+their shortest repr so 3.89 is exactly 3.89. Results are Decimals quantized
+to the penny with the chosen rounding, half to even by default like the
+builtin `round`.
+
+Contexts and the growth factors (1 + r)^n of the repayment formula are
+cached, so a book of loans sharing a handful of products only calculates
+them once. Overpayment projections walk the months with the calculator's
+month step, run under the Decimal context, so both follow the same rules.
+"""
+
+from decimal import ROUND_HALF_EVEN, Context, Decimal, localcontext
+from functools import lru_cache
+from math import ceil
+from numbers import Integral
+from typing import Optional, Union
+
+from .calculator import _make_month_step
+from .daycount import DEFAULT_CONVENTION, DateLike, day_counts, start_month
+
+Number = Union[int, float, str, Decimal]
+
+PENNY = Decimal("0.01")
+DEFAULT_ROUNDING = ROUND_HALF_EVEN
+DEFAULT_PRECISION = 28
+
+
+@lru_cache(maxsize=None)
+def get_context(
+    rounding: str = DEFAULT_ROUNDING, precision: int = DEFAULT_PRECISION
+) -> Context:
+    """Decimal context of the calculations, one per rounding and precision.
+
+    Args:
+        rounding (str, optional): rounding of the pennies, one of the
+            `decimal` rounding modes. Default is ROUND_HALF_EVEN.
+        precision (int, optional): significant digits of the intermediate
+            results. Default is 28.
+
+    Returns:
+        (Context): the context.
+    """
+    return Context(prec=precision, rounding=rounding)
+
+
+def to_decimal(value: Number) -> Decimal:
+    """Convert a number to a Decimal, floats by their shortest repr.
+
+    NumPy scalars are converted like the Python numbers they hold.
+
+    Args:
+        value (int | float | str | Decimal): number to convert.
+
+    Returns:
+        (Decimal): the number as a Decimal.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, float):
+        return Decimal(repr(float(value)))
+    if isinstance(value, Integral):
+        return Decimal(int(value))
+    return Decimal(value)
+
+
+@lru_cache(maxsize=4096)
+def _growth(
+    monthly_rate: Decimal, n_months: Decimal, context: Context
+) -> Decimal:
+    """(1 + r)^n of the repayment formula, n being the term as given like
+    the float calculator, so fractional terms are not truncated."""
+    return context.power(context.add(1, monthly_rate), n_months)
+
+
+def _quantize_penny(value: Decimal) -> Decimal:
+    return value.quantize(PENNY)
+
+
+# the calculator's month step, run under the chosen context
+_month_step = _make_month_step(_quantize_penny)
+
+
+def monthly_capital_repayment(
+    mortgage: Number,
+    interest_rate: Number,
+    mortgage_length_months: int,
+    rounding: str = DEFAULT_ROUNDING,
+    precision: int = DEFAULT_PRECISION,
+) -> Decimal:
+    """Exact `calculator.monthly_capital_repayment`.
+
+    Args:
+        mortgage (Number): outstanding mortgage value.
+        interest_rate (Number): current interest rate as a percentage.
+        mortgage_length_months (int): number of months remaining of the
+            mortgage.
+        rounding (str, optional): rounding of the pennies. Default is
+            ROUND_HALF_EVEN.
+        precision (int, optional): significant digits of the intermediate
+            results. Default is 28.
+
+    Returns:
+        (Decimal): monthly mortgage repayment.
+    """
+    context = get_context(rounding, precision)
+    r = context.divide(to_decimal(interest_rate), 1200)
+    rate = _growth(r, to_decimal(mortgage_length_months), context)
+
+    repayment = context.multiply(
+        to_decimal(mortgage),
+        context.divide(context.multiply(r, rate), context.subtract(rate, 1)),
+    )
+    return repayment.quantize(PENNY, context=context)
+
+
+def total_cost_of_mortgage(
+    mortgage: Number,
+    interest_rate: Number,
+    mortgage_length_months: int,
+    rounding: str = DEFAULT_ROUNDING,
+    precision: int = DEFAULT_PRECISION,
+) -> Decimal:
+    """Exact `calculator.total_cost_of_mortgage`.
+
+    Args:
+        mortgage (Number): outstanding mortgage value.
+        interest_rate (Number): current interest rate as a percentage.
+        mortgage_length_months (int): number of months remaining of the
+            mortgage.
+        rounding (str, optional): rounding of the pennies. Default is
+            ROUND_HALF_EVEN.
+        precision (int, optional): significant digits of the intermediate
+            results. Default is 28.
+
+    Returns:
+        (Decimal): total cost of the mortgage.
+    """
+    context = get_context(rounding, precision)
+    monthly_repayment = monthly_capital_repayment(
+        mortgage, interest_rate, mortgage_length_months, rounding, precision
+    )
+
+    return context.multiply(
+        monthly_repayment, to_decimal(mortgage_length_months)
+    ).quantize(PENNY, context=context)
+
+
+def monthly_interest_only_repayment(
+    mortgage: Number,
+    interest_rate: Number,
+    rounding: str = DEFAULT_ROUNDING,
+    precision: int = DEFAULT_PRECISION,
+) -> Decimal:
+    """Exact `calculator.monthly_interest_only_repayment`.
+
+    Args:
+        mortgage (Number): outstanding mortgage value.
+        interest_rate (Number): current interest rate as a percentage.
+        rounding (str, optional): rounding of the pennies. Default is
+            ROUND_HALF_EVEN.
+        precision (int, optional): significant digits of the intermediate
+            results. Default is 28.
+
+    Returns:
+        (Decimal): monthly cost of the mortgage.
+    """
+    context = get_context(rounding, precision)
+
+    return context.divide(
+        context.multiply(to_decimal(mortgage), to_decimal(interest_rate)),
+        1200,
+    ).quantize(PENNY, context=context)
+
+
+def monthly_interest(
+    balance_at_previous_month: Number,
+    interest_rate: Number,
+    month: int = 1,
+    year: int = 2023,
+    day_count: str = DEFAULT_CONVENTION,
+    rounding: str = DEFAULT_ROUNDING,
+    precision: int = DEFAULT_PRECISION,
+) -> Decimal:
+    """Exact `calculator.monthly_interest`.
+
+    Args:
+        balance_at_previous_month (Number): balance at the previous month.
+        interest_rate (Number): current interest rate as a percentage.
+        month (int, optional): month to calculate interest for. Default is 1.
+        year (int, optional): year to calculate interest for. Default is
+            2023.
+        day_count (str, optional): day count convention. Default is
+            "actual/actual".
+        rounding (str, optional): rounding of the pennies. Default is
+            ROUND_HALF_EVEN.
+        precision (int, optional): significant digits of the intermediate
+            results. Default is 28.
+
+    Returns:
+        (Decimal): monthly interest.
+    """
+    context = get_context(rounding, precision)
+    (days_in_month,), (days,) = day_counts(1, month, year, day_count)
+
+    with localcontext(context):
+        interest_rate_dec = to_decimal(interest_rate) / 100
+        return _quantize_penny(
+            (
+                (to_decimal(balance_at_previous_month) * interest_rate_dec)
+                / days
+            )
+            * days_in_month
+        )
+
+
+def capital_overpayment(
+    mortgage: Number,
+    interest_rate: Number,
+    mortgage_length_months: int,
+    monthly_overpayment: Number = 0,
+    lump_sum_payment: Number = 0,
+    lump_sum_payment_month: int = 1,
+    day_count: str = DEFAULT_CONVENTION,
+    rounding: str = DEFAULT_ROUNDING,
+    precision: int = DEFAULT_PRECISION,
+    start_date: Optional[DateLike] = None,
+) -> dict:
+    """Exact `calculator.capital_overpayment`, accumulating the interest
+    paid in pennies.
+
+    Args:
+        mortgage (Number): outstanding mortgage value.
+        interest_rate (Number): current interest rate as a percentage.
+        mortgage_length_months (int): original number of months of the
+            mortgage.
+        monthly_overpayment (Number, optional): additional monthly
+            overpayment amount. Default is 0.
+        lump_sum_payment (Number, optional): one-time lump sum payment
+            amount. Default is 0.
+        lump_sum_payment_month (int, optional): the month in which the lump
+            sum payment is made. Default is 1.
+        day_count (str, optional): day count convention of the daily
+            interest. Default is "actual/actual".
+        rounding (str, optional): rounding of the pennies. Default is
+            ROUND_HALF_EVEN.
+        precision (int, optional): significant digits of the intermediate
+            results. Default is 28.
+        start_date (DateLike, optional): date of the first month of the
+            projection. Default is None which uses the current month.
+
+    Returns:
+        (dict): the same impact details as `calculator.capital_overpayment`,
+            the interest paid as a Decimal.
+    """
+    context = get_context(rounding, precision)
+    interest_rate = to_decimal(interest_rate)
+    standard_payment = monthly_capital_repayment(
+        mortgage, interest_rate, mortgage_length_months, rounding, precision
+    )
+    total_payment = context.add(
+        standard_payment, to_decimal(monthly_overpayment)
+    )
+
+    year, month = start_month(start_date)
+    days_in_month, days_in_year = day_counts(
+        max(1, ceil(mortgage_length_months)), month, year, day_count
+    )
+
+    remaining_balance = to_decimal(mortgage)
+    lump_sum_payment = to_decimal(lump_sum_payment)
+    months_to_repay = 0
+    total_interest_paid = Decimal(0)
+
+    with localcontext(context):
+        interest_rate_dec = interest_rate / 100
+        while remaining_balance > 0:
+            months_to_repay += 1
+
+            remaining_balance, interest, _ = _month_step(
+                remaining_balance,
+                total_payment,
+                lump_sum_payment
+                if months_to_repay == lump_sum_payment_month
+                else 0,
+                interest_rate_dec,
+                days_in_year[months_to_repay - 1],
+                days_in_month[months_to_repay - 1],
+            )
+            total_interest_paid += interest
+
+            if months_to_repay >= mortgage_length_months:
+                break
+
+    return {
+        "time to repay (months)": months_to_repay,
+        "time saved (months)": mortgage_length_months - months_to_repay,
+        "total interest paid (£)": total_interest_paid,
+    }
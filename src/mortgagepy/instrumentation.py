@@ -0,0 +1,247 @@
+"""Instrumentation hooks for the mortgagepy package.
+
+Instrumentation is off by default and costs a single check per call while
+disabled. Once enabled with `enable_instrumentation` the registry keeps:
+
+- a call counter and a timing histogram per calculator function, named
+  after the function, e.g. "calculator.monthly_capital_repayment".
+- hit and miss counters per memoised mortgage method, e.g.
+  "mortgage.CapitalRepaymentMortgage.monthly_repayment.hits".
+- month counters per projection loop, e.g.
+  "calculator.capital_overpayment.months".
+
+Every event is also passed to the registered callbacks, which can forward
+them to Prometheus, OpenTelemetry or a log.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Optional
+
+# upper bounds of the timing histogram buckets in seconds
+DEFAULT_BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    1e-1,
+    1.0,
+)
+
+
+class Histogram:
+    """Histogram of timings, with a count per bucket and an overflow bucket
+    for timings above the last bound."""
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+        """Initialises the Histogram class.
+
+        Args:
+            buckets (tuple, optional): increasing upper bounds of the buckets
+                in seconds. Default is DEFAULT_BUCKETS.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a timing.
+
+        Args:
+            value (float): timing in seconds.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> dict:
+        """Current state of the histogram.
+
+        Returns:
+            (dict): "count", "total" and "buckets", a list of (upper bound,
+                count) pairs ending with an infinite bound.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "buckets": list(zip(self.buckets + (float("inf"),), self.counts)),
+        }
+
+
+class Instrumentation:
+    """Registry of counters and timing histograms, with callbacks receiving
+    every event."""
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+        """Initialises the Instrumentation class.
+
+        Args:
+            buckets (tuple, optional): upper bounds of the timing histogram
+                buckets in seconds. Default is DEFAULT_BUCKETS.
+        """
+        self.buckets = tuple(buckets)
+        self.counters = defaultdict(int)
+        self.timings = {}
+        self._callbacks = []
+        self._lock = Lock()
+
+    def add_callback(
+        self, callback: Callable[[str, str, float], None]
+    ) -> None:
+        """Pass every event to a callback.
+
+        Args:
+            callback (Callable): called with the kind of event ("counter" or
+                "timing"), the metric name and the value.
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(
+        self, callback: Callable[[str, str, float], None]
+    ) -> None:
+        """Stop passing events to a callback.
+
+        Args:
+            callback (Callable): a callback added with `add_callback`.
+        """
+        self._callbacks.remove(callback)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increase a counter.
+
+        Args:
+            name (str): name of the counter.
+            value (int, optional): amount to increase it by. Default is 1.
+        """
+        with self._lock:
+            self.counters[name] += value
+        for callback in self._callbacks:
+            callback("counter", name, value)
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Add a timing to a histogram.
+
+        Args:
+            name (str): name of the histogram.
+            seconds (float): timing in seconds.
+        """
+        with self._lock:
+            histogram = self.timings.get(name)
+            if histogram is None:
+                histogram = self.timings[name] = Histogram(self.buckets)
+            histogram.observe(seconds)
+        for callback in self._callbacks:
+            callback("timing", name, seconds)
+
+    def snapshot(self) -> dict:
+        """Current state of every metric.
+
+        Returns:
+            (dict): "counters", a dict of counter values, and "timings", a
+                dict of histogram snapshots.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "timings": {
+                    name: histogram.snapshot()
+                    for name, histogram in self.timings.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Reset every metric, keeping the callbacks."""
+        with self._lock:
+            self.counters.clear()
+            self.timings.clear()
+
+
+_registry: Optional[Instrumentation] = None
+
+
+def enable_instrumentation(
+    buckets: tuple = DEFAULT_BUCKETS,
+) -> Instrumentation:
+    """Start recording metrics in a new registry.
+
+    Args:
+        buckets (tuple, optional): upper bounds of the timing histogram
+            buckets in seconds. Default is DEFAULT_BUCKETS.
+
+    Returns:
+        (Instrumentation): the registry.
+    """
+    global _registry
+    _registry = Instrumentation(buckets=buckets)
+    return _registry
+
+
+def disable_instrumentation() -> None:
+    """Stop recording metrics."""
+    global _registry
+    _registry = None
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """The registry recording metrics.
+
+    Returns:
+        (Instrumentation, optional): the registry, or None if
+            instrumentation is disabled.
+    """
+    return _registry
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increase a counter when instrumentation is enabled.
+
+    Args:
+        name (str): name of the counter.
+        value (int, optional): amount to increase it by. Default is 1.
+    """
+    registry = _registry
+    if registry is not None:
+        registry.count(name, value)
+
+
+def instrumented(func: Callable) -> Callable:
+    """Count the calls of a function and time them when instrumentation is
+    enabled.
+
+    Metrics are named after the function's module and name, e.g.
+    "calculator.monthly_interest" with a "calls" counter.
+
+    Args:
+        func (Callable): function to instrument.
+
+    Returns:
+        (Callable): instrumented function.
+    """
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+    calls = f"{name}.calls"
+
+    @wraps(func)
+    def wrapper(*args: object, **kwargs: object) -> object:
+        registry = _registry
+        if registry is None:
+            return func(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            registry.observe(name, perf_counter() - start)
+            registry.count(calls)
+
+    return wrapper
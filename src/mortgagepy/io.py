@@ -0,0 +1,292 @@
+"""Loan tape input and output module for mortgagepy package.
+
+Loan tapes are read and written in chunks of rows, so repricing a tape uses
+the same amount of memory however many loans it holds. CSV is supported out
+of the box and Parquet requires the optional pyarrow dependency,
+`pip install mortgagepy[arrow]`.
+"""
+
+import csv
+import os
+from itertools import islice
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+from . import batch
+from .exceptions import IncorrectType
+from .mortgage import _validate_columns
+
+REQUIRED_COLUMNS = (
+    "property_value",
+    "mortgage",
+    "term_months",
+    "interest_rate",
+)
+RESULT_COLUMNS = ("monthly_repayment", "total_cost", "interest_paid", "ltv")
+TRUE_VALUES = ("1", "true", "t", "yes", "y")
+
+
+def _is_parquet(path: Union[str, os.PathLike]) -> bool:
+    return os.fspath(path).lower().endswith((".parquet", ".pq"))
+
+
+def _pyarrow_parquet() -> object:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as err:
+        raise ImportError(
+            "Parquet loan tapes require pyarrow, install it with "
+            "'pip install mortgagepy[arrow]'."
+        ) from err
+    return pq
+
+
+def read_chunks(
+    path: Union[str, os.PathLike], chunk_size: int = 100_000
+) -> Iterator[dict]:
+    """Read a CSV or Parquet loan tape in chunks of rows.
+
+    Args:
+        path (str | PathLike): path of the loan tape, read as Parquet if it
+            ends in .parquet or .pq and as CSV otherwise.
+        chunk_size (int, optional): maximum number of rows per chunk.
+            Default is 100_000.
+
+    Raises:
+        IncorrectType: If a CSV row does not have a value for every column,
+            rows being numbered from 1 after the header.
+
+    Yields:
+        (dict): column name to the values of the chunk.
+    """
+    if _is_parquet(path):
+        parquet_file = _pyarrow_parquet().ParquetFile(path)
+        for record_batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield {
+                name: column.to_numpy(zero_copy_only=False)
+                for name, column in zip(
+                    record_batch.schema.names, record_batch.columns
+                )
+            }
+        return
+
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        n_rows = 0
+        while rows := list(islice(reader, chunk_size)):
+            # data rows are counted from 1 like `validate_columns`, rather
+            # than by line as quoted values can span several lines
+            short_rows = [
+                row_number
+                for row_number, row in enumerate(rows, start=n_rows + 1)
+                if len(row) != len(header)
+            ]
+            if short_rows:
+                raise IncorrectType(
+                    f"Rows {short_rows} do not have {len(header)} values.",
+                    errors=short_rows,
+                )
+            n_rows += len(rows)
+            yield dict(zip(header, map(list, zip(*rows))))
+
+
+def number_columns(
+    columns: dict, first_row: int = 1, allow_zero: bool = False
+) -> dict:
+    """Validate and convert columns of numbers in bulk, with the same rule as
+    the mortgage classes: every value must be a finite positive number.
+
+    Args:
+        columns (dict): column name to the values of the chunk.
+        first_row (int, optional): row number of the first row of the chunk,
+            used in the error message. Default is 1.
+        allow_zero (bool, optional): accept zero as well, such as for
+            overpayment amounts. Default is False.
+
+    Raises:
+        IncorrectType: If any value is not a finite positive float or int,
+            listing every offending row.
+
+    Returns:
+        (dict): column name to float64 array.
+    """
+    try:
+        return _validate_columns(
+            columns, parse_text=True, allow_zero=allow_zero
+        )
+    except IncorrectType as error:
+        if not isinstance(error.errors, dict):
+            raise
+        bad_rows = sorted(
+            {row + first_row for rows in error.errors.values() for row in rows}
+        )
+        rule = "non-negative" if allow_zero else "positive"
+        raise IncorrectType(
+            f"Values must be {rule} float or int, invalid rows {bad_rows} "
+            f"of columns {list(error.errors)}.",
+            errors=bad_rows,
+        ) from None
+
+
+def bool_column(values: Iterable) -> np.ndarray:
+    """Convert a column of flags, given as bools, numbers or strings such as
+    "true" and "yes", in bulk.
+
+    Args:
+        values (Iterable): values of the column.
+
+    Returns:
+        (np.ndarray): the column as a bool array.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "biuf":
+        return values.astype(bool)
+    return np.isin(
+        np.char.lower(np.char.strip(values.astype(str))), TRUE_VALUES
+    )
+
+
+def validate_columns(
+    columns: dict, first_row: int = 1, names: Iterable = REQUIRED_COLUMNS
+) -> dict:
+    """Validate and convert the loan columns of a chunk in bulk.
+
+    Args:
+        columns (dict): column name to the values of the chunk.
+        first_row (int, optional): row number of the first row of the chunk,
+            used in the error message. Default is 1.
+        names (Iterable, optional): numeric columns which are required.
+            Default is REQUIRED_COLUMNS.
+
+    Raises:
+        IncorrectType: If a required column is missing or has values that
+            are not finite positive numbers, listing every offending row.
+
+    Returns:
+        (dict): each of the names as a float64 array, and an "interest_only"
+            bool array.
+    """
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise IncorrectType(f"Loan tape is missing columns {missing}.")
+
+    loans = number_columns(
+        {name: columns[name] for name in names}, first_row=first_row
+    )
+    n_loans = len(next(iter(columns.values()), []))
+    loans["interest_only"] = bool_column(
+        columns.get("interest_only", np.zeros(n_loans, dtype=bool))
+    )
+
+    return loans
+
+
+def reprice(loans: dict) -> dict:
+    """Reprice a chunk of loans with the batch engine.
+
+    Capital repayment loans are priced as `CapitalRepaymentMortgage` and
+    interest only loans as `InterestOnlyMortgage`, where the total cost and
+    interest paid are the interest payments over the term.
+
+    Args:
+        loans (dict): validated loan columns from `validate_columns`.
+
+    Returns:
+        (dict): each of RESULT_COLUMNS as an array.
+    """
+    mortgages = loans["mortgage"]
+    interest_rates = loans["interest_rate"]
+    terms = loans["term_months"]
+    interest_only = loans["interest_only"]
+
+    capital_repayments = batch.monthly_capital_repayment(
+        mortgages, interest_rates, terms
+    )
+    capital_costs = batch._round(capital_repayments * terms)
+    interest_only_repayments = batch.monthly_interest_only_repayment(
+        mortgages, interest_rates
+    )
+    interest_only_costs = interest_only_repayments * terms
+
+    return {
+        "monthly_repayment": np.where(
+            interest_only, interest_only_repayments, capital_repayments
+        ),
+        "total_cost": np.where(
+            interest_only, interest_only_costs, capital_costs
+        ),
+        "interest_paid": np.where(
+            interest_only,
+            interest_only_costs,
+            batch._round(capital_costs - mortgages),
+        ),
+        "ltv": batch.ltv(
+            loans["property_value"], loans["property_value"] - mortgages
+        ),
+    }
+
+
+def reprice_tape(
+    path: Union[str, os.PathLike],
+    out_path: Union[str, os.PathLike],
+    chunk_size: int = 100_000,
+) -> int:
+    """Reprice every loan of a loan tape, streaming the results to a file.
+
+    The tape needs "property_value", "mortgage", "term_months" and
+    "interest_rate" columns, and optionally an "interest_only" column. Every
+    input column is written to the output followed by the RESULT_COLUMNS.
+
+    Args:
+        path (str | PathLike): CSV or Parquet loan tape to reprice.
+        out_path (str | PathLike): CSV or Parquet file to write, chosen by
+            its extension like the input.
+        chunk_size (int, optional): number of loans held in memory at once.
+            Default is 100_000.
+
+    Raises:
+        IncorrectType: If the loan tape has missing columns or values that
+            are not numbers.
+
+    Returns:
+        (int): number of loans repriced.
+    """
+    n_loans = 0
+
+    if _is_parquet(out_path):
+        import pyarrow as pa
+
+        pq = _pyarrow_parquet()
+        writer = None
+        try:
+            for columns in read_chunks(path, chunk_size=chunk_size):
+                columns.update(
+                    reprice(validate_columns(columns, first_row=n_loans + 1))
+                )
+                table = pa.table(columns)
+                if writer is None:
+                    writer = pq.ParquetWriter(out_path, table.schema)
+                writer.write_table(table)
+                n_loans += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+        return n_loans
+
+    with open(out_path, "w", newline="") as file:
+        writer = csv.writer(file)
+        for columns in read_chunks(path, chunk_size=chunk_size):
+            results = reprice(validate_columns(columns, first_row=n_loans + 1))
+            if n_loans == 0:
+                writer.writerow([*columns, *RESULT_COLUMNS])
+            writer.writerows(
+                zip(
+                    *columns.values(),
+                    *(values.tolist() for values in results.values()),
+                )
+            )
+            n_loans += len(results["ltv"])
+
+    return n_loans
@@ -0,0 +1,227 @@
+"""Projection kernel backends for mortgagepy package.
+
+A kernel projects a book of capital repayment mortgages with flat interest
+rates to the months taken to repay and the total interest paid of each loan,
+following the same rules as `calculator.capital_overpayment`. Three backends
+are registered:
+
+- "python": a plain Python loop over each loan, the reference.
+- "numpy": every loan walked forward together, one month per step, by the
+  same vectorised loop as recorded projections.
+- "numba": the reference loop compiled with Numba, when it is installed.
+
+The lump sum and early repayment branches make each loan's projection path
+dependent, so the Python loop, which walks each loan with the calculator's
+month step, is what Numba compiles. Its rounding is done
+with exact floating point arithmetic rather than the builtin `round`, so the
+compiled loop rounds every month's interest to the same penny.
+"""
+
+from importlib.util import find_spec
+from math import floor
+from typing import Callable, Optional
+
+import numpy as np
+
+from .calculator import _make_month_step
+
+DEFAULT_BACKEND = "numba" if find_spec("numba") is not None else "numpy"
+
+_backend = DEFAULT_BACKEND
+
+
+def _round_pennies(value: float) -> float:
+    """Round to 2 decimal places exactly as the builtin `round` does.
+
+    The scaled value 100 * value is split into a float and its exact
+    rounding error (Dekker's product), so the half way case between two
+    pennies is decided on the exact binary value, ties going to even.
+
+    Args:
+        value (float): unrounded value.
+
+    Returns:
+        (float): value rounded to the penny.
+    """
+    scaled = value * 100.0
+    split = 134217729.0 * value
+    high = split - (split - value)
+    low = value - high
+    error = (high * 100.0 - scaled) + low * 100.0
+
+    pennies = floor(scaled)
+    half = (scaled - pennies) - 0.5
+    if half > 0 or (half == 0 and error > 0):
+        pennies += 1
+    elif half == 0 and error == 0 and pennies % 2:
+        pennies += 1
+    return pennies / 100.0
+
+
+def _make_loop(month_step: Callable[..., tuple]) -> Callable:
+    """Build the per-loan loop around the calculator's month step, so Numba
+    can compile both."""
+
+    def loop(
+        mortgages: np.ndarray,
+        interest_rates: np.ndarray,
+        terms: np.ndarray,
+        standard_payments: np.ndarray,
+        monthly_overpayment: np.ndarray,
+        lump_sum_payment: np.ndarray,
+        lump_sum_payment_month: np.ndarray,
+        days_in_month: np.ndarray,
+        days_in_year: np.ndarray,
+    ) -> tuple:
+        """Project each loan in turn, month by month, the same as
+        `calculator.capital_overpayment`.
+
+        Only uses constructs Numba can compile.
+
+        Args:
+            mortgages (np.ndarray): outstanding mortgage values.
+            interest_rates (np.ndarray): interest rates as a percentage.
+            terms (np.ndarray): original number of months of each mortgage.
+            standard_payments (np.ndarray): monthly repayments.
+            monthly_overpayment (np.ndarray): monthly overpayment amounts.
+            lump_sum_payment (np.ndarray): lump sum payment amounts.
+            lump_sum_payment_month (np.ndarray): month of each lump sum.
+            days_in_month (np.ndarray): days in each month projected.
+            days_in_year (np.ndarray): days in the year of each month.
+
+        Returns:
+            (tuple): months taken to repay and unrounded total interest paid.
+        """
+        n_loans = len(mortgages)
+        months_to_repay = np.zeros(n_loans, dtype=np.int64)
+        total_interest_paid = np.zeros(n_loans)
+
+        for loan in range(n_loans):
+            balance = mortgages[loan]
+            interest_rate_dec = interest_rates[loan] / 100
+            total_payment = standard_payments[loan] + monthly_overpayment[loan]
+            month = 0
+            interest_paid = 0.0
+
+            while balance > 0:
+                month += 1
+
+                balance, interest, _ = month_step(
+                    balance,
+                    total_payment,
+                    lump_sum_payment[loan]
+                    if month == lump_sum_payment_month[loan]
+                    else 0.0,
+                    interest_rate_dec,
+                    days_in_year[month - 1],
+                    days_in_month[month - 1],
+                )
+                interest_paid += interest
+
+                if month >= terms[loan]:
+                    break
+
+            months_to_repay[loan] = month
+            total_interest_paid[loan] = interest_paid
+
+        return months_to_repay, total_interest_paid
+
+    return loop
+
+
+_loop = _make_loop(_make_month_step(_round_pennies))
+
+
+def _python_kernel(*arrays: np.ndarray) -> tuple:
+    """Run `_loop` on Python floats rather than NumPy scalars."""
+    return _loop(*(array.tolist() for array in arrays))
+
+
+def _numpy_kernel(*arrays: np.ndarray) -> tuple:
+    """Project every loan together, one month per step, with the vectorised
+    loop of `batch._project_months`."""
+    from .batch import _project_months
+
+    projection = _project_months(*arrays)
+    return projection["months_to_repay"], projection["total_interest_paid"]
+
+
+def _numba_kernel() -> Callable:
+    """Compile `_loop` with Numba, on first use."""
+    import numba
+
+    jit = numba.njit(nogil=True)
+    return jit(_make_loop(jit(_make_month_step(jit(_round_pennies)))))
+
+
+BACKENDS = {
+    "python": _python_kernel,
+    "numpy": _numpy_kernel,
+}
+_compiled = {}
+
+
+def available_backends() -> list:
+    """Names of the backends which can be used here.
+
+    Returns:
+        (list): names of the registered backends, plus "numba" if it is
+            installed.
+    """
+    names = list(BACKENDS)
+    if find_spec("numba") is not None:
+        names.append("numba")
+    return names
+
+
+def register_backend(name: str, kernel: Callable[..., tuple]) -> None:
+    """Add (or replace) a kernel backend.
+
+    Args:
+        name (str): name of the backend.
+        kernel (Callable): function with the same arguments and results as
+            `_loop`.
+    """
+    BACKENDS[name] = kernel
+
+
+def set_backend(name: str) -> None:
+    """Set the backend used when none is given.
+
+    Args:
+        name (str): name of the backend, one of `available_backends`.
+
+    Raises:
+        ValueError: If the backend is not available.
+    """
+    get_backend(name)
+
+    global _backend
+    _backend = name
+
+
+def get_backend(name: Optional[str] = None) -> Callable[..., tuple]:
+    """Kernel of a backend.
+
+    Args:
+        name (str, optional): name of the backend. Default is None which uses
+            the backend set by `set_backend`, "numba" when installed and
+            "numpy" otherwise.
+
+    Raises:
+        ValueError: If the backend is not available.
+
+    Returns:
+        (Callable): the kernel.
+    """
+    name = name or _backend
+    if name in BACKENDS:
+        return BACKENDS[name]
+    if name == "numba" and find_spec("numba") is not None:
+        if name not in _compiled:
+            _compiled[name] = _numba_kernel()
+        return _compiled[name]
+    raise ValueError(
+        f"Kernel backend {name!r} is not available, expected one of "
+        f"{available_backends()}."
+    )
@@ -1,11 +1,9 @@
 """Mortgage classes for mortgagepy package."""
 
-from functools import cache
-
-from rich import box
-from rich.console import Console
-from rich.table import Table
+from math import isfinite
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional
 
+from .cache import memoised_method
 from .calculator import (
     capital_overpayment,
     ltv,
@@ -13,12 +11,120 @@ from .calculator import (
     monthly_interest_only_repayment,
     total_cost_of_mortgage,
 )
+from .daycount import DateLike
 from .exceptions import IncorrectType
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from .schedule import ScheduleRow
+
+FIELDS = ("property_value", "mortgage", "term_months", "interest_rate")
+
+
+def _is_positive(value: object, allow_zero: bool = False) -> bool:
+    """Whether a value is a finite positive float or int, or zero if
+    `allow_zero`."""
+    return (
+        isinstance(value, (float, int))
+        and isfinite(value)
+        and (value > 0 or (allow_zero and value == 0))
+    )
+
+
+def _validate_columns(
+    columns: dict, parse_text: bool = False, allow_zero: bool = False
+) -> dict:
+    """Validate whole columns of mortgage attributes at once, with the same
+    rule as `MortgageBase`: every value must be a finite positive number.
+
+    Numeric columns are checked with array operations, other columns value by
+    value, and every offending row of every column is reported together.
+
+    Args:
+        columns (dict): column name to the values of each mortgage.
+        parse_text (bool, optional): parse strings as numbers, such as the
+            values of CSV rows. Default is False which rejects strings.
+        allow_zero (bool, optional): accept zero as well, such as for
+            overpayment amounts. Default is False.
+
+    Raises:
+        IncorrectType: If the columns do not have the same length or any value
+            is not a positive float or int, with `errors` mapping each
+            offending column to its row indices.
+
+    Returns:
+        (dict): column name to float64 array.
+    """
+    import numpy as np
+
+    arrays = {}
+    errors = {}
+    for name, values in columns.items():
+        if not isinstance(values, np.ndarray):
+            values = list(values)
+        array = np.asarray(values)
+        if array.ndim != 1:
+            raise IncorrectType(f"{name} must be a 1-D column of values.")
+        if parse_text and array.dtype.kind in "USO":
+            # parse whole columns of text in bulk, falling back to checking
+            # value by value to find the rows which do not parse
+            try:
+                array = array.astype(np.float64)
+            except (TypeError, ValueError):
+                pass
+
+        if array.dtype.kind in "iuf":
+            array = array.astype(np.float64)
+            with np.errstate(invalid="ignore"):
+                valid = (array >= 0) if allow_zero else (array > 0)
+                bad_rows = np.flatnonzero(
+                    ~(np.isfinite(array) & valid)
+                ).tolist()
+        else:
+            parsed = []
+            bad_rows = []
+            for row, value in enumerate(values):
+                if parse_text and isinstance(value, str):
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        pass
+                if not _is_positive(value, allow_zero):
+                    bad_rows.append(row)
+                parsed.append(value)
+            if not bad_rows:
+                array = np.array(parsed, dtype=np.float64)
+
+        if bad_rows:
+            errors[name] = bad_rows
+        arrays[name] = array
+
+    if len({len(array) for array in arrays.values()}) > 1:
+        raise IncorrectType("All columns must have the same length.")
+    if errors:
+        rule = "non-negative" if allow_zero else "positive"
+        raise IncorrectType(
+            f"Values must be {rule} float or int, invalid rows: "
+            + "; ".join(f"{name} {rows}" for name, rows in errors.items()),
+            errors=errors,
+        )
+
+    return arrays
+
 
 class MortgageBase:
     """Base class for mortgages."""
 
+    __slots__ = (
+        "_property_value",
+        "_mortgage",
+        "_term_months",
+        "_interest_rate",
+        "_memo",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         property_value: float | int,
@@ -35,30 +141,123 @@ class MortgageBase:
             interest_rate (float | int): interest rate
 
         Raises:
-            IncorrectType: If any of the inputs are not of type float or int.
+            IncorrectType: If any of the inputs are not of type float or int,
+                or are not finite and positive.
         """
-        for name, value in {
-            "property_value": property_value,
-            "mortgage": mortgage,
-            "term_months": term_months,
-            "interest_rate": interest_rate,
-        }.items():
+        for name, value in (
+            ("property_value", property_value),
+            ("mortgage", mortgage),
+            ("term_months", term_months),
+            ("interest_rate", interest_rate),
+        ):
             if not isinstance(value, (float, int)):
                 raise IncorrectType(
                     f"{name} must be float or int, got {type(value).__name__}"
                 )
+            if not _is_positive(value):
+                raise IncorrectType(f"{name} must be positive, got {value}")
 
         self._property_value = float(property_value)
         self._mortgage = float(mortgage)
         self._term_months = float(term_months)
         self._interest_rate = float(interest_rate)
+        self._memo = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        property_values: "npt.ArrayLike",
+        mortgages: "npt.ArrayLike",
+        term_months: "npt.ArrayLike",
+        interest_rates: "npt.ArrayLike",
+    ) -> list:
+        """Build many mortgages from columns of their attributes, validating
+        each column at once rather than each value of each mortgage.
+
+        Args:
+            property_values (ArrayLike): property value of each mortgage.
+            mortgages (ArrayLike): amount of each mortgage.
+            term_months (ArrayLike): term in months of each mortgage.
+            interest_rates (ArrayLike): interest rate of each mortgage.
+
+        Raises:
+            IncorrectType: If the columns do not have the same length or any
+                value is not a finite positive float or int, listing every
+                offending row index of each column.
+
+        Returns:
+            (list): the mortgages.
+        """
+        columns = _validate_columns(
+            dict(
+                zip(
+                    FIELDS,
+                    (property_values, mortgages, term_months, interest_rates),
+                )
+            )
+        )
+
+        built = []
+        new = cls.__new__
+        for property_value, mortgage, term, interest_rate in zip(
+            *(columns[name].tolist() for name in FIELDS)
+        ):
+            instance = new(cls)
+            instance._property_value = property_value
+            instance._mortgage = mortgage
+            instance._term_months = term
+            instance._interest_rate = interest_rate
+            instance._memo = None
+            built.append(instance)
+        return built
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping]) -> list:
+        """Build many mortgages from records, such as dicts or the rows of a
+        `csv.DictReader`, validated a column at a time.
+
+        Args:
+            records (Iterable[Mapping]): records with a "property_value",
+                "mortgage", "term_months" and "interest_rate" each, as
+                numbers or strings of numbers.
+
+        Raises:
+            IncorrectType: If any value is missing or not a positive number,
+                listing every offending row index of each column.
+
+        Returns:
+            (list): the mortgages.
+        """
+        records = list(records)
+        columns = _validate_columns(
+            {
+                name: [record.get(name) for record in records]
+                for name in FIELDS
+            },
+            parse_text=True,
+        )
+        return cls.from_arrays(*(columns[name] for name in FIELDS))
+
+    def _cache_key(self) -> tuple:
+        return (
+            self._property_value,
+            self._mortgage,
+            self._term_months,
+            self._interest_rate,
+        )
+
+    def _print_summary_table(self, summary_dict: dict, title: str) -> None:
+        # rich is only needed for printing, so it is not imported with the
+        # package
+        from rich import box
+        from rich.console import Console
+        from rich.table import Table
 
-    def _create_summary_table(self, summary_dict: dict, title: str) -> Table:
         table = Table(title=title, header_style="bold", box=box.HEAVY)
         for key in summary_dict:
             table.add_column(key.title(), vertical="top")
         table.add_row(*map(str, summary_dict.values()))
-        return table
+        Console().print(table)
 
     @property
     def property_value(self) -> float:
@@ -71,8 +270,9 @@ class MortgageBase:
 
     @property_value.setter
     def property_value(self, new_value: float | int) -> None:
-        if new_value > 0 and isinstance(new_value, (float, int)):
+        if _is_positive(new_value):
             self._property_value = float(new_value)
+            self._memo = None
         else:
             raise IncorrectType()
 
@@ -87,8 +287,9 @@ class MortgageBase:
 
     @mortgage.setter
     def mortgage(self, new_mortgage: float | int) -> None:
-        if new_mortgage > 0 and isinstance(new_mortgage, (float, int)):
+        if _is_positive(new_mortgage):
             self._mortgage = float(new_mortgage)
+            self._memo = None
         else:
             raise IncorrectType("Mortgage must be positive float or int.")
 
@@ -103,8 +304,9 @@ class MortgageBase:
 
     @term_months.setter
     def term_months(self, new_term: float | int) -> None:
-        if new_term > 0 and isinstance(new_term, (float, int)):
+        if _is_positive(new_term):
             self._term_months = float(new_term)
+            self._memo = None
         else:
             raise IncorrectType()
 
@@ -119,12 +321,13 @@ class MortgageBase:
 
     @interest_rate.setter
     def interest_rate(self, new_rate: float | int) -> None:
-        if new_rate > 0 and isinstance(new_rate, (float, int)):
+        if _is_positive(new_rate):
             self._interest_rate = float(new_rate)
+            self._memo = None
         else:
             raise IncorrectType()
 
-    @cache
+    @memoised_method
     def ltv(self) -> int:
         """Calculates the loan to value ratio.
 
@@ -142,6 +345,8 @@ class CapitalRepaymentMortgage(MortgageBase):
         MortgageBase (MortgageBase): Base class for mortgage types.
     """
 
+    __slots__ = ()
+
     def summarise(self, printed: bool = False) -> dict:
         """Summarise the mortgage object.
 
@@ -163,14 +368,13 @@ class CapitalRepaymentMortgage(MortgageBase):
             "total cost (£)": self.mortgage_total_cost(),
         }
         if printed:
-            table = self._create_summary_table(
+            self._print_summary_table(
                 summary_dict, "Capital Repayment Mortgage Summary"
             )
-            Console().print(table)
         else:
             return summary_dict
 
-    @cache
+    @memoised_method
     def monthly_repayment(self) -> float:
         """Calculates the monthly repayment for a capital repayment mortgage.
 
@@ -183,7 +387,7 @@ class CapitalRepaymentMortgage(MortgageBase):
             mortgage_length_months=self.term_months,
         )
 
-    @cache
+    @memoised_method
     def mortgage_total_cost(self) -> float:
         """Calculates the total cost of the mortgage.
 
@@ -196,7 +400,7 @@ class CapitalRepaymentMortgage(MortgageBase):
             mortgage_length_months=self.term_months,
         )
 
-    @cache
+    @memoised_method
     def interest_paid(self) -> float:
         """Calculates the total interest paid on the mortgage.
 
@@ -210,6 +414,7 @@ class CapitalRepaymentMortgage(MortgageBase):
         monthly_overpayment: float = 0.0,
         lump_sum_payment: float = 0.0,
         lump_sum_payment_month: int = 1,
+        start_date: Optional[DateLike] = None,
     ) -> dict:
         """Project the impact of overpayments on the mortgage.
 
@@ -220,6 +425,8 @@ class CapitalRepaymentMortgage(MortgageBase):
             lump_sum_payment_month (int, optional): The month (1-based index)
                 during the mortgage term to apply the lump sum payment.
                 Defaults to 1.
+            start_date (DateLike, optional): date of the first month. Defaults
+                to None which uses the current month.
 
         Returns:
             (dict): A dictionary containing the impact details.
@@ -231,6 +438,7 @@ class CapitalRepaymentMortgage(MortgageBase):
             monthly_overpayment=monthly_overpayment,
             lump_sum_payment=lump_sum_payment,
             lump_sum_payment_month=lump_sum_payment_month,
+            start_date=start_date,
         )
 
         interest_saved = (
@@ -241,6 +449,45 @@ class CapitalRepaymentMortgage(MortgageBase):
 
         return overpayment_dict
 
+    def schedule(
+        self,
+        monthly_overpayment: float = 0.0,
+        lump_sum_payment: float = 0.0,
+        lump_sum_payment_month: int = 1,
+        start_date: Optional[DateLike] = None,
+    ) -> Iterator["ScheduleRow"]:
+        """Month by month amortisation schedule of the mortgage.
+
+        Rows are generated lazily, so the schedule can be streamed or
+        stopped early without building every month.
+
+        Args:
+            monthly_overpayment (float, optional): amount to overpay every
+                month. Defaults to 0.0.
+            lump_sum_payment (float, optional): lump sum to overpay.
+                Defaults to 0.0.
+            lump_sum_payment_month (int, optional): The month (1-based index)
+                during the mortgage term to apply the lump sum payment.
+                Defaults to 1.
+            start_date (DateLike, optional): date of the first month. Defaults
+                to None which uses the current month.
+
+        Returns:
+            (Iterator[ScheduleRow]): date, opening balance, interest,
+                principal, overpayment and closing balance of each month.
+        """
+        from .schedule import iter_schedule
+
+        return iter_schedule(
+            mortgage=self.mortgage,
+            interest_rate=self.interest_rate,
+            mortgage_length_months=self.term_months,
+            monthly_overpayment=monthly_overpayment,
+            lump_sum_payment=lump_sum_payment,
+            lump_sum_payment_month=lump_sum_payment_month,
+            start_date=start_date,
+        )
+
 
 class InterestOnlyMortgage(MortgageBase):
     """Interest only mortgage class.
@@ -249,6 +496,8 @@ class InterestOnlyMortgage(MortgageBase):
         MortgageBase (MortgageBase): Base class for mortgage types.
     """
 
+    __slots__ = ()
+
     def summarise(self, printed: bool = False) -> dict:
         """Summarise the mortgage object.
 
@@ -269,14 +518,13 @@ class InterestOnlyMortgage(MortgageBase):
             "total cost (£)": self.mortgage_total_cost(),
         }
         if printed:
-            table = self._create_summary_table(
+            self._print_summary_table(
                 summary_dict, "Interest Only Mortgage Summary"
             )
-            Console().print(table)
         else:
             return summary_dict
 
-    @cache
+    @memoised_method
     def monthly_repayment(self) -> float:
         """Calculates the monthly repayment for an interest only mortgage.
 
@@ -287,7 +535,7 @@ class InterestOnlyMortgage(MortgageBase):
             mortgage=self.mortgage, interest_rate=self.interest_rate
         )
 
-    @cache
+    @memoised_method
     def mortgage_total_cost(self) -> float:
         """Calculates the total cost of the mortgage.
 
@@ -0,0 +1,374 @@
+"""Mortgage portfolio class for mortgagepy package."""
+
+from math import ceil
+from typing import Iterable, Iterator, Mapping, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from . import batch
+from .batch import _project
+from .exceptions import IncorrectType
+from .io import bool_column
+from .mortgage import (
+    FIELDS,
+    CapitalRepaymentMortgage,
+    InterestOnlyMortgage,
+    MortgageBase,
+    _validate_columns,
+)
+
+
+def _column(name: str) -> property:
+    """Attribute stored in a column of the view's portfolio."""
+
+    def fget(self: "_MortgageView") -> float:
+        return float(getattr(self._portfolio, name)[self._index])
+
+    def fset(self: "_MortgageView", value: float) -> None:
+        getattr(self._portfolio, name)[self._index] = value
+
+    return property(fget, fset)
+
+
+class _MortgageView:
+    """Mixin backing a mortgage's attributes with a row of a portfolio."""
+
+    __slots__ = ()
+
+    _property_value = _column("property_values")
+    _mortgage = _column("mortgages")
+    _term_months = _column("term_months")
+    _interest_rate = _column("interest_rates")
+
+    def __init__(self, portfolio: "MortgagePortfolio", index: int) -> None:
+        """Initialises a view of a single mortgage of a portfolio.
+
+        Args:
+            portfolio (MortgagePortfolio): portfolio holding the mortgage.
+            index (int): position of the mortgage in the portfolio.
+        """
+        self._portfolio = portfolio
+        self._index = index
+        self._memo = None
+
+
+class _CapitalRepaymentMortgageView(_MortgageView, CapitalRepaymentMortgage):
+    __slots__ = ("_portfolio", "_index")
+
+
+class _InterestOnlyMortgageView(_MortgageView, InterestOnlyMortgage):
+    __slots__ = ("_portfolio", "_index")
+
+
+class MortgagePortfolio:
+    """Book of mortgages stored as parallel float64 arrays.
+
+    Indexing or iterating over the portfolio gives lightweight views which
+    behave like `CapitalRepaymentMortgage` or `InterestOnlyMortgage` objects
+    and read and write their attributes from the portfolio's arrays.
+    """
+
+    def __init__(
+        self,
+        property_values: npt.ArrayLike,
+        mortgages: npt.ArrayLike,
+        term_months: npt.ArrayLike,
+        interest_rates: npt.ArrayLike,
+        interest_only: npt.ArrayLike = False,
+    ) -> None:
+        """Initialises the MortgagePortfolio class.
+
+        Args:
+            property_values (ArrayLike): property value of each mortgage.
+            mortgages (ArrayLike): amount of each mortgage.
+            term_months (ArrayLike): term in months of each mortgage.
+            interest_rates (ArrayLike): interest rate of each mortgage.
+            interest_only (ArrayLike, optional): whether each mortgage is
+                interest only rather than capital repayment. Default is False.
+
+        Raises:
+            IncorrectType: If any of the inputs are not numeric, finite and
+                positive or the inputs do not have the same length.
+        """
+        columns = {}
+        for name, values in (
+            ("property_values", property_values),
+            ("mortgages", mortgages),
+            ("term_months", term_months),
+            ("interest_rates", interest_rates),
+        ):
+            values = np.asarray(values)
+            if values.ndim != 1 or values.dtype.kind not in "iuf":
+                raise IncorrectType(
+                    f"{name} must be a 1-D array of floats or ints, got "
+                    f"{values.ndim}-D {values.dtype}"
+                )
+            columns[name] = values
+
+        # the same finite and positive rule as the mortgage classes
+        columns = _validate_columns(columns)
+
+        self.property_values = columns["property_values"]
+        self.mortgages = columns["mortgages"]
+        self.term_months = columns["term_months"]
+        self.interest_rates = columns["interest_rates"]
+        self.interest_only = np.broadcast_to(
+            np.asarray(interest_only, dtype=bool), self.mortgages.shape
+        ).copy()
+
+    @classmethod
+    def from_mortgages(
+        cls, mortgages: Iterable[MortgageBase]
+    ) -> "MortgagePortfolio":
+        """Build a portfolio from mortgage objects.
+
+        Args:
+            mortgages (Iterable[MortgageBase]): capital repayment or interest
+                only mortgages.
+
+        Returns:
+            (MortgagePortfolio): portfolio of the mortgages.
+        """
+        mortgages = list(mortgages)
+        return cls(
+            property_values=[m.property_value for m in mortgages],
+            mortgages=[m.mortgage for m in mortgages],
+            term_months=[m.term_months for m in mortgages],
+            interest_rates=[m.interest_rate for m in mortgages],
+            interest_only=[
+                isinstance(m, InterestOnlyMortgage) for m in mortgages
+            ],
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping]) -> "MortgagePortfolio":
+        """Build a portfolio from records, such as dicts or the rows of a
+        `csv.DictReader`, validated a column at a time.
+
+        Args:
+            records (Iterable[Mapping]): records with a "property_value",
+                "mortgage", "term_months" and "interest_rate" each, as
+                numbers or strings of numbers, and optionally an
+                "interest_only" flag, a bool or a string such as "true",
+                which defaults to False.
+
+        Raises:
+            IncorrectType: If any value is missing or not a positive number,
+                listing every offending row index of each column.
+
+        Returns:
+            (MortgagePortfolio): portfolio of the records.
+        """
+        records = list(records)
+        columns = _validate_columns(
+            {
+                name: [record.get(name) for record in records]
+                for name in FIELDS
+            },
+            parse_text=True,
+        )
+        return cls(
+            property_values=columns["property_value"],
+            mortgages=columns["mortgage"],
+            term_months=columns["term_months"],
+            interest_rates=columns["interest_rate"],
+            interest_only=bool_column(
+                [record.get("interest_only", False) for record in records]
+            ),
+        )
+
+    def __len__(self) -> int:
+        """Number of mortgages in the portfolio."""
+        return len(self.mortgages)
+
+    def __getitem__(self, index: int) -> MortgageBase:
+        """View of a single mortgage of the portfolio.
+
+        Args:
+            index (int): position of the mortgage.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            (MortgageBase): capital repayment or interest only mortgage view.
+        """
+        index = range(len(self))[index]
+        if self.interest_only[index]:
+            return _InterestOnlyMortgageView(self, index)
+        return _CapitalRepaymentMortgageView(self, index)
+
+    def __iter__(self) -> Iterator[MortgageBase]:
+        """Iterate over views of every mortgage of the portfolio."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def _weighted_average(self, values: np.ndarray) -> float:
+        total_balance = self.mortgages.sum()
+        if total_balance == 0:
+            return float("nan")
+        return float((values * self.mortgages).sum() / total_balance)
+
+    def total_balance(self) -> float:
+        """Total outstanding balance of the portfolio.
+
+        Returns:
+            (float): sum of every mortgage.
+        """
+        return round(float(self.mortgages.sum()), 2)
+
+    def weighted_average_rate(self) -> float:
+        """Balance weighted average interest rate of the portfolio.
+
+        Returns:
+            (float): weighted average interest rate as a percentage.
+        """
+        return self._weighted_average(self.interest_rates)
+
+    def weighted_average_term(self) -> float:
+        """Balance weighted average remaining term of the portfolio.
+
+        Returns:
+            (float): weighted average term in months.
+        """
+        return self._weighted_average(self.term_months)
+
+    def ltv(self) -> np.ndarray:
+        """Loan to value of every mortgage.
+
+        Returns:
+            (np.ndarray): loan to value percentages.
+        """
+        return batch.ltv(
+            property_values=self.property_values,
+            deposits=self.property_values - self.mortgages,
+        )
+
+    def ltv_distribution(
+        self, bands: Iterable[int] = (60, 75, 80, 85, 90, 95)
+    ) -> dict:
+        """Number of mortgages and balance in each loan to value band.
+
+        Args:
+            bands (Iterable[int], optional): upper bounds (inclusive) of the
+                loan to value bands. Default is (60, 75, 80, 85, 90, 95).
+
+        Returns:
+            (dict): band label to a dictionary of the number of mortgages and
+                their balance.
+        """
+        bands = sorted(bands)
+        labels = [f"<={bands[0]}%"]
+        labels += [f"{lo}-{hi}%" for lo, hi in zip(bands, bands[1:])]
+        labels.append(f">{bands[-1]}%")
+
+        band_index = np.searchsorted(bands, self.ltv(), side="left")
+        counts = np.bincount(band_index, minlength=len(labels))
+        balances = np.bincount(
+            band_index, weights=self.mortgages, minlength=len(labels)
+        )
+
+        return {
+            label: {
+                "mortgages": int(count),
+                "balance (£)": round(float(balance), 2),
+            }
+            for label, count, balance in zip(labels, counts, balances)
+        }
+
+    def monthly_repayments(self) -> np.ndarray:
+        """Monthly repayment of every mortgage.
+
+        Returns:
+            (np.ndarray): monthly repayments.
+        """
+        return np.where(
+            self.interest_only,
+            batch.monthly_interest_only_repayment(
+                self.mortgages, self.interest_rates
+            ),
+            batch.monthly_capital_repayment(
+                self.mortgages, self.interest_rates, self.term_months
+            ),
+        )
+
+    def cash_flows(self, start_date: Optional[npt.ArrayLike] = None) -> dict:
+        """Projected monthly cash flows of the whole portfolio, assuming
+        every mortgage runs to term at its current interest rate. Interest
+        only mortgages repay their balance in their final month.
+
+        Args:
+            start_date (ArrayLike, optional): date of the first month of the
+                projection, or of each mortgage, month N of the cash flows
+                being month N of every mortgage. Default is None which uses
+                the current month.
+
+        Returns:
+            (dict): 1-D array per month of the total "opening_balance",
+                "interest", "principal", "overpayment" and "closing_balance"
+                of the portfolio.
+        """
+        capital = ~self.interest_only
+        n_months = max(1, ceil(self.term_months.max())) if len(self) else 0
+        if np.ndim(start_date):
+            start_date = np.broadcast_to(
+                np.asarray(start_date), self.mortgages.shape
+            )[capital]
+        cash_flows = _project(
+            self.mortgages[capital],
+            self.interest_rates[capital],
+            self.term_months[capital],
+            aggregate=True,
+            start_date=start_date,
+        )["totals"]
+        cash_flows = {
+            field: np.pad(values, (0, n_months - len(values)))
+            for field, values in cash_flows.items()
+        }
+
+        # interest only mortgages pay the same interest every month and the
+        # balance in their final month
+        final_month = np.maximum(
+            np.ceil(self.term_months[self.interest_only]).astype(np.int64), 1
+        )
+        mortgages = self.mortgages[self.interest_only]
+        repayments = batch.monthly_interest_only_repayment(
+            mortgages, self.interest_rates[self.interest_only]
+        )
+        repaid = np.bincount(
+            final_month - 1, weights=mortgages, minlength=n_months
+        )
+        outstanding = np.cumsum(repaid[::-1])[::-1]
+        interest = np.cumsum(
+            np.bincount(
+                final_month - 1, weights=repayments, minlength=n_months
+            )[::-1]
+        )[::-1]
+
+        cash_flows["opening_balance"] += outstanding
+        cash_flows["interest"] += interest
+        cash_flows["principal"] += repaid
+        cash_flows["closing_balance"] += outstanding - repaid
+
+        return cash_flows
+
+    def summarise(self) -> dict:
+        """Summarise the portfolio.
+
+        Returns:
+            (dict): dictionary of portfolio summary.
+        """
+        return {
+            "mortgages": len(self),
+            "total balance (£)": self.total_balance(),
+            "weighted average interest rate (%)": round(
+                self.weighted_average_rate(), 2
+            ),
+            "weighted average term (months)": round(
+                self.weighted_average_term(), 1
+            ),
+            "monthly repayments (£)": round(
+                float(self.monthly_repayments().sum()), 2
+            ),
+        }
@@ -0,0 +1,205 @@
+"""Checkpointed overpayment projections for mortgagepy package."""
+
+from math import ceil
+from typing import Optional
+
+from .calculator import _month_step, monthly_capital_repayment
+from .daycount import DEFAULT_CONVENTION, DateLike, day_counts, start_month
+from .exceptions import IncorrectType
+from .instrumentation import count
+
+
+class OverpaymentProjection:
+    """Overpayment projection of a capital repayment mortgage which can be
+    re-projected cheaply when the monthly overpayment changes part way
+    through the term.
+
+    The base projection, the same as `calculator.capital_overpayment`,
+    keeps the balance and interest paid so far at the start of every
+    `checkpoint_every` months. Changing the overpayment from month N onward
+    resumes from the last checkpoint at or before N, so only the months from
+    there to the end of the term are calculated again.
+    """
+
+    def __init__(
+        self,
+        mortgage: float,
+        interest_rate: float,
+        mortgage_length_months: int,
+        monthly_overpayment: float = 0,
+        lump_sum_payment: float = 0,
+        lump_sum_payment_month: int = 1,
+        checkpoint_every: int = 12,
+        day_count: str = DEFAULT_CONVENTION,
+        start_date: Optional[DateLike] = None,
+    ) -> None:
+        """Initialises the OverpaymentProjection class, projecting the base
+        overpayments.
+
+        Args:
+            mortgage (float): outstanding mortgage value.
+            interest_rate (float): current interest rate as a percentage.
+            mortgage_length_months (int): original number of months of the
+                mortgage.
+            monthly_overpayment (float, optional): additional monthly
+                overpayment amount. Default is 0.
+            lump_sum_payment (float, optional): one-time lump sum payment
+                amount. Default is 0.
+            lump_sum_payment_month (int, optional): the month in which the
+                lump sum payment is made. Default is 1.
+            checkpoint_every (int, optional): number of months between
+                checkpoints. Default is 12.
+            day_count (str, optional): day count convention of the daily
+                interest. Default is "actual/actual".
+            start_date (DateLike, optional): date of the first month of the
+                projection. Default is None which uses the current month.
+
+        Raises:
+            IncorrectType: If checkpoint_every is not a positive integer.
+        """
+        if not isinstance(checkpoint_every, int) or checkpoint_every < 1:
+            raise IncorrectType("checkpoint_every must be a positive integer.")
+
+        self.mortgage = mortgage
+        self.interest_rate = interest_rate
+        self.mortgage_length_months = mortgage_length_months
+        self.monthly_overpayment = monthly_overpayment
+        self.lump_sum_payment = lump_sum_payment
+        self.lump_sum_payment_month = lump_sum_payment_month
+        self.checkpoint_every = checkpoint_every
+        self.day_count = day_count
+        self.start_date = start_date
+
+        self._standard_payment = monthly_capital_repayment(
+            mortgage, interest_rate, mortgage_length_months
+        )
+        self._interest_rate_dec = interest_rate / 100
+        year, month = start_month(start_date)
+        self._days_in_month, self._days_in_year = day_counts(
+            max(1, ceil(mortgage_length_months)),
+            month=month,
+            year=year,
+            convention=day_count,
+        )
+
+        self._checkpoints = []
+        self._result = self._project(
+            month=1,
+            balance=mortgage,
+            total_interest_paid=0,
+            change_month=1,
+            monthly_overpayment=monthly_overpayment,
+            checkpoints=self._checkpoints,
+        )
+
+    def _project(
+        self,
+        month: int,
+        balance: float,
+        total_interest_paid: float,
+        change_month: int,
+        monthly_overpayment: float,
+        checkpoints: Optional[list] = None,
+    ) -> dict:
+        """Project the mortgage from the start of a month, the same month by
+        month as `calculator.capital_overpayment`.
+
+        Args:
+            month (int): month (1-based index) to start from.
+            balance (float): balance at the start of the month.
+            total_interest_paid (float): unrounded interest paid before the
+                month.
+            change_month (int): first month of the new monthly overpayment.
+            monthly_overpayment (float): monthly overpayment from the
+                change month onward.
+            checkpoints (list, optional): list to append the balance and
+                interest paid to at the start of every checkpoint month.
+                Default is None.
+
+        Returns:
+            (dict): the same impact details as
+                `calculator.capital_overpayment`.
+        """
+        months_to_repay = month - 1
+
+        while balance > 0:
+            months_to_repay += 1
+
+            if (
+                checkpoints is not None
+                and (months_to_repay - 1) % self.checkpoint_every == 0
+            ):
+                checkpoints.append((balance, total_interest_paid))
+
+            balance, interest, _ = _month_step(
+                balance,
+                self._standard_payment
+                + (
+                    monthly_overpayment
+                    if months_to_repay >= change_month
+                    else self.monthly_overpayment
+                ),
+                self.lump_sum_payment
+                if months_to_repay == self.lump_sum_payment_month
+                else 0,
+                self._interest_rate_dec,
+                self._days_in_year[months_to_repay - 1],
+                self._days_in_month[months_to_repay - 1],
+            )
+            total_interest_paid += interest
+
+            if months_to_repay >= self.mortgage_length_months:
+                break
+
+        count(
+            "projection.OverpaymentProjection.months",
+            months_to_repay - month + 1,
+        )
+        return {
+            "time to repay (months)": months_to_repay,
+            "time saved (months)": self.mortgage_length_months
+            - months_to_repay,
+            "total interest paid (£)": round(total_interest_paid, 2),
+        }
+
+    def result(self) -> dict:
+        """Impact of the base overpayments.
+
+        Returns:
+            (dict): the same impact details as
+                `calculator.capital_overpayment`.
+        """
+        return dict(self._result)
+
+    def reproject(self, monthly_overpayment: float, from_month: int) -> dict:
+        """Impact of changing the monthly overpayment from a month onward,
+        keeping the base overpayments before it.
+
+        Args:
+            monthly_overpayment (float): new monthly overpayment amount.
+            from_month (int): first month (1-based index) of the new monthly
+                overpayment.
+
+        Raises:
+            IncorrectType: If from_month is not a positive integer.
+
+        Returns:
+            (dict): the same impact details as
+                `calculator.capital_overpayment`.
+        """
+        if not isinstance(from_month, int) or from_month < 1:
+            raise IncorrectType("from_month must be a positive integer.")
+
+        # the mortgage is repaid before the change
+        if from_month > self._result["time to repay (months)"]:
+            return self.result()
+
+        index = (from_month - 1) // self.checkpoint_every
+        balance, total_interest_paid = self._checkpoints[index]
+        return self._project(
+            month=index * self.checkpoint_every + 1,
+            balance=balance,
+            total_interest_paid=total_interest_paid,
+            change_month=from_month,
+            monthly_overpayment=monthly_overpayment,
+        )
@@ -0,0 +1,175 @@
+"""Overpayment scenario runner for mortgagepy package."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from math import ceil
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from . import dates
+from .batch import capital_overpayment
+from .exceptions import IncorrectType
+from .mortgage import MortgageBase
+from .portfolio import MortgagePortfolio
+
+STRATEGY_KEYS = frozenset(
+    ("monthly_overpayment", "lump_sum_payment", "lump_sum_payment_month")
+)
+
+
+def _loan_arrays(
+    loans: Union[MortgagePortfolio, Iterable[MortgageBase]],
+) -> tuple:
+    """Mortgage, interest rate and term arrays of the loans.
+
+    Args:
+        loans (MortgagePortfolio | Iterable[MortgageBase]): loans to extract.
+
+    Raises:
+        IncorrectType: If any of the loans are interest only.
+
+    Returns:
+        (tuple): mortgages, interest rates and terms as float64 arrays.
+    """
+    if not isinstance(loans, MortgagePortfolio):
+        loans = MortgagePortfolio.from_mortgages(loans)
+    if loans.interest_only.any():
+        raise IncorrectType(
+            "Overpayment scenarios only apply to capital repayment "
+            "mortgages, interest only loans at indices "
+            f"{np.flatnonzero(loans.interest_only).tolist()}."
+        )
+    return loans.mortgages, loans.interest_rates, loans.term_months
+
+
+def _run_chunk(
+    start: int,
+    mortgages: np.ndarray,
+    interest_rates: np.ndarray,
+    terms: np.ndarray,
+    strategies: list,
+    start_months: Optional[np.ndarray] = None,
+) -> list:
+    """Run every strategy over a chunk of loans.
+
+    Args:
+        start (int): index of the first loan of the chunk.
+        mortgages (np.ndarray): outstanding mortgage values.
+        interest_rates (np.ndarray): interest rates as a percentage.
+        terms (np.ndarray): original number of months of each mortgage.
+        strategies (list): keyword arguments of capital_overpayment for each
+            strategy.
+        start_months (np.ndarray, optional): first month of the projection,
+            or of each loan. Default is None which uses the current month.
+
+    Returns:
+        (list): (loan index, strategy index, result) for every loan and
+            strategy of the chunk.
+    """
+    results = []
+    for strategy_index, strategy in enumerate(strategies):
+        projection = capital_overpayment(
+            mortgages,
+            interest_rates,
+            terms,
+            start_date=start_months,
+            **strategy,
+        )
+        columns = [values.tolist() for values in projection.values()]
+        for offset, values in enumerate(zip(*columns)):
+            results.append(
+                (
+                    start + offset,
+                    strategy_index,
+                    dict(zip(projection.keys(), values)),
+                )
+            )
+    return results
+
+
+def run_overpayment_scenarios(
+    loans: Union[MortgagePortfolio, Iterable[MortgageBase]],
+    strategies: Iterable[dict],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    start_date: Optional[npt.ArrayLike] = None,
+) -> Iterator[tuple]:
+    """Project every overpayment strategy for every loan, sharing the work
+    across a pool of processes.
+
+    Loans are sent to the workers in chunks, as arrays, to keep the pickling
+    overhead small, and each chunk is projected with the vectorised engine
+    so the results are exactly those of `calculator.capital_overpayment`.
+    Results are yielded as each chunk finishes, so their order is not fixed.
+
+    Args:
+        loans (MortgagePortfolio | Iterable[MortgageBase]): capital repayment
+            mortgages to project.
+        strategies (Iterable[dict]): keyword arguments of
+            `calculator.capital_overpayment` for each strategy, any of
+            "monthly_overpayment", "lump_sum_payment" and
+            "lump_sum_payment_month".
+        workers (int, optional): number of processes. Default is None which
+            uses every CPU, 1 runs in the current process.
+        chunk_size (int, optional): number of loans per task. Default is None
+            which gives each worker about four tasks.
+        start_date (ArrayLike, optional): date of the first month of the
+            projections, or of each loan. Default is None which uses the
+            current month, fixed once for every chunk.
+
+    Raises:
+        IncorrectType: If any of the loans are interest only or a strategy
+            has an unknown key.
+
+    Yields:
+        (tuple): loan index, strategy index and the capital_overpayment
+            result of the pair.
+    """
+    mortgages, interest_rates, terms = _loan_arrays(loans)
+    strategies = [dict(strategy) for strategy in strategies]
+    for strategy in strategies:
+        unknown = set(strategy) - STRATEGY_KEYS
+        if unknown:
+            raise IncorrectType(
+                f"Unknown strategy keys {sorted(unknown)}, expected any of "
+                f"{sorted(STRATEGY_KEYS)}."
+            )
+
+    start_months = dates.to_months(
+        datetime.now() if start_date is None else start_date
+    )
+    if start_months.ndim:
+        start_months = np.broadcast_to(start_months, mortgages.shape)
+
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, ceil(len(mortgages) / (workers * 4)))
+    chunks = [
+        (
+            start,
+            mortgages[start : start + chunk_size],
+            interest_rates[start : start + chunk_size],
+            terms[start : start + chunk_size],
+            strategies,
+            start_months[start : start + chunk_size]
+            if start_months.ndim
+            else start_months,
+        )
+        for start in range(0, len(mortgages), chunk_size)
+    ]
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _run_chunk(*chunk)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_run_chunk, *chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
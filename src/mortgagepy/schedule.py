@@ -0,0 +1,302 @@
+"""Amortisation schedules module for mortgagepy package."""
+
+from datetime import date
+from math import ceil
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .batch import SCHEDULE_FIELDS, _project
+from .calculator import _month_step, monthly_capital_repayment
+from .daycount import DEFAULT_CONVENTION, DateLike, day_counts, start_month
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+class ScheduleRow(NamedTuple):
+    """A single month of an amortisation schedule."""
+
+    date: date
+    opening_balance: float
+    interest: float
+    principal: float
+    overpayment: float
+    closing_balance: float
+
+
+def iter_schedule(
+    mortgage: float,
+    interest_rate: float,
+    mortgage_length_months: int,
+    monthly_overpayment: float = 0,
+    lump_sum_payment: float = 0,
+    lump_sum_payment_month: int = 1,
+    day_count: str = DEFAULT_CONVENTION,
+    start_date: Optional[DateLike] = None,
+) -> Iterator[ScheduleRow]:
+    """Lazily generate the month by month schedule of a capital repayment
+    mortgage, following the same rules as `calculator.capital_overpayment`.
+
+    Rows are produced one at a time so a schedule can be streamed or stopped
+    early without building the whole schedule.
+
+    Args:
+        mortgage (float): outstanding mortgage value.
+        interest_rate (float): interest rate as a percentage.
+        mortgage_length_months (int): original number of months of the
+            mortgage.
+        monthly_overpayment (float, optional): additional monthly overpayment
+            amount. Default is 0.
+        lump_sum_payment (float, optional): one-time lump sum payment amount.
+            Default is 0.
+        lump_sum_payment_month (int, optional): the month in which the lump
+            sum payment is made. Default is 1.
+        day_count (str, optional): day count convention of the daily
+            interest. Default is "actual/actual".
+        start_date (DateLike, optional): date of the first month of the
+            schedule. Default is None which uses the current month.
+
+    Yields:
+        (ScheduleRow): the schedule of the next month.
+    """
+    standard_payment = monthly_capital_repayment(
+        mortgage, interest_rate, mortgage_length_months
+    )
+    total_payment = standard_payment + monthly_overpayment
+    interest_rate_dec = interest_rate / 100
+
+    year, month = start_month(start_date)
+    days_in_month, days_in_year = day_counts(
+        max(1, ceil(mortgage_length_months)),
+        month=month,
+        year=year,
+        convention=day_count,
+    )
+
+    remaining_balance = mortgage
+    months_to_repay = 0
+
+    while remaining_balance > 0:
+        months_to_repay += 1
+        opening_balance = remaining_balance
+        lump_sum = (
+            lump_sum_payment
+            if months_to_repay == lump_sum_payment_month
+            else 0
+        )
+
+        remaining_balance, interest, payment = _month_step(
+            remaining_balance,
+            total_payment,
+            lump_sum,
+            interest_rate_dec,
+            days_in_year[months_to_repay - 1],
+            days_in_month[months_to_repay - 1],
+        )
+        if remaining_balance < 0:
+            yield ScheduleRow(
+                date(year, month, 1), opening_balance, 0, 0, opening_balance, 0
+            )
+            return
+
+        regular_payment = min(standard_payment, payment)
+        yield ScheduleRow(
+            date=date(year, month, 1),
+            opening_balance=opening_balance,
+            interest=interest,
+            principal=regular_payment - interest,
+            overpayment=lump_sum + payment - regular_payment,
+            closing_balance=max(remaining_balance, 0),
+        )
+
+        if months_to_repay >= mortgage_length_months:
+            return
+
+        month += 1
+
+        if month > 12:
+            month = 1
+            year += 1
+
+
+def amortisation_schedule(
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+    monthly_overpayment: npt.ArrayLike = 0,
+    lump_sum_payment: npt.ArrayLike = 0,
+    lump_sum_payment_month: npt.ArrayLike = 1,
+    day_count: str = DEFAULT_CONVENTION,
+    start_date: Optional[npt.ArrayLike] = None,
+) -> dict:
+    """Full month by month schedule of one or many capital repayment
+    mortgages, including the impact of overpayments and a lump sum payment.
+
+    The schedule follows the same rules as `calculator.capital_overpayment`.
+    Months after a mortgage is repaid are left as zeros.
+
+    Args:
+        mortgages (ArrayLike): outstanding mortgage values.
+        interest_rates (ArrayLike): interest rates as a percentage, or a 2-D
+            (mortgage, month) rate path from `batch.rate_path`, recalculating
+            the repayment whenever the rate changes.
+        mortgage_length_months (ArrayLike): original number of months of
+            each mortgage.
+        monthly_overpayment (ArrayLike, optional): additional monthly
+            overpayment amounts. Default is 0.
+        lump_sum_payment (ArrayLike, optional): one-time lump sum payment
+            amounts. Default is 0.
+        lump_sum_payment_month (ArrayLike, optional): the month in which each
+            lump sum payment is made. Default is 1.
+        day_count (str, optional): day count convention of the daily
+            interest. Default is "actual/actual".
+        start_date (ArrayLike, optional): date of the first month of the
+            schedule, or of each mortgage. Default is None which uses the
+            current month.
+
+    Returns:
+        (dict): "months_to_repay" for each mortgage, the "date" of each
+            month (2-D when mortgages start in different months) and an
+            array per month for each of "opening_balance",
+            "interest", "principal", "overpayment" and "closing_balance".
+            Arrays are 1-D for a single mortgage and 2-D (mortgage, month)
+            otherwise.
+    """
+    single = all(
+        np.ndim(arg) == 0
+        for arg in (
+            mortgages,
+            interest_rates,
+            mortgage_length_months,
+            monthly_overpayment,
+            lump_sum_payment,
+            lump_sum_payment_month,
+            start_date,
+        )
+    )
+
+    projection = _project(
+        mortgages,
+        interest_rates,
+        mortgage_length_months,
+        monthly_overpayment=monthly_overpayment,
+        lump_sum_payment=lump_sum_payment,
+        lump_sum_payment_month=lump_sum_payment_month,
+        record=True,
+        day_count=day_count,
+        start_date=start_date,
+    )
+
+    dates = (
+        np.expand_dims(projection["start_month"], -1)
+        + np.arange(projection["interest"].shape[1])
+    ).astype("datetime64[D]")
+
+    if single:
+        months_to_repay = int(projection["months_to_repay"][0])
+        schedule = {
+            "months_to_repay": months_to_repay,
+            "date": dates[:months_to_repay],
+        }
+        for field in SCHEDULE_FIELDS:
+            schedule[field] = projection[field][0, :months_to_repay]
+    else:
+        schedule = {
+            "months_to_repay": projection["months_to_repay"],
+            "date": dates,
+        }
+        for field in SCHEDULE_FIELDS:
+            schedule[field] = projection[field]
+
+    return schedule
+
+
+def _columns(schedule: dict) -> dict:
+    """Flatten a schedule from `amortisation_schedule` into contiguous 1-D
+    columns with one entry per month of each mortgage, dropping the months
+    after a mortgage has been repaid.
+
+    Args:
+        schedule (dict): schedule of one or many mortgages.
+
+    Returns:
+        (dict): column name to 1-D array.
+    """
+    if np.ndim(schedule["months_to_repay"]) == 0:
+        columns = {
+            "month": np.arange(1, schedule["months_to_repay"] + 1),
+            "date": schedule["date"],
+        }
+        for field in SCHEDULE_FIELDS:
+            columns[field] = np.ascontiguousarray(schedule[field])
+        return columns
+
+    months_to_repay = schedule["months_to_repay"]
+    n_months = schedule["interest"].shape[1]
+    in_schedule = np.arange(n_months) < months_to_repay[:, np.newaxis]
+    loans, months = np.nonzero(in_schedule)
+
+    columns = {
+        "loan": loans,
+        "month": months + 1,
+        "date": schedule["date"][in_schedule]
+        if schedule["date"].ndim == 2
+        else schedule["date"][months],
+    }
+    for field in SCHEDULE_FIELDS:
+        columns[field] = schedule[field][in_schedule]
+
+    return columns
+
+
+def to_records(schedule: dict) -> np.ndarray:
+    """Convert a schedule into a NumPy structured array with one record per
+    month of each mortgage.
+
+    Args:
+        schedule (dict): schedule from `amortisation_schedule`.
+
+    Returns:
+        (np.ndarray): structured array with "month", "date" and a float64
+            field for each of SCHEDULE_FIELDS, plus a "loan" index field for a
+            schedule of many mortgages.
+    """
+    columns = _columns(schedule)
+    records = np.empty(
+        len(columns["month"]),
+        dtype=[(name, values.dtype) for name, values in columns.items()],
+    )
+    for name, values in columns.items():
+        records[name] = values
+
+    return records
+
+
+def to_arrow(schedule: dict) -> "pyarrow.Table":
+    """Convert a schedule into a pyarrow Table with one row per month of
+    each mortgage.
+
+    The float64 columns are handed to Arrow without copying, so the table can
+    be passed on to pandas, Polars or a Parquet writer cheaply. Requires the
+    optional pyarrow dependency, `pip install mortgagepy[arrow]`.
+
+    Args:
+        schedule (dict): schedule from `amortisation_schedule`.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Returns:
+        (pyarrow.Table): table with the same columns as `to_records`.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as err:
+        raise ImportError(
+            "to_arrow requires pyarrow, install it with "
+            "'pip install mortgagepy[arrow]'."
+        ) from err
+
+    return pa.table(_columns(schedule))
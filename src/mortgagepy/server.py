@@ -0,0 +1,295 @@
+"""Asynchronous quote service for mortgagepy package.
+
+`QuoteServer` is a dependency free ASGI application, which can be served by
+any ASGI server such as uvicorn, `uvicorn mortgagepy.server:app`, or called
+in-process by an ASGI client such as `httpx.ASGITransport`.
+
+Quotes which arrive within a short window of each other are coalesced into a
+single batch and priced with one vectorised call, so the cost of a quote is
+a few array elements rather than a mortgage object and its scalar maths.
+
+Routes:
+    POST /quote: JSON object with "property_value", "mortgage",
+        "term_months", "interest_rate" and optionally "interest_only",
+        returning the mortgage summary.
+    GET /metrics: number of quotes and batches, and the p50 and p99
+        latency of the recent quotes in milliseconds.
+"""
+
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+import numpy as np
+
+from .exceptions import IncorrectType
+from .io import REQUIRED_COLUMNS, reprice
+
+
+def _validate_quote(quote: object) -> dict:
+    """Validate the body of a quote request.
+
+    Args:
+        quote (object): decoded JSON body.
+
+    Raises:
+        IncorrectType: If the body is not an object of finite positive
+            numbers.
+
+    Returns:
+        (dict): the loan of the quote.
+    """
+    if not isinstance(quote, dict):
+        raise IncorrectType("Quote must be a JSON object.")
+    for name in REQUIRED_COLUMNS:
+        value = quote.get(name)
+        if isinstance(value, bool) or not isinstance(value, (float, int)):
+            raise IncorrectType(
+                f"{name} must be float or int, got {type(value).__name__}"
+            )
+        # JSON decoding accepts NaN and Infinity
+        if not (math.isfinite(value) and value > 0):
+            raise IncorrectType(f"{name} must be a finite positive number.")
+    if not isinstance(quote.get("interest_only", False), bool):
+        raise IncorrectType("interest_only must be true or false.")
+    return quote
+
+
+def _summaries(quotes: list) -> list:
+    """Summaries of a batch of quotes, the same as the `summarise` method of
+    `CapitalRepaymentMortgage` or `InterestOnlyMortgage`.
+
+    Args:
+        quotes (list): validated quotes.
+
+    Returns:
+        (list): summary of each quote.
+    """
+    loans = {
+        name: np.array([quote[name] for quote in quotes], dtype=np.float64)
+        for name in REQUIRED_COLUMNS
+    }
+    loans["interest_only"] = np.array(
+        [quote.get("interest_only", False) for quote in quotes], dtype=bool
+    )
+    columns = {
+        name: values.tolist()
+        for name, values in {**loans, **reprice(loans)}.items()
+    }
+
+    summaries = []
+    for values in zip(*columns.values()):
+        row = dict(zip(columns, values))
+        summary = {
+            "property value (£)": row["property_value"],
+            "mortgage (£)": row["mortgage"],
+            "loan to value (%)": row["ltv"],
+            "monthly repayment (£)": row["monthly_repayment"],
+            "term (months)": row["term_months"],
+            "interest rate (%)": row["interest_rate"],
+        }
+        if not row["interest_only"]:
+            summary["interest paid (£)"] = row["interest_paid"]
+        summary["total cost (£)"] = row["total_cost"]
+        summaries.append(summary)
+    return summaries
+
+
+class QuoteBatcher:
+    """Coalesce concurrent quotes into vectorised batches.
+
+    The first quote of a batch starts a timer of `max_wait` seconds, and the
+    batch is priced when the timer fires or `max_batch_size` quotes are
+    waiting, whichever is first.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 512,
+        max_wait: float = 0.002,
+        latency_window: int = 10_000,
+    ) -> None:
+        """Initialises the QuoteBatcher class.
+
+        Args:
+            max_batch_size (int, optional): maximum number of quotes priced
+                together. Default is 512.
+            max_wait (float, optional): seconds the first quote of a batch
+                waits for others to join it. Default is 0.002.
+            latency_window (int, optional): number of recent quotes kept for
+                the latency percentiles. Default is 10_000.
+
+        Raises:
+            ValueError: If max_batch_size is not positive.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer.")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.quotes = 0
+        self.batches = 0
+        self._pending = []
+        self._timer = None
+        self._latencies = deque(maxlen=latency_window)
+
+    async def quote(self, quote: dict) -> dict:
+        """Price a quote as part of the next batch.
+
+        Args:
+            quote (dict): validated quote.
+
+        Returns:
+            (dict): summary of the quote.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        future = loop.create_future()
+        self._pending.append((quote, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        summary = await future
+        self._latencies.append(time.perf_counter() - start)
+        return summary
+
+    def _flush(self) -> None:
+        """Price every pending quote in one vectorised call."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        self.quotes += len(pending)
+        self.batches += 1
+        try:
+            summaries = _summaries([quote for quote, _ in pending])
+        except Exception as error:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), summary in zip(pending, summaries):
+            if not future.done():
+                future.set_result(summary)
+
+    def metrics(self) -> dict:
+        """Quote counts and latency percentiles of the recent quotes.
+
+        Returns:
+            (dict): number of "quotes" and "batches", and the "p50 (ms)" and
+                "p99 (ms)" latency, None before the first quote.
+        """
+        p50 = p99 = None
+        if self._latencies:
+            p50, p99 = (
+                np.percentile(np.fromiter(self._latencies, float), [50, 99])
+                * 1000
+            ).tolist()
+        return {
+            "quotes": self.quotes,
+            "batches": self.batches,
+            "p50 (ms)": p50,
+            "p99 (ms)": p99,
+        }
+
+
+class QuoteServer:
+    """ASGI application serving batched mortgage quotes."""
+
+    def __init__(
+        self,
+        max_batch_size: int = 512,
+        max_wait: float = 0.002,
+    ) -> None:
+        """Initialises the QuoteServer class.
+
+        Args:
+            max_batch_size (int, optional): maximum number of quotes priced
+                together. Default is 512.
+            max_wait (float, optional): seconds the first quote of a batch
+                waits for others to join it. Default is 0.002.
+        """
+        self.batcher = QuoteBatcher(
+            max_batch_size=max_batch_size, max_wait=max_wait
+        )
+
+    async def __call__(
+        self,
+        scope: dict,
+        receive: Callable[[], Awaitable[dict]],
+        send: Callable[[dict], Awaitable[None]],
+    ) -> None:
+        """Handle an ASGI connection.
+
+        Args:
+            scope (dict): connection scope.
+            receive (Callable): coroutine receiving the request messages.
+            send (Callable): coroutine sending the response messages.
+        """
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        route = scope["method"], scope["path"]
+        if route == ("GET", "/metrics"):
+            await self._respond(send, 200, self.batcher.metrics())
+        elif route == ("POST", "/quote"):
+            body = await self._read_body(receive)
+            try:
+                quote = _validate_quote(json.loads(body))
+            except (IncorrectType, ValueError) as error:
+                await self._respond(send, 400, {"error": str(error)})
+                return
+            await self._respond(send, 200, await self.batcher.quote(quote))
+        elif scope["path"] in ("/metrics", "/quote"):
+            await self._respond(send, 405, {"error": "Method not allowed."})
+        else:
+            await self._respond(send, 404, {"error": "Not found."})
+
+    @staticmethod
+    async def _read_body(receive: Callable[[], Awaitable[dict]]) -> bytes:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                return body
+
+    @staticmethod
+    async def _respond(
+        send: Callable[[dict], Awaitable[None]],
+        status: int,
+        content: Optional[dict],
+    ) -> None:
+        body = json.dumps(content, ensure_ascii=False).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+app = QuoteServer()
@@ -0,0 +1,334 @@
+"""Inverse mortgage calculations module for mortgagepy package.
+
+Each solver answers the reverse of a question in `mortgagepy.calculator`,
+such as the largest mortgage a monthly budget can repay. Mortgage amount and
+term have closed forms, corrected for the rounding of the repayment to the
+penny, and the interest rate is found with Newton's method.
+Every solver accepts scalars or NumPy arrays, which are broadcast against
+each other. It returns a `Solution` of floats for scalar inputs and of
+arrays otherwise.
+"""
+
+from typing import NamedTuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from . import batch
+from .mortgage import _validate_columns
+
+
+class Solution(NamedTuple):
+    """Result of a solver."""
+
+    value: Union[float, np.ndarray]
+    iterations: Union[int, np.ndarray]
+    converged: Union[bool, np.ndarray]
+
+
+def _broadcast(*values: npt.ArrayLike) -> tuple:
+    """Broadcast the inputs as float64 arrays of at least one dimension, and
+    whether they were all scalars."""
+    scalar = all(np.ndim(value) == 0 for value in values)
+    arrays = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(value, dtype=np.float64))
+            for value in values
+        )
+    )
+    return scalar, arrays
+
+
+def _check(arrays: dict, allow_zero: bool = False) -> None:
+    """Check every value is finite and positive, or zero as well if
+    `allow_zero`, with the same rule as the mortgage classes.
+
+    Raises:
+        IncorrectType: If any value is not, with `errors` mapping each
+            offending input to its flat indices.
+    """
+    _validate_columns(
+        {name: array.ravel() for name, array in arrays.items()},
+        allow_zero=allow_zero,
+    )
+
+
+def _solution(
+    scalar: bool,
+    value: np.ndarray,
+    iterations: np.ndarray,
+    converged: np.ndarray,
+) -> Solution:
+    """Solution of plain Python scalars when the inputs were scalars."""
+    if scalar:
+        return Solution(
+            float(value.item()), int(iterations.item()), bool(converged.item())
+        )
+    return Solution(value, iterations, converged)
+
+
+def _annuity_factor(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Monthly repayment per pound borrowed at monthly rate r over n months,
+    1/n when r is 0."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(r == 0, 1 / n, r / -np.expm1(-n * np.log1p(r)))
+
+
+def _repayment(
+    mortgages: np.ndarray, interest_rates: np.ndarray, terms: np.ndarray
+) -> np.ndarray:
+    """Rounded monthly repayments, mortgage/term when the rate is 0."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            interest_rates == 0,
+            batch._round(mortgages / terms),
+            batch.monthly_capital_repayment(mortgages, interest_rates, terms),
+        )
+
+
+def max_mortgage(
+    monthly_payments: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+    max_iter: int = 10,
+) -> Solution:
+    """Largest capital repayment mortgage, to the penny, whose monthly
+    repayment from `calculator.monthly_capital_repayment` does not exceed
+    the monthly payment.
+
+    P = (A+0.005)*((1+r)^n-1)/(r(1+r)^n)
+
+    As the repayment is rounded to the penny, the closed form is taken at
+    the largest unrounded repayment which rounds to the payment and then
+    lowered a penny at a time, while the rounded repayment is above the
+    payment. Each penny is counted as an iteration.
+
+    Args:
+        monthly_payments (ArrayLike): affordable monthly payments.
+        interest_rates (ArrayLike): interest rates as a percentage.
+        mortgage_length_months (ArrayLike): terms in months.
+        max_iter (int, optional): maximum number of penny corrections.
+            Default is 10.
+
+    Raises:
+        IncorrectType: If a payment or term is not finite and positive, or
+            a rate is negative or not finite.
+
+    Returns:
+        (Solution): maximum mortgages and the corrections each took.
+    """
+    scalar, (payments, interest_rates, terms) = _broadcast(
+        monthly_payments, interest_rates, mortgage_length_months
+    )
+    _check({"monthly_payments": payments, "mortgage_length_months": terms})
+    _check({"interest_rates": interest_rates}, allow_zero=True)
+
+    mortgages = (payments + 0.005) / _annuity_factor(
+        (interest_rates / 100) / 12, terms
+    )
+    mortgages = np.floor(mortgages * 100) / 100
+    iterations = np.zeros(mortgages.shape, dtype=np.int64)
+    converged = ~np.isfinite(mortgages)
+
+    for _ in range(max_iter + 1):
+        converged |= _repayment(mortgages, interest_rates, terms) <= np.round(
+            payments, 2
+        )
+        if converged.all():
+            break
+        mortgages = np.where(
+            converged, mortgages, np.round(mortgages - 0.01, 2)
+        )
+        iterations += ~converged
+
+    return _solution(
+        scalar, mortgages, iterations, converged & np.isfinite(mortgages)
+    )
+
+
+def required_term(
+    monthly_payments: npt.ArrayLike,
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    max_iter: int = 10,
+) -> Solution:
+    """Shortest whole number of months over which the monthly repayment from
+    `calculator.monthly_capital_repayment` does not exceed the monthly
+    payment.
+
+    n = -log(1-rP/(A+0.005))/log(1+r)
+
+    As the repayment is rounded to the penny, the closed form is taken at
+    the largest unrounded repayment which rounds to the payment and then
+    raised a month at a time, while the rounded repayment is above the
+    payment. Each month is counted as an iteration.
+
+    Args:
+        monthly_payments (ArrayLike): affordable monthly payments.
+        mortgages (ArrayLike): mortgage values.
+        interest_rates (ArrayLike): interest rates as a percentage.
+        max_iter (int, optional): maximum number of month corrections.
+            Default is 10.
+
+    Raises:
+        IncorrectType: If a payment or mortgage is not finite and positive,
+            or a rate is negative or not finite.
+
+    Returns:
+        (Solution): terms in months and the corrections each took. The term
+            is infinite, and not converged, when the payment does not cover
+            the first month's interest.
+    """
+    scalar, (payments, mortgages, interest_rates) = _broadcast(
+        monthly_payments, mortgages, interest_rates
+    )
+    _check({"monthly_payments": payments, "mortgages": mortgages})
+    _check({"interest_rates": interest_rates}, allow_zero=True)
+
+    r = (interest_rates / 100) / 12
+    bound = payments + 0.005
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(
+            r == 0,
+            mortgages / bound,
+            -np.log1p(-r * mortgages / bound) / np.log1p(r),
+        )
+    terms = np.ceil(np.where(bound > r * mortgages, terms, np.inf))
+    iterations = np.zeros(terms.shape, dtype=np.int64)
+    converged = ~np.isfinite(terms)
+
+    for _ in range(max_iter + 1):
+        converged |= _repayment(mortgages, interest_rates, terms) <= np.round(
+            payments, 2
+        )
+        if converged.all():
+            break
+        terms = np.where(converged, terms, terms + 1)
+        iterations += ~converged
+
+    return _solution(scalar, terms, iterations, converged & np.isfinite(terms))
+
+
+def implied_rate(
+    monthly_payments: npt.ArrayLike,
+    mortgages: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+    tol: float = 1e-12,
+    max_iter: int = 100,
+) -> Solution:
+    """Interest rate at which a capital repayment mortgage has the monthly
+    (unrounded) repayment.
+
+    The repayment is an increasing, convex function of the rate, so Newton's
+    method started from the rate A/P, which is always above the root,
+    decreases monotonically to it without overshooting.
+
+    Args:
+        monthly_payments (ArrayLike): monthly repayments.
+        mortgages (ArrayLike): mortgage values.
+        mortgage_length_months (ArrayLike): terms in months.
+        tol (float, optional): convergence tolerance of the monthly rate.
+            Default is 1e-12.
+        max_iter (int, optional): maximum number of Newton iterations.
+            Default is 100.
+
+    Raises:
+        IncorrectType: If a payment, mortgage or term is not finite and
+            positive.
+
+    Returns:
+        (Solution): interest rates as a percentage and the iterations each
+            took. The rate is nan, and not converged, when the payment does
+            not exceed the mortgage divided by the term, as that needs a rate
+            of zero or less.
+    """
+    scalar, (payments, mortgages, terms) = _broadcast(
+        monthly_payments, mortgages, mortgage_length_months
+    )
+    _check(
+        {
+            "monthly_payments": payments,
+            "mortgages": mortgages,
+            "mortgage_length_months": terms,
+        }
+    )
+
+    target = payments / mortgages
+    valid = target > 1 / terms
+    r = np.where(valid, target, np.nan)
+    iterations = np.zeros(r.shape, dtype=np.int64)
+    converged = np.zeros(r.shape, dtype=bool)
+    active = valid.copy()
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        ra, n = r[active], terms[active]
+        discount = np.exp(-n * np.log1p(ra))
+        denominator = -np.expm1(-n * np.log1p(ra))
+        factor = ra / denominator
+        slope = (denominator - ra * n * discount / (1 + ra)) / denominator**2
+        step = (factor - target[active]) / slope
+        # Newton never crosses the root from above, but guard against
+        # stepping out of the positive rates through rounding
+        r_new = np.where(ra - step > 0, ra - step, ra / 2)
+        r[active] = r_new
+        iterations[active] += 1
+        done = np.abs(step) <= tol * np.maximum(1.0, ra)
+        converged[np.flatnonzero(active)[done]] = True
+        active[np.flatnonzero(active)[done]] = False
+
+    return _solution(scalar, r * 12 * 100, iterations, converged)
+
+
+def break_even_rate(
+    mortgages: npt.ArrayLike,
+    interest_rates: npt.ArrayLike,
+    mortgage_length_months: npt.ArrayLike,
+    fees: npt.ArrayLike = 0,
+    other_fees: npt.ArrayLike = 0,
+    tol: float = 1e-12,
+    max_iter: int = 100,
+) -> Solution:
+    """Interest rate at which a second product costs the same over the term
+    as a product at the interest rate, after each product's fees. A second
+    product at a lower rate is the cheaper one.
+
+    Args:
+        mortgages (ArrayLike): mortgage values.
+        interest_rates (ArrayLike): interest rates of the first product as a
+            percentage.
+        mortgage_length_months (ArrayLike): terms in months.
+        fees (ArrayLike, optional): fees of the first product. Default is 0.
+        other_fees (ArrayLike, optional): fees of the second product.
+            Default is 0.
+        tol (float, optional): convergence tolerance of the monthly rate.
+            Default is 1e-12.
+        max_iter (int, optional): maximum number of Newton iterations.
+            Default is 100.
+
+    Raises:
+        IncorrectType: If a mortgage or term is not finite and positive, or
+            a rate is negative or not finite.
+
+    Returns:
+        (Solution): break-even interest rates of the second product as a
+            percentage and the iterations each took.
+    """
+    scalar, (mortgages, interest_rates, terms, fees, other_fees) = _broadcast(
+        mortgages, interest_rates, mortgage_length_months, fees, other_fees
+    )
+    _check({"mortgages": mortgages, "mortgage_length_months": terms})
+    _check({"interest_rates": interest_rates}, allow_zero=True)
+
+    payments = mortgages * _annuity_factor((interest_rates / 100) / 12, terms)
+    solution = implied_rate(
+        payments + (fees - other_fees) / terms,
+        mortgages,
+        terms,
+        tol=tol,
+        max_iter=max_iter,
+    )
+    if scalar:
+        return Solution(*(value.item() for value in solution))
+    return solution
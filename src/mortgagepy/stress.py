@@ -0,0 +1,282 @@
+"""Monte Carlo interest rate stress testing module for mortgagepy package.
+
+Rate paths are simulated with a mean reverting Vasicek model, or supplied
+from any other generator, and every path of a loan is projected together as
+a 2-D (path, month) computation by the vectorised engine, recalculating the
+repayment every month the rate changes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from math import ceil
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from . import batch, dates
+from .daycount import DateLike
+from .exceptions import IncorrectType
+from .mortgage import MortgageBase
+from .portfolio import MortgagePortfolio
+from .scenarios import _loan_arrays
+
+STRESS_KEYS = (
+    "total interest paid (£)",
+    "initial monthly repayment (£)",
+    "max monthly repayment (£)",
+    "payment shock (%)",
+)
+
+
+def vasicek_paths(
+    initial_rate: float,
+    mean_rate: npt.ArrayLike,
+    reversion_speed: float,
+    volatility: float,
+    n_paths: int,
+    n_months: int,
+    seed: Optional[int] = None,
+    floor: float = 0.01,
+) -> np.ndarray:
+    """Simulate monthly interest rate paths with the Vasicek model.
+
+    dr = a(b-r)dt + sigma dW
+
+    The model is stepped with its exact monthly transition, so the paths do
+    not depend on a discretisation step. A mean rate which varies by month
+    gives a Hull-White style model fitted to a forward curve.
+
+    Args:
+        initial_rate (float): interest rate of the first month as a
+            percentage.
+        mean_rate (ArrayLike): long term mean rate b as a percentage, or the
+            mean rate of every month.
+        reversion_speed (float): speed of mean reversion a, per year.
+        volatility (float): volatility sigma as a percentage, per year.
+        n_paths (int): number of paths to simulate.
+        n_months (int): number of months of each path.
+        seed (int, optional): seed of the random number generator. Default is
+            None which uses fresh entropy.
+        floor (float, optional): lowest interest rate of the paths as a
+            percentage. Default is 0.01.
+
+    Raises:
+        IncorrectType: If reversion_speed is not positive.
+
+    Returns:
+        (np.ndarray): 2-D (path, month) array of interest rates.
+    """
+    if reversion_speed <= 0:
+        raise IncorrectType("reversion_speed must be positive.")
+
+    dt = 1 / 12
+    decay = np.exp(-reversion_speed * dt)
+    step_volatility = volatility * np.sqrt(
+        (1 - decay**2) / (2 * reversion_speed)
+    )
+    mean_rate = np.broadcast_to(
+        np.asarray(mean_rate, dtype=np.float64), (n_months,)
+    )
+
+    shocks = np.random.default_rng(seed).standard_normal(
+        (n_months - 1, n_paths)
+    )
+    paths = np.empty((n_months, n_paths))
+    paths[0] = initial_rate
+    for month in range(1, n_months):
+        paths[month] = (
+            paths[month - 1] * decay
+            + mean_rate[month] * (1 - decay)
+            + step_volatility * shocks[month - 1]
+        )
+
+    return np.maximum(paths, floor).T.copy()
+
+
+def stress_test(
+    mortgage: float,
+    mortgage_length_months: int,
+    rate_paths: npt.ArrayLike,
+    chunk_size: int = 2_000,
+    start_date: Optional[DateLike] = None,
+) -> dict:
+    """Project a capital repayment mortgage along every rate path.
+
+    Paths are projected chunk_size at a time, so the (path, month) schedule
+    held in memory is bounded however many paths are simulated.
+
+    Args:
+        mortgage (float): outstanding mortgage value.
+        mortgage_length_months (int): number of months of the mortgage.
+        rate_paths (ArrayLike): 2-D (path, month) array of interest rates as
+            a percentage, the last rate carrying on if a path is shorter
+            than the term.
+        chunk_size (int, optional): number of paths projected at once.
+            Default is 2_000.
+        start_date (DateLike, optional): date of the first month of the
+            projection. Default is None which uses the current month.
+
+    Raises:
+        IncorrectType: If the rate paths are not a 2-D array.
+
+    Returns:
+        (dict): an array with a value per path of each of STRESS_KEYS, the
+            payment shock being the largest repayment over the first.
+    """
+    rate_paths = np.asarray(rate_paths, dtype=np.float64)
+    if rate_paths.ndim != 2:
+        raise IncorrectType("rate_paths must be a 2-D (path, month) array.")
+
+    results = {key: np.empty(len(rate_paths)) for key in STRESS_KEYS}
+    for start in range(0, len(rate_paths), chunk_size):
+        paths = rate_paths[start : start + chunk_size]
+        projection = batch._project(
+            mortgage,
+            paths,
+            mortgage_length_months,
+            record=True,
+            start_date=start_date,
+        )
+        # the regular repayment of each month, without any overpayment
+        repayments = batch._round(
+            projection["principal"] + projection["interest"]
+        )
+        initial = repayments[:, 0]
+        maximum = repayments.max(axis=1)
+
+        chunk = slice(start, start + len(paths))
+        results["total interest paid (£)"][chunk] = batch._round(
+            projection["total_interest_paid"]
+        )
+        results["initial monthly repayment (£)"][chunk] = initial
+        results["max monthly repayment (£)"][chunk] = maximum
+        results["payment shock (%)"][chunk] = np.round(
+            (maximum / initial - 1) * 100, 2
+        )
+
+    return results
+
+
+_worker_rate_paths = None
+
+
+def _init_worker(rate_paths: np.ndarray) -> None:
+    """Share the rate paths with a worker process once."""
+    global _worker_rate_paths
+    _worker_rate_paths = rate_paths
+
+
+def _stress_chunk(
+    start: int,
+    mortgages: np.ndarray,
+    terms: np.ndarray,
+    chunk_size: int,
+    rate_paths: Optional[np.ndarray] = None,
+    start_date: Optional[DateLike] = None,
+) -> list:
+    """Stress test a chunk of loans.
+
+    Args:
+        start (int): index of the first loan of the chunk.
+        mortgages (np.ndarray): outstanding mortgage values.
+        terms (np.ndarray): number of months of each mortgage.
+        chunk_size (int): number of paths projected at once.
+        rate_paths (np.ndarray, optional): rate paths. Default is None which
+            uses the paths shared with the worker.
+        start_date (DateLike, optional): date of the first month of the
+            projections. Default is None which uses the current month.
+
+    Returns:
+        (list): (loan index, result) for every loan of the chunk.
+    """
+    if rate_paths is None:
+        rate_paths = _worker_rate_paths
+    return [
+        (
+            start + offset,
+            stress_test(
+                mortgage,
+                term,
+                rate_paths,
+                chunk_size=chunk_size,
+                start_date=start_date,
+            ),
+        )
+        for offset, (mortgage, term) in enumerate(
+            zip(mortgages.tolist(), terms.tolist())
+        )
+    ]
+
+
+def run_stress_tests(
+    loans: Union[MortgagePortfolio, Iterable[MortgageBase]],
+    rate_paths: npt.ArrayLike,
+    workers: Optional[int] = None,
+    chunk_size: int = 2_000,
+    start_date: Optional[DateLike] = None,
+) -> Iterator[tuple]:
+    """Stress test every loan against the same rate paths, sharing the loans
+    across a pool of processes.
+
+    The rate paths are sent to each worker once, when it starts, rather than
+    with every task. Results are yielded as each loan finishes, so their
+    order is not fixed.
+
+    Args:
+        loans (MortgagePortfolio | Iterable[MortgageBase]): capital repayment
+            mortgages to stress, their own interest rates are replaced by the
+            rate paths.
+        rate_paths (ArrayLike): 2-D (path, month) array of interest rates.
+        workers (int, optional): number of processes. Default is None which
+            uses every CPU, 1 runs in the current process.
+        chunk_size (int, optional): number of paths projected at once.
+            Default is 2_000.
+        start_date (DateLike, optional): date of the first month of every
+            projection. Default is None which uses the current month, fixed
+            once for every loan.
+
+    Yields:
+        (tuple): loan index and the `stress_test` result of the loan.
+    """
+    mortgages, _, terms = _loan_arrays(loans)
+    rate_paths = np.asarray(rate_paths, dtype=np.float64)
+    start_month = dates.to_months(
+        datetime.now() if start_date is None else start_date
+    )
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        yield from _stress_chunk(
+            0,
+            mortgages,
+            terms,
+            chunk_size,
+            rate_paths=rate_paths,
+            start_date=start_month,
+        )
+        return
+
+    loans_per_task = max(1, ceil(len(mortgages) / (workers * 4)))
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(rate_paths,),
+    )
+    try:
+        futures = [
+            executor.submit(
+                _stress_chunk,
+                start,
+                mortgages[start : start + loans_per_task],
+                terms[start : start + loans_per_task],
+                chunk_size,
+                start_date=start_month,
+            )
+            for start in range(0, len(mortgages), loans_per_task)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
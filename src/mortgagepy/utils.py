@@ -1,15 +1,20 @@
 """Utility functions for the mortgagepy package."""
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from dateutil import relativedelta
+if TYPE_CHECKING:
+    from dateutil.relativedelta import relativedelta
 
 
 def mortgage_term_remaining(
     start_date: datetime, end_date: datetime
-) -> relativedelta:
+) -> "relativedelta":
     """Given two dates, work out the difference in years, months and days.
 
+    See `dates.months_between` and `dates.term_remaining` for arrays of
+    dates.
+
     Args:
         start_date (datetime): start date for the calculation.
         end_date (datetime): end date for the calculation.
@@ -17,4 +22,6 @@ def mortgage_term_remaining(
     Returns:
         (relativedelta): absolute difference in years, months and days.
     """
-    return abs(relativedelta.relativedelta(start_date, end_date))
+    from dateutil.relativedelta import relativedelta
+
+    return abs(relativedelta(start_date, end_date))
@@ -0,0 +1,208 @@
+"""pytest test cases for the mortgagepy.batch module."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from mortgagepy import batch, calculator
+from mortgagepy.exceptions import IncorrectType
+
+
+@pytest.fixture
+def loans() -> tuple:
+    """fixture for a small book of mortgages, rates and terms."""
+    rng = np.random.default_rng(42)
+    mortgages = np.round(rng.uniform(50_000, 1_000_000, 1_000), 2)
+    interest_rates = np.round(rng.uniform(0.5, 9.5, 1_000), 2)
+    terms = rng.integers(12, 481, 1_000)
+    return mortgages, interest_rates, terms
+
+
+def test_monthly_capital_repayment_matches_scalar(loans: tuple) -> None:
+    """check the batch capital repayment matches the scalar calculator."""
+    expected = [
+        calculator.monthly_capital_repayment(float(m), float(r), int(n))
+        for m, r, n in zip(*loans)
+    ]
+    np.testing.assert_array_equal(
+        batch.monthly_capital_repayment(*loans), expected
+    )
+
+
+def test_total_cost_of_mortgage_matches_scalar(loans: tuple) -> None:
+    """check the batch total cost matches the scalar calculator."""
+    expected = [
+        calculator.total_cost_of_mortgage(float(m), float(r), int(n))
+        for m, r, n in zip(*loans)
+    ]
+    np.testing.assert_array_equal(
+        batch.total_cost_of_mortgage(*loans), expected
+    )
+
+
+def test_monthly_interest_only_repayment_matches_scalar(loans: tuple) -> None:
+    """check the batch interest only repayment matches the scalar
+    calculator."""
+    mortgages, interest_rates, _ = loans
+    expected = [
+        calculator.monthly_interest_only_repayment(float(m), float(r))
+        for m, r in zip(mortgages, interest_rates)
+    ]
+    np.testing.assert_array_equal(
+        batch.monthly_interest_only_repayment(mortgages, interest_rates),
+        expected,
+    )
+
+
+def test_ltv_broadcasts() -> None:
+    """check the batch loan to value broadcasts a scalar property value."""
+    np.testing.assert_array_equal(
+        batch.ltv(property_values=100_000, deposits=[50_000, 10_000, 5_001]),
+        [50, 90, 94],
+    )
+
+
+def test_round_matches_builtin_on_halves() -> None:
+    """check values on a half penny round like the builtin round."""
+    values = np.array([0.125, 2.675, 1.005, 1_234_567.345, 0.5])
+    np.testing.assert_array_equal(
+        batch._round(values), [round(float(v), 2) for v in values]
+    )
+
+
+def test_capital_overpayment_matches_scalar(loans: tuple) -> None:
+    """check the batch overpayment projection matches the scalar
+    calculator."""
+    mortgages, interest_rates, terms = loans
+    monthly_overpayment = np.resize([0, 50, 250.5], mortgages.size)
+    lump_sum_payment = np.resize([0, 0, 10_000, 2_000_000], mortgages.size)
+    lump_sum_payment_month = np.resize([1, 6, 13], mortgages.size)
+
+    result = batch.capital_overpayment(
+        mortgages,
+        interest_rates,
+        terms,
+        monthly_overpayment=monthly_overpayment,
+        lump_sum_payment=lump_sum_payment,
+        lump_sum_payment_month=lump_sum_payment_month,
+    )
+    expected = [
+        calculator.capital_overpayment(
+            float(m), float(r), int(n), float(o), float(ls), int(lm)
+        )
+        for m, r, n, o, ls, lm in zip(
+            mortgages,
+            interest_rates,
+            terms,
+            monthly_overpayment,
+            lump_sum_payment,
+            lump_sum_payment_month,
+        )
+    ]
+
+    for key, values in result.items():
+        np.testing.assert_array_equal(values, [e[key] for e in expected])
+
+
+def test_rate_path() -> None:
+    """check rate paths from (start month, rate) segments."""
+    np.testing.assert_array_equal(
+        batch.rate_path([(1, 4.2), (4, 7.5)], 5), [[4.2, 4.2, 4.2, 7.5, 7.5]]
+    )
+    np.testing.assert_array_equal(
+        batch.rate_path(
+            [[(1, 4.2), (3, 7.5)], [(1, 3.9), (3, 3.9)], [(1, 5.0), (2, 6.0)]],
+            3,
+        ),
+        [[4.2, 4.2, 7.5], [3.9, 3.9, 3.9], [5.0, 6.0, 6.0]],
+    )
+
+    with pytest.raises(IncorrectType):
+        batch.rate_path([(2, 4.2)], 5)
+    with pytest.raises(IncorrectType):
+        batch.rate_path([4.2, 7.5], 5)
+
+
+def test_capital_overpayment_constant_rate_path(loans: tuple) -> None:
+    """check a constant rate path gives the single rate results."""
+    mortgages, interest_rates, terms = loans
+    paths = np.repeat(interest_rates[:, np.newaxis], 60, axis=1)
+
+    expected = batch.capital_overpayment(
+        mortgages, interest_rates, terms, monthly_overpayment=50
+    )
+    result = batch.capital_overpayment(
+        mortgages, paths, terms, monthly_overpayment=50
+    )
+
+    for key, values in expected.items():
+        np.testing.assert_array_equal(result[key], values)
+
+
+def test_capital_overpayment_reverting_rate(loans: tuple) -> None:
+    """check repayments are recalculated when a fixed rate reverts."""
+    mortgages, interest_rates, terms = (values[:50] for values in loans)
+    reset_months = np.arange(13, 63)
+    paths = batch.rate_path(
+        np.stack(
+            [
+                np.stack([np.ones(50), interest_rates], axis=1),
+                np.stack([reset_months, interest_rates + 2.5], axis=1),
+            ],
+            axis=1,
+        ),
+        int(terms.max()),
+    )
+
+    projection = batch._project(mortgages, paths, terms, record=True)
+    payments = projection["principal"] + projection["interest"]
+
+    for loan, reset in enumerate(reset_months):
+        if reset > projection["months_to_repay"][loan]:
+            continue
+        assert payments[loan, 0] == pytest.approx(
+            calculator.monthly_capital_repayment(
+                mortgages[loan], interest_rates[loan], terms[loan]
+            )
+        )
+        assert payments[loan, reset - 1] == pytest.approx(
+            calculator.monthly_capital_repayment(
+                projection["opening_balance"][loan, reset - 1],
+                interest_rates[loan] + 2.5,
+                terms[loan] - reset + 1,
+            )
+        )
+
+    # each loan is projected the same on its own as in the book
+    single = batch.capital_overpayment(mortgages[:1], paths[:1], terms[:1])
+    book = batch.capital_overpayment(mortgages, paths, terms)
+    for key, values in single.items():
+        assert values[0] == book[key][0]
+
+
+def test_capital_overpayment_start_dates(loans: tuple) -> None:
+    """check projections from explicit start dates, shared or per loan,
+    match the scalar calculator from the same dates."""
+    mortgages, interest_rates, terms = (values[:50] for values in loans)
+    start_dates = np.datetime64("2023-11-01") + np.arange(50) * 31
+
+    shared = batch.capital_overpayment(
+        mortgages, interest_rates, terms, 100, start_date=date(2024, 2, 1)
+    )
+    per_loan = batch.capital_overpayment(
+        mortgages, interest_rates, terms, 100, start_date=start_dates
+    )
+
+    for i, (m, r, n, start) in enumerate(
+        zip(mortgages, interest_rates, terms, start_dates.tolist())
+    ):
+        for result, start_date in (
+            (shared, date(2024, 2, 1)),
+            (per_loan, start),
+        ):
+            expected = calculator.capital_overpayment(
+                float(m), float(r), int(n), 100, start_date=start_date
+            )
+            for key, value in expected.items():
+                assert result[key][i] == value
@@ -0,0 +1,219 @@
+"""pytest test cases for the mortgagepy.cache module."""
+
+import time
+from datetime import date
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pytest
+
+from mortgagepy import CapitalRepaymentMortgage, cache, calculator
+from mortgagepy.cache import (
+    CacheInfo,
+    LRUCache,
+    SQLiteCache,
+    calculator_cache_info,
+    disable_calculator_cache,
+    disable_shared_cache,
+    enable_calculator_cache,
+    enable_shared_cache,
+    shared_cache_info,
+)
+from mortgagepy.daycount import register_convention, unregister_convention
+
+
+@pytest.fixture
+def shared_cache() -> Iterator[LRUCache]:
+    """fixture enabling the shared cache for a single test."""
+    yield enable_shared_cache(maxsize=8)
+    disable_shared_cache()
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """check the least recently used entry is evicted when full."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info() == CacheInfo(hits=3, misses=1, maxsize=2, currsize=2)
+
+
+def test_lru_cache_rejects_non_positive_maxsize() -> None:
+    """check a cache must be able to hold at least one entry."""
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_shared_cache_shares_results(shared_cache: LRUCache) -> None:
+    """check identical mortgages share results through the shared cache."""
+    for _ in range(3):
+        CapitalRepaymentMortgage(
+            property_value=280000,
+            mortgage=210000,
+            term_months=300,
+            interest_rate=1.8,
+        ).monthly_repayment()
+
+    assert shared_cache_info() == CacheInfo(
+        hits=2, misses=1, maxsize=8, currsize=1
+    )
+
+
+def test_shared_cache_disabled() -> None:
+    """check there are no statistics while the shared cache is disabled."""
+    assert shared_cache_info() is None
+
+
+@pytest.fixture
+def calculator_cache() -> Iterator[LRUCache]:
+    """fixture enabling the in memory calculator cache for a single test."""
+    yield enable_calculator_cache(maxsize=8)
+    disable_calculator_cache()
+
+
+def test_lru_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """check entries older than the time to live are misses."""
+    now = 1_000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = LRUCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    now += 11
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_calculator_cache_normalises_arguments(
+    calculator_cache: LRUCache,
+) -> None:
+    """check positional and keyword calls share a cached result."""
+    first = calculator.monthly_capital_repayment(130_500, 3.89, 300)
+    second = calculator.monthly_capital_repayment(
+        mortgage_length_months=300, interest_rate=3.89, mortgage=130_500
+    )
+
+    assert first == second == 680.93
+    assert calculator_cache_info() == CacheInfo(
+        hits=1, misses=1, maxsize=8, currsize=1
+    )
+
+
+def test_calculator_cache_unhashable_arguments(
+    calculator_cache: LRUCache,
+) -> None:
+    """check calls with arrays are calculated without being cached."""
+    repayment = calculator.monthly_capital_repayment(
+        np.array(130_500), 3.89, np.array(300)
+    )
+
+    assert repayment == 680.93
+    assert calculator_cache_info().currsize == 0
+
+
+def test_calculator_cache_convention_registered(
+    calculator_cache: LRUCache,
+) -> None:
+    """check re-registering a day count convention clears cached results."""
+    register_convention("test/360", lambda year, month: (30, 360))
+    try:
+        first = calculator.capital_overpayment(
+            200_000, 3.5, 300, day_count="test/360"
+        )
+        register_convention("test/360", lambda year, month: (31, 360))
+        second = calculator.capital_overpayment(
+            200_000, 3.5, 300, day_count="test/360"
+        )
+    finally:
+        unregister_convention("test/360")
+
+    assert second["total interest paid (£)"] > first["total interest paid (£)"]
+
+
+def test_calculator_cache_returns_copies(calculator_cache: LRUCache) -> None:
+    """check cached dictionaries can be modified by the caller."""
+    result = calculator.capital_overpayment(200_000, 3.5, 300, 100)
+    result["interest saved (£)"] = 0
+
+    assert calculator.capital_overpayment(200_000, 3.5, 300, 100) == {
+        key: value
+        for key, value in result.items()
+        if key != "interest saved (£)"
+    }
+
+
+def test_sqlite_cache_persists(tmp_path: Path) -> None:
+    """check results survive re-opening a SQLite backed calculator cache."""
+    path = tmp_path / "results.sqlite"
+    enable_calculator_cache(path=path)
+    expected = calculator.capital_overpayment(200_000, 3.5, 300, 100)
+    disable_calculator_cache()
+
+    cache = enable_calculator_cache(path=path)
+    try:
+        assert calculator.capital_overpayment(200_000, 3.5, 300, 100) == (
+            expected
+        )
+        assert cache.info() == CacheInfo(
+            hits=1, misses=0, maxsize=1024, currsize=2
+        )
+    finally:
+        disable_calculator_cache()
+
+
+def test_sqlite_cache_numpy_inputs(tmp_path: Path) -> None:
+    """check NumPy inputs, and the NumPy results they give, are stored."""
+    expected = calculator.capital_overpayment(
+        np.int64(200_000), 3.5, np.int64(300)
+    )
+    cache = enable_calculator_cache(path=tmp_path / "results.sqlite")
+    try:
+        for _ in range(2):
+            assert (
+                calculator.capital_overpayment(
+                    np.int64(200_000), 3.5, np.int64(300)
+                )
+                == expected
+            )
+        assert cache.info().hits == 1
+    finally:
+        disable_calculator_cache()
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """check the SQLite cache keeps at most maxsize entries."""
+    cache = SQLiteCache(tmp_path / "results.sqlite", maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+    cache.close()
+
+
+def test_calculator_cache_start_date(
+    calculator_cache: LRUCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """check projections from an explicit start date stay cached when the
+    month changes, and those from today do not."""
+    start_date = date(2024, 1, 1)
+    calculator.capital_overpayment(200_000, 3.5, 300, start_date=start_date)
+    calculator.capital_overpayment(200_000, 3.5, 300)
+
+    monkeypatch.setattr(cache, "_current_month", lambda: (2999, 1))
+    calculator.capital_overpayment(200_000, 3.5, 300, start_date=start_date)
+    calculator.capital_overpayment(200_000, 3.5, 300)
+
+    # the repayment is cached too, and hit by every projection after the
+    # first, only the projection from today is missed after the month ends
+    info = calculator_cache_info()
+    assert (info.hits, info.misses) == (3, 4)
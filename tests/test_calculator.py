@@ -1,8 +1,12 @@
 """pytest test cases for the mortgagepy.calculator module."""
 
+from datetime import date
+
+import numpy as np
 import pytest
 
 from mortgagepy.calculator import (
+    capital_overpayment,
     ltv,
     monthly_capital_repayment,
     monthly_interest,
@@ -43,6 +47,10 @@ def test_monthly_interest() -> None:
         == november_debit_interest
     )
 
+    for month in (0, 13):
+        with pytest.raises(ValueError, match="must be 1-12"):
+            monthly_interest(october_balance, 1.89, month=month, year=2023)
+
 
 def test_ltv_calculator() -> None:
     """check if the loan to value ratio is calculated correctly."""
@@ -81,3 +89,17 @@ def test_total_cost_of_mortgage(mortgage: int) -> None:
         )
         == 273_963.0
     )
+
+
+def test_capital_overpayment_start_date() -> None:
+    """check start dates as strings and datetime64 values project from the
+    same month as dates."""
+    expected = capital_overpayment(
+        200_000, 3.5, 300, 100, start_date=date(2024, 2, 1)
+    )
+
+    for start_date in ("2024-02-20", np.datetime64("2024-02")):
+        assert (
+            capital_overpayment(200_000, 3.5, 300, 100, start_date=start_date)
+            == expected
+        )
@@ -0,0 +1,224 @@
+"""pytest test cases for the mortgagepy.cli module."""
+
+import io
+import json
+from datetime import date
+
+import pytest
+
+from mortgagepy.calculator import capital_overpayment
+from mortgagepy.cli import main
+from mortgagepy.compare import compare_capital_repayment_rates
+from mortgagepy.mortgage import CapitalRepaymentMortgage, InterestOnlyMortgage
+
+RECORDS = [
+    {
+        "property_value": 180_000,
+        "mortgage": 130_500,
+        "term_months": 300,
+        "interest_rate": 6.89,
+    },
+    {
+        "property_value": 400_000,
+        "mortgage": 200_000,
+        "term_months": 300,
+        "interest_rate": 3.5,
+        "interest_only": True,
+    },
+    {
+        "property_value": 250_000,
+        "mortgage": 210_000,
+        "term_months": 240,
+        "interest_rate": 1.8,
+        "monthly_overpayment": 150,
+    },
+]
+
+
+@pytest.fixture
+def jsonl(tmp_path: object) -> object:
+    """JSON Lines file of RECORDS."""
+    path = tmp_path / "loans.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in RECORDS))
+    return path
+
+
+def _run(capsys: object, argv: list) -> list:
+    assert main(argv) == 0
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_summarise(capsys: object, jsonl: object, workers: int) -> None:
+    """check summaries agree with the mortgage classes, in order."""
+    output = _run(
+        capsys,
+        [
+            "summarise",
+            str(jsonl),
+            "--workers",
+            str(workers),
+            "--chunk-size",
+            "1",
+        ],
+    )
+
+    expected = [
+        (
+            InterestOnlyMortgage
+            if "interest_only" in r
+            else CapitalRepaymentMortgage
+        )(
+            r["property_value"],
+            r["mortgage"],
+            r["term_months"],
+            r["interest_rate"],
+        ).summarise()
+        for r in RECORDS
+    ]
+    assert output == expected
+
+
+def test_overpay(capsys: object, tmp_path: object) -> None:
+    """check overpayments agree with overpayment_projection."""
+    records = [record for record in RECORDS if "interest_only" not in record]
+    path = tmp_path / "loans.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    output = _run(capsys, ["overpay", str(path)])
+
+    assert len(output) == len(records)
+    for record, result in zip(records, output):
+        projection = CapitalRepaymentMortgage(
+            record["property_value"],
+            record["mortgage"],
+            record["term_months"],
+            record["interest_rate"],
+        ).overpayment_projection(
+            monthly_overpayment=record.get("monthly_overpayment", 0)
+        )
+        assert result == {**record, **projection}
+        assert (
+            result["total interest paid (£)"]
+            == (
+                capital_overpayment(
+                    record["mortgage"],
+                    record["interest_rate"],
+                    record["term_months"],
+                    record.get("monthly_overpayment", 0),
+                )["total interest paid (£)"]
+            )
+        )
+
+
+def test_overpay_start_date(capsys: object, tmp_path: object) -> None:
+    """check overpayments are projected from --start-date."""
+    path = tmp_path / "loans.jsonl"
+    path.write_text(json.dumps(RECORDS[0]) + "\n")
+    (result,) = _run(
+        capsys, ["overpay", str(path), "--start-date", "2024-02-29"]
+    )
+
+    assert (
+        result["total interest paid (£)"]
+        == (
+            capital_overpayment(
+                RECORDS[0]["mortgage"],
+                RECORDS[0]["interest_rate"],
+                RECORDS[0]["term_months"],
+                start_date=date(2024, 2, 1),
+            )["total interest paid (£)"]
+        )
+    )
+    with pytest.raises(SystemExit):
+        main(["overpay", str(path), "--start-date", "2024-02-30"])
+
+
+def test_compare_csv_stdin(capsys: object, monkeypatch: object) -> None:
+    """check compare reads CSV from stdin."""
+    monkeypatch.setattr(
+        "sys.stdin", io.StringIO("mortgage,term_months\n200000,300\n")
+    )
+
+    (output,) = _run(
+        capsys, ["compare", "--format", "csv", "--rates", "3", "3.5"]
+    )
+
+    assert output["mortgage"] == "200000"
+    assert output["repayments"] == compare_capital_repayment_rates(
+        200_000, [3.0, 3.5], 300
+    )
+
+
+def test_reprice_and_errors(capsys: object, tmp_path: object) -> None:
+    """check reprice output and that invalid records are reported."""
+    path = tmp_path / "loans.csv"
+    path.write_text(
+        "property_value,mortgage,term_months,interest_rate\n"
+        "180000,130500,300,6.89\n"
+    )
+    (output,) = _run(capsys, ["reprice", str(path)])
+    assert output["monthly_repayment"] == 913.21
+    assert output["ltv"] == 72
+
+    path.write_text(
+        "property_value,mortgage,term_months,interest_rate\n"
+        "180000,130500,300,6.89\n"
+        "180000,n/a,300,6.89\n"
+    )
+    assert main(["reprice", str(path)]) == 1
+    assert "rows [2]" in capsys.readouterr().err
+
+    assert main(["summarise", str(tmp_path / "missing.csv")]) == 1
+    assert "No such file" in capsys.readouterr().err
+
+
+def test_overpay_interest_only(capsys: object, jsonl: object) -> None:
+    """check interest only records are rejected by overpay."""
+    assert main(["overpay", str(jsonl)]) == 1
+    assert "rows [2] are interest only" in capsys.readouterr().err
+
+
+def test_invalid_records(capsys: object, tmp_path: object) -> None:
+    """check records which are not objects or have non-finite or
+    non-positive values are rejected by row."""
+    path = tmp_path / "loans.jsonl"
+    path.write_text(json.dumps(RECORDS[0]) + "\n[1, 2]\n")
+    assert main(["summarise", str(path)]) == 1
+    assert "Line 2 must be a JSON object" in capsys.readouterr().err
+
+    for name, value in (("mortgage", "NaN"), ("term_months", "0")):
+        path.write_text(
+            json.dumps(RECORDS[0])
+            + "\n"
+            + json.dumps(RECORDS[0]).replace(
+                f'"{name}": {RECORDS[0][name]}', f'"{name}": {value}'
+            )
+            + "\n"
+        )
+        assert main(["summarise", str(path)]) == 1
+        assert "rows [2]" in capsys.readouterr().err
+
+    path.write_text(json.dumps({**RECORDS[0], "monthly_overpayment": -5}))
+    assert main(["overpay", str(path)]) == 1
+    assert "rows [1]" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        main(["compare", str(path), "--rates", "3.5", "nan"])
+
+
+def test_broken_pipe(
+    jsonl: object, monkeypatch: object, tmp_path: object
+) -> None:
+    """check a reader closing the pipe early ends quietly."""
+
+    with open(tmp_path / "stdout", "w") as file:
+
+        class ClosedPipe(io.StringIO):
+            def write(self, text: str) -> int:
+                raise BrokenPipeError
+
+            def fileno(self) -> int:
+                return file.fileno()
+
+        monkeypatch.setattr("sys.stdout", ClosedPipe())
+        assert main(["summarise", str(jsonl)]) == 1
@@ -1,10 +1,14 @@
 """pytest tests for the mortgagepy.compare module."""
 
+import numpy as np
 import pytest
 
+from mortgagepy.calculator import monthly_capital_repayment
 from mortgagepy.compare import (
     compare_capital_repayment_rates,
     compare_interest_only_rates,
+    sweep_capital_repayment_rates,
+    sweep_interest_only_rates,
 )
 from mortgagepy.exceptions import IncorrectType
 
@@ -43,3 +47,31 @@ def test_compare_interest_only_rates(mortgage: int) -> None:
         {"interest_rate": 1, "repayment": 108.75},
         {"interest_rate": 2, "repayment": 217.50},
     ]
+
+
+def test_sweep_capital_repayment_rates(mortgage: int) -> None:
+    """check the capital repayment sweep covers every combination."""
+    sweep = sweep_capital_repayment_rates(
+        mortgages=[mortgage, 200_000],
+        interest_rates=np.arange(1, 4),
+        mortgage_length_months=(240, 300),
+    )
+
+    assert sweep["repayment"].shape == (3, 2, 2)
+    assert sweep["repayment"][0, 1, 0] == 491.82
+    assert sweep["repayment"][1, 1, 0] == 553.13
+    assert sweep["repayment"][2, 0, 1] == monthly_capital_repayment(
+        200_000, 3, 240
+    )
+
+
+def test_sweep_interest_only_rates(mortgage: int) -> None:
+    """check the interest only sweep covers every combination."""
+    with pytest.raises(IncorrectType):
+        sweep_interest_only_rates(mortgages=[[mortgage]], interest_rates=1)
+
+    sweep = sweep_interest_only_rates(
+        mortgages=mortgage, interest_rates=(1, 2)
+    )
+
+    np.testing.assert_array_equal(sweep["repayment"], [[108.75], [217.50]])
@@ -0,0 +1,77 @@
+"""pytest test cases for the mortgagepy.dates module."""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from mortgagepy import dates
+
+
+def test_months_between_matches_relativedelta() -> None:
+    """check whole months agree with relativedelta, including month ends
+    and negative differences."""
+    rng = np.random.default_rng(25)
+    start_dates = np.datetime64("2000-01-01") + rng.integers(0, 12_000, 5_000)
+    end_dates = np.datetime64("2000-01-01") + rng.integers(0, 12_000, 5_000)
+
+    expected = [
+        relativedelta(end, start).years * 12 + relativedelta(end, start).months
+        for start, end in zip(start_dates.tolist(), end_dates.tolist())
+    ]
+    np.testing.assert_array_equal(
+        dates.months_between(start_dates, end_dates), expected
+    )
+    assert dates.months_between(date(2024, 1, 31), date(2024, 2, 29)) == 1
+    assert dates.months_between(date(2024, 1, 31), date(2024, 2, 28)) == 0
+
+
+def test_add_months() -> None:
+    """check days past the end of a shorter month move to its last day."""
+    moved = dates.add_months(
+        ["2024-01-31", "2023-01-31", "2024-03-15"], [1, 1, -3]
+    )
+    np.testing.assert_array_equal(
+        moved,
+        np.array(["2024-02-29", "2023-02-28", "2023-12-15"], "datetime64[D]"),
+    )
+
+
+def test_term_remaining() -> None:
+    """check remaining terms count whole months elapsed and stop at 0."""
+    remaining = dates.term_remaining(
+        [date(2020, 6, 15), date(2020, 6, 15), date(2000, 1, 1)],
+        [300, 300, 120],
+        as_of=date(2024, 6, 14),
+    )
+    np.testing.assert_array_equal(remaining, [253, 253, 0])
+    assert dates.term_remaining(
+        datetime(2020, 6, 15), 300, as_of=datetime(2024, 6, 15)
+    ) == (252)
+
+
+def test_payment_dates() -> None:
+    """check payment dates step a month at a time on the due day."""
+    np.testing.assert_array_equal(
+        dates.payment_dates(date(2024, 1, 15), 3, day=31),
+        np.array(["2024-01-31", "2024-02-29", "2024-03-31"], "datetime64[D]"),
+    )
+
+    payment_dates = dates.payment_dates(["2024-01-01", "2023-12-05"], 2)
+    assert payment_dates.shape == (2, 2)
+    assert payment_dates[1, 1] == np.datetime64("2024-01-01")
+
+
+def test_month_indices() -> None:
+    """check months index the day count tables and must be inside them."""
+    np.testing.assert_array_equal(
+        dates.month_indices(["1900-01-01", "1901-02-28"]), [0, 13]
+    )
+    with pytest.raises(ValueError):
+        dates.month_indices(date(1899, 12, 1))
+    with pytest.raises(ValueError):
+        dates.month_indices(date(2290, 1, 1), n_months=480)
+    assert dates.to_months(datetime(2024, 5, 17, 12) + timedelta(days=20)) == (
+        np.datetime64("2024-06")
+    )
@@ -0,0 +1,119 @@
+"""pytest test cases for the mortgagepy.daycount module."""
+
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from mortgagepy import batch
+from mortgagepy.calculator import capital_overpayment, monthly_interest
+from mortgagepy.daycount import (
+    CONVENTIONS,
+    day_count_array,
+    day_counts,
+    register_convention,
+    start_month,
+    unregister_convention,
+)
+
+
+def test_day_counts() -> None:
+    """check the day counts roll over from December into a leap year."""
+    assert day_counts(n_months=3, month=11, year=2023) == (
+        (30, 31, 31),
+        (365, 365, 366),
+    )
+    assert day_counts(n_months=1, month=2, year=2024) == ((29,), (366,))
+    assert day_counts(n_months=1, month=2, year=2100) == ((28,), (365,))
+
+
+def test_conventions() -> None:
+    """check the actual/365 and 30/360 conventions."""
+    assert day_counts(2, month=2, year=2024, convention="actual/365") == (
+        (29, 31),
+        (365, 365),
+    )
+    assert day_counts(2, month=2, year=2024, convention="30/360") == (
+        (30, 30),
+        (360, 360),
+    )
+    assert monthly_interest(120_000, 3.6, month=2, day_count="30/360") == (
+        360.0
+    )
+
+
+def test_day_count_array() -> None:
+    """check the arrays are read-only views agreeing with the tuples."""
+    days_in_month, days_in_year = day_count_array(480, month=7, year=2026)
+
+    assert days_in_month.tolist() == list(day_counts(480, 7, 2026)[0])
+    assert days_in_year.tolist() == list(day_counts(480, 7, 2026)[1])
+    with pytest.raises(ValueError):
+        days_in_month[0] = 1
+
+
+def test_out_of_range_and_unknown_convention() -> None:
+    """check months outside of the table and unknown conventions raise."""
+    with pytest.raises(ValueError):
+        day_counts(12, month=1, year=1899)
+    with pytest.raises(ValueError):
+        day_count_array(480, month=1, year=2290)
+    with pytest.raises(ValueError):
+        day_counts(12, month=1, year=2024, convention="actual/360")
+
+
+def test_register_convention() -> None:
+    """check a registered convention is used and replaces cached tables."""
+    try:
+        register_convention("actual/360", lambda year, month: (30, 360))
+        assert day_counts(1, month=3, year=2024, convention="actual/360") == (
+            (30,),
+            (360,),
+        )
+        register_convention("actual/360", lambda year, month: (31, 360))
+        assert day_counts(1, month=3, year=2024, convention="actual/360") == (
+            (31,),
+            (360,),
+        )
+    finally:
+        unregister_convention("actual/360")
+
+    assert "actual/360" not in CONVENTIONS
+    with pytest.raises(ValueError):
+        day_counts(1, month=3, year=2024, convention="actual/360")
+
+
+@pytest.mark.parametrize(
+    "day_count", ["actual/actual", "actual/365", "30/360"]
+)
+def test_scalar_and_batch_agree(day_count: str) -> None:
+    """check the calculator and the vectorised engine agree for every
+    convention."""
+    result = batch.capital_overpayment(
+        [200_000, 90_000], [4.5, 2.1], [300, 180], 150, day_count=day_count
+    )
+
+    for i, (mortgage, rate, term) in enumerate(
+        [(200_000, 4.5, 300), (90_000, 2.1, 180)]
+    ):
+        expected = capital_overpayment(
+            mortgage, rate, term, 150, day_count=day_count
+        )
+        for key, value in expected.items():
+            assert np.asarray(result[key])[i] == value
+
+
+def test_start_month() -> None:
+    """check start dates of every form give the year and month."""
+    for start_date in (
+        date(2024, 3, 15),
+        datetime(2024, 3, 15, 12),
+        "2024-03-15",
+        np.datetime64("2024-03"),
+    ):
+        assert start_month(start_date) == (2024, 3)
+    assert start_month() == (datetime.now().year, datetime.now().month)
+
+    for start_date in (["2024-01-01", "2024-02-01"], "NaT"):
+        with pytest.raises(ValueError):
+            start_month(start_date)
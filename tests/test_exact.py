@@ -0,0 +1,100 @@
+"""pytest test cases for the mortgagepy.exact module."""
+
+import random
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+
+from mortgagepy import calculator, exact
+
+
+def test_matches_calculator() -> None:
+    """check the exact calculator agrees with the float calculator on the
+    calculator's own examples."""
+    assert exact.monthly_capital_repayment(130_500, 6.89, 300) == (
+        Decimal("913.21")
+    )
+    assert exact.total_cost_of_mortgage(130_500, 6.89, 300) == (
+        Decimal("273963.00")
+    )
+    assert exact.monthly_interest(99_276.93, 1.89, month=9, year=2023) == (
+        Decimal("154.22")
+    )
+    assert exact.monthly_interest(98_868.70, 1.89, month=10, year=2023) == (
+        Decimal("158.70")
+    )
+
+
+def test_fractional_term() -> None:
+    """check fractional terms are used as given, like the float calculator,
+    rather than truncated."""
+    for term in (300.5, 299.9):
+        assert exact.monthly_capital_repayment(130_500, 6.89, term) == (
+            Decimal(
+                str(calculator.monthly_capital_repayment(130_500, 6.89, term))
+            )
+        )
+    assert exact.monthly_capital_repayment(
+        130_500, 6.89, 300.5
+    ) != exact.monthly_capital_repayment(130_500, 6.89, 300)
+
+
+def test_rounding() -> None:
+    """check half pennies follow the chosen rounding."""
+    assert exact.monthly_interest_only_repayment(100, 0.3) == Decimal("0.02")
+    assert exact.monthly_interest_only_repayment(
+        100, 0.3, rounding=ROUND_HALF_UP
+    ) == Decimal("0.03")
+
+
+def test_to_decimal() -> None:
+    """check floats are taken by their shortest repr."""
+    assert exact.to_decimal(0.1) == Decimal("0.1")
+    assert exact.to_decimal("3.89") == Decimal("3.89")
+    assert exact.to_decimal(300) == Decimal(300)
+    assert exact.get_context() is exact.get_context()
+
+
+def test_numpy_scalars() -> None:
+    """check NumPy scalars, as held in arrays of loans, are converted like
+    the Python numbers they hold."""
+    assert exact.to_decimal(np.float64(6.89)) == Decimal("6.89")
+    assert exact.to_decimal(np.int64(300)) == Decimal(300)
+    assert exact.monthly_capital_repayment(
+        np.float64(130_500), np.float64(6.89), np.int64(300)
+    ) == Decimal("913.21")
+    assert exact.capital_overpayment(
+        200_000, 3.5, 300, 100, start_date=np.datetime64("2024-02-20")
+    ) == exact.capital_overpayment(
+        200_000, 3.5, 300, 100, start_date=date(2024, 2, 1)
+    )
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_capital_overpayment(seed: int) -> None:
+    """check the exact projection is in whole pennies and within pennies of
+    the float projection, which accumulates float interest."""
+    rng = random.Random(seed)
+    for _ in range(20):
+        loan = (
+            round(rng.uniform(50_000, 1_000_000), 2),
+            round(rng.uniform(0.5, 9.5), 2),
+            rng.randint(60, 480),
+            round(rng.uniform(0, 500), 2),
+            round(rng.uniform(0, 50_000), 2),
+            rng.randint(1, 60),
+        )
+        result = exact.capital_overpayment(*loan)
+        expected = calculator.capital_overpayment(*loan)
+
+        interest_paid = result["total interest paid (£)"]
+        assert interest_paid == interest_paid.quantize(Decimal("0.01"))
+        assert abs(
+            interest_paid - Decimal(repr(expected["total interest paid (£)"]))
+        ) <= Decimal("0.05")
+        assert (
+            result["time to repay (months)"]
+            == (expected["time to repay (months)"])
+        )
@@ -0,0 +1,40 @@
+"""pytest tests for the mortgagepy package initialisation."""
+
+import os
+import subprocess
+import sys
+
+import mortgagepy
+
+DEFERRED_DEPENDENCIES = ("dateutil", "numpy", "rich", "sqlite3")
+
+
+def test_import_defers_dependencies() -> None:
+    """check importing the package and summarising a mortgage does not
+    import the dependencies that are only needed by other features."""
+    code = (
+        "import sys\n"
+        "import mortgagepy\n"
+        "mortgagepy.CapitalRepaymentMortgage(280000, 210000, 300, 1.8)"
+        ".summarise()\n"
+        "print(' '.join(sys.modules))\n"
+    )
+    modules = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout.split()
+
+    for dependency in DEFERRED_DEPENDENCIES:
+        assert dependency not in modules
+
+
+def test_lazy_attributes() -> None:
+    """check submodules and their attributes are available on first use."""
+    from mortgagepy.portfolio import MortgagePortfolio
+
+    assert mortgagepy.MortgagePortfolio is MortgagePortfolio
+    assert mortgagepy.batch.__name__ == "mortgagepy.batch"
+    assert "schedule" in dir(mortgagepy)
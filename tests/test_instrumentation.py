@@ -0,0 +1,119 @@
+"""pytest test cases for the mortgagepy.instrumentation module."""
+
+from typing import Iterator
+
+import pytest
+
+from mortgagepy import CapitalRepaymentMortgage, batch, calculator
+from mortgagepy.cache import disable_shared_cache, enable_shared_cache
+from mortgagepy.instrumentation import (
+    Histogram,
+    Instrumentation,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+)
+from mortgagepy.projection import OverpaymentProjection
+
+
+@pytest.fixture
+def registry() -> Iterator[Instrumentation]:
+    """fixture enabling instrumentation for a single test."""
+    yield enable_instrumentation()
+    disable_instrumentation()
+
+
+def test_disabled_by_default() -> None:
+    """check nothing is recorded unless instrumentation is enabled."""
+    assert get_instrumentation() is None
+    assert calculator.monthly_capital_repayment(130_500, 6.89, 300) == 913.21
+
+
+def test_calculator_calls_and_timings(registry: Instrumentation) -> None:
+    """check calls are counted and timed per calculator function, and
+    projection loops are counted."""
+    calculator.monthly_capital_repayment(130_500, 6.89, 300)
+    calculator.monthly_capital_repayment(130_500, 6.89, 240)
+    result = calculator.capital_overpayment(130_500, 6.89, 300, 200)
+
+    snapshot = registry.snapshot()
+    counters = snapshot["counters"]
+    assert counters["calculator.monthly_capital_repayment.calls"] == 3
+    assert counters["calculator.capital_overpayment.calls"] == 1
+    assert (
+        counters["calculator.capital_overpayment.months"]
+        == (result["time to repay (months)"])
+    )
+
+    timing = snapshot["timings"]["calculator.capital_overpayment"]
+    assert timing["count"] == 1
+    assert timing["total"] > 0
+    assert sum(count for _, count in timing["buckets"]) == 1
+
+
+def test_projection_months(registry: Instrumentation) -> None:
+    """check the months of the vectorised and checkpointed projections are
+    counted."""
+    batch.capital_overpayment([100_000, 200_000], 3.5, [120, 300])
+    projection = OverpaymentProjection(200_000, 3.5, 300)
+    reprojection = projection.reproject(100, from_month=241)
+
+    counters = registry.snapshot()["counters"]
+    assert counters["batch.projection.months"] == 300
+    # the re-projection resumes from the checkpoint at month 241
+    assert counters["projection.OverpaymentProjection.months"] == (
+        projection.result()["time to repay (months)"]
+        + reprojection["time to repay (months)"]
+        - 240
+    )
+
+
+def test_mortgage_method_hits_and_misses(registry: Instrumentation) -> None:
+    """check memoised mortgage methods count hits and misses, including the
+    shared cache."""
+    enable_shared_cache()
+    try:
+        for _ in range(2):
+            mortgage = CapitalRepaymentMortgage(250_000, 200_000, 300, 4.5)
+            mortgage.monthly_repayment()
+            mortgage.monthly_repayment()
+    finally:
+        disable_shared_cache()
+
+    counters = registry.snapshot()["counters"]
+    name = "mortgage.CapitalRepaymentMortgage.monthly_repayment"
+    assert counters[f"{name}.misses"] == 1
+    assert counters[f"{name}.hits"] == 3
+
+
+def test_callbacks(registry: Instrumentation) -> None:
+    """check callbacks receive every event until removed."""
+    events = []
+
+    def callback(kind: str, name: str, value: float) -> None:
+        events.append((kind, name))
+
+    registry.add_callback(callback)
+    calculator.ltv(100_000, 25_000)
+    registry.remove_callback(callback)
+    calculator.ltv(100_000, 25_000)
+
+    assert events == [
+        ("timing", "calculator.ltv"),
+        ("counter", "calculator.ltv.calls"),
+    ]
+    registry.reset()
+    assert registry.snapshot() == {"counters": {}, "timings": {}}
+
+
+def test_histogram_buckets() -> None:
+    """check timings land in the first bucket at or above them."""
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.snapshot()["buckets"] == [
+        (0.1, 2),
+        (1.0, 1),
+        (float("inf"), 1),
+    ]
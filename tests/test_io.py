@@ -0,0 +1,156 @@
+"""pytest test cases for the mortgagepy.io module."""
+
+import csv
+
+import pytest
+
+from mortgagepy.exceptions import IncorrectType
+from mortgagepy.io import RESULT_COLUMNS, read_chunks, reprice_tape
+from mortgagepy.mortgage import CapitalRepaymentMortgage, InterestOnlyMortgage
+
+LOANS = [
+    ("A1", 180_000, 130_500, 300, 6.89, "false"),
+    ("A2", 250_000, 210_000, 240, 1.8, "false"),
+    ("A3", 400_000, 200_000, 300, 3.5, "true"),
+]
+HEADER = (
+    "loan_id",
+    "property_value",
+    "mortgage",
+    "term_months",
+    "interest_rate",
+    "interest_only",
+)
+
+
+@pytest.fixture
+def tape(tmp_path: object) -> object:
+    """CSV loan tape of LOANS."""
+    path = tmp_path / "tape.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(HEADER)
+        writer.writerows(LOANS)
+    return path
+
+
+def test_reprice_tape_csv(tape: object, tmp_path: object) -> None:
+    """check a repriced CSV tape agrees with the mortgage classes."""
+    out_path = tmp_path / "repriced.csv"
+
+    assert reprice_tape(tape, out_path, chunk_size=2) == len(LOANS)
+
+    with open(out_path, newline="") as file:
+        rows = list(csv.DictReader(file))
+
+    assert list(rows[0]) == [*HEADER, *RESULT_COLUMNS]
+    for row, loan in zip(rows, LOANS):
+        mortgage_class = (
+            InterestOnlyMortgage
+            if loan[-1] == "true"
+            else CapitalRepaymentMortgage
+        )
+        mortgage = mortgage_class(*loan[1:-1])
+        assert row["loan_id"] == loan[0]
+        assert float(row["monthly_repayment"]) == mortgage.monthly_repayment()
+        assert float(row["total_cost"]) == mortgage.mortgage_total_cost()
+        assert int(row["ltv"]) == mortgage.ltv()
+        if mortgage_class is CapitalRepaymentMortgage:
+            assert float(row["interest_paid"]) == mortgage.interest_paid()
+
+
+def test_reprice_tape_parquet(tape: object, tmp_path: object) -> None:
+    """check a tape can be repriced to and from Parquet."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    parquet_path = tmp_path / "repriced.parquet"
+    csv_path = tmp_path / "repriced.csv"
+
+    reprice_tape(tape, parquet_path, chunk_size=2)
+    table = pq.read_table(parquet_path)
+    assert table.num_rows == len(LOANS)
+    assert table.column_names == [*HEADER, *RESULT_COLUMNS]
+
+    # repricing the repriced tape overwrites the results with the same values
+    assert reprice_tape(parquet_path, csv_path) == len(LOANS)
+    with open(csv_path, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [float(row["monthly_repayment"]) for row in rows] == (
+        table.column("monthly_repayment").to_pylist()
+    )
+
+
+def test_read_chunks(tape: object) -> None:
+    """check CSV tapes are read in chunks of columns."""
+    chunks = list(read_chunks(tape, chunk_size=2))
+
+    assert [len(chunk["mortgage"]) for chunk in chunks] == [2, 1]
+    assert chunks[1]["loan_id"] == ["A3"]
+
+
+def test_reprice_tape_invalid(tmp_path: object) -> None:
+    """check every invalid row is reported at once."""
+    path = tmp_path / "tape.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(HEADER[1:5])
+        writer.writerows(
+            [
+                (180_000, 130_500, 300, 6.89),
+                (250_000, "n/a", 240, 1.8),
+                (400_000, 200_000, 300, 3.5),
+                (400_000, "", 300, 3.5),
+            ]
+        )
+
+    with pytest.raises(IncorrectType) as error:
+        reprice_tape(path, tmp_path / "out.csv", chunk_size=2)
+    assert error.value.errors == [2]
+
+    with pytest.raises(IncorrectType) as error:
+        reprice_tape(path, tmp_path / "out.csv", chunk_size=10)
+    assert error.value.errors == [2, 4]
+
+    path.write_text("mortgage,term_months\n100000,300\n")
+    with pytest.raises(IncorrectType):
+        reprice_tape(path, tmp_path / "out.csv")
+
+
+def test_reprice_tape_not_positive(tmp_path: object) -> None:
+    """check NaN, zero and negative values are rejected like the mortgage
+    classes reject them."""
+    path = tmp_path / "tape.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(HEADER[1:5])
+        writer.writerows(
+            [
+                (180_000, 130_500, 300, 6.89),
+                (250_000, "nan", 240, 1.8),
+                (400_000, 200_000, 0, 3.5),
+                (400_000, 200_000, 300, -5),
+                (400_000, 200_000, 300, "inf"),
+            ]
+        )
+
+    with pytest.raises(IncorrectType, match="positive") as error:
+        reprice_tape(path, tmp_path / "out.csv")
+    assert error.value.errors == [2, 3, 4, 5]
+
+
+def test_reprice_tape_row_numbers(tmp_path: object) -> None:
+    """check bad and short rows are numbered the same way, by data row
+    rather than by line."""
+    path = tmp_path / "tape.csv"
+    for second_row in (
+        ("A2", 250_000, "n/a", 240, 1.8),
+        ("A2", 250_000, 130_500, 240),
+    ):
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(HEADER[:5])
+            writer.writerow(("A\n1", 180_000, 130_500, 300, 6.89))
+            writer.writerow(second_row)
+
+        with pytest.raises(IncorrectType, match=r"[Rr]ows \[2\]") as error:
+            reprice_tape(path, tmp_path / "out.csv", chunk_size=1)
+        assert error.value.errors == [2]
@@ -0,0 +1,110 @@
+"""pytest test cases for the mortgagepy.kernels module."""
+
+import numpy as np
+import pytest
+
+from mortgagepy import batch, kernels
+from mortgagepy.calculator import capital_overpayment
+from mortgagepy.daycount import day_count_array
+
+
+@pytest.fixture(scope="module")
+def loans() -> tuple:
+    """fixture of loans with overpayments and lump sums, some of which repay
+    the mortgage outright."""
+    rng = np.random.default_rng(21)
+    n_loans = 200
+    return (
+        np.round(rng.uniform(20_000, 600_000, n_loans), 2),
+        np.round(rng.uniform(0.5, 9.5, n_loans), 2),
+        rng.integers(12, 481, n_loans).astype(np.float64),
+        np.round(rng.uniform(0, 500, n_loans), 2),
+        np.round(rng.uniform(0, 150_000, n_loans), 2),
+        rng.integers(1, 120, n_loans).astype(np.float64),
+    )
+
+
+def test_round_pennies() -> None:
+    """check rounding matches the builtin round, including values within an
+    ulp of half a penny and exact ties."""
+    rng = np.random.default_rng(0)
+    halves = (rng.integers(0, 10**8, 10_000) + 0.5) / 100
+    values = np.concatenate(
+        [
+            halves,
+            np.nextafter(halves, 0),
+            np.nextafter(halves, np.inf),
+            rng.uniform(-5_000, 5_000, 10_000),
+            [0.125, 0.375, 2.675, 1.005, -0.125, 0.0],
+        ]
+    )
+
+    for value in values.tolist():
+        assert kernels._round_pennies(value) == round(value, 2)
+
+
+@pytest.mark.parametrize("backend", kernels.available_backends())
+def test_backends_match_calculator(backend: str, loans: tuple) -> None:
+    """check every backend gives the same results as the calculator."""
+    result = batch.capital_overpayment(*loans, backend=backend)
+
+    for i, loan in enumerate(zip(*(values.tolist() for values in loans))):
+        expected = capital_overpayment(*loan)
+        for key, value in expected.items():
+            assert result[key][i] == value
+
+
+def test_uncompiled_loop_on_arrays(loans: tuple) -> None:
+    """check the loop Numba compiles agrees with the other backends when
+    given arrays rather than lists."""
+    projection = batch._project(*loans, record=True)
+    start = projection["start_month"].item()
+    months_to_repay, total_interest_paid = kernels._loop(
+        *loans[:3],
+        batch.monthly_capital_repayment(*loans[:3]),
+        *loans[3:],
+        *day_count_array(
+            int(loans[2].max()), month=start.month, year=start.year
+        ),
+    )
+
+    assert np.array_equal(months_to_repay, projection["months_to_repay"])
+    assert np.array_equal(
+        total_interest_paid, projection["total_interest_paid"]
+    )
+
+
+def test_numba_backend(loans: tuple) -> None:
+    """check the compiled loop rounds and projects exactly as the Python
+    loop it is built from."""
+    pytest.importorskip("numba")
+    kernel = kernels.get_backend("numba")
+
+    result = batch.capital_overpayment(*loans, backend="numba")
+    expected = batch.capital_overpayment(*loans, backend="python")
+    for key, values in expected.items():
+        assert np.array_equal(result[key], values)
+    assert kernels.get_backend("numba") is kernel
+
+
+def test_select_backend() -> None:
+    """check backends can be registered and set, and unknown ones raise."""
+    calls = []
+
+    def kernel(*arrays: np.ndarray) -> tuple:
+        calls.append(len(arrays))
+        return kernels.get_backend("numpy")(*arrays)
+
+    kernels.register_backend("counting", kernel)
+    try:
+        kernels.set_backend("counting")
+        batch.capital_overpayment(200_000, 3.5, 300)
+        assert calls == [9]
+    finally:
+        kernels.set_backend(kernels.DEFAULT_BACKEND)
+        del kernels.BACKENDS["counting"]
+
+    with pytest.raises(ValueError):
+        kernels.get_backend("fortran")
+    with pytest.raises(ValueError):
+        kernels.set_backend("fortran")
@@ -1,5 +1,8 @@
 """pytest tests for mortgagepy.mortgage module."""
 
+import csv
+import weakref
+
 import pytest
 
 from mortgagepy import CapitalRepaymentMortgage, InterestOnlyMortgage
@@ -62,3 +65,132 @@ def test_mortgage_raise() -> None:
             term_months="test",
             interest_rate="test",
         )
+
+
+def test_schedule_capital(capital_mortgage: CapitalRepaymentMortgage) -> None:
+    """check the schedule of a capital repayment mortgage is lazy and
+    repays the mortgage."""
+    schedule = capital_mortgage.schedule()
+    first_row = next(schedule)
+
+    assert first_row.opening_balance == 210000
+    assert first_row.principal + first_row.interest == 869.79
+    assert sum(1 for _ in schedule) == 299
+
+
+def test_setters_invalidate_cached_results(
+    capital_mortgage: CapitalRepaymentMortgage,
+) -> None:
+    """check cached results are recalculated after the inputs change."""
+    assert capital_mortgage.monthly_repayment() == 869.79
+    assert capital_mortgage.ltv() == 75
+
+    capital_mortgage.interest_rate = 3.89
+    capital_mortgage.property_value = 420000
+
+    assert capital_mortgage.monthly_repayment() == 1095.74
+    assert capital_mortgage.ltv() == 50
+
+
+def test_cached_results_do_not_keep_mortgage_alive() -> None:
+    """check a mortgage can be garbage collected after its results are
+    cached."""
+    mortgage = CapitalRepaymentMortgage(
+        property_value=280000,
+        mortgage=210000,
+        term_months=300,
+        interest_rate=1.8,
+    )
+    mortgage.summarise()
+    reference = weakref.ref(mortgage)
+    del mortgage
+
+    assert reference() is None
+
+
+@pytest.mark.parametrize(
+    "mortgage_type", [CapitalRepaymentMortgage, InterestOnlyMortgage]
+)
+def test_from_arrays(mortgage_type: type) -> None:
+    """check mortgages built from columns match those built one by one."""
+    columns = ([280_000, 400_000], [210_000, 150_000], [300, 240], [1.8, 4.5])
+
+    mortgages = mortgage_type.from_arrays(*columns)
+    expected = [mortgage_type(*values) for values in zip(*columns)]
+
+    assert [type(mortgage) for mortgage in mortgages] == [mortgage_type] * 2
+    assert [mortgage.summarise() for mortgage in mortgages] == [
+        mortgage.summarise() for mortgage in expected
+    ]
+    mortgages[0].interest_rate = 2.5
+    assert mortgages[0].monthly_repayment() == (
+        mortgage_type(280_000, 210_000, 300, 2.5).monthly_repayment()
+    )
+
+
+def test_from_records_reports_every_row() -> None:
+    """check every offending row of every column is reported at once."""
+    records = [
+        {
+            "property_value": 280_000,
+            "mortgage": 210_000,
+            "term_months": 300,
+            "interest_rate": 1.8,
+        },
+        {
+            "property_value": "test",
+            "mortgage": 210_000,
+            "term_months": 300,
+            "interest_rate": 1.8,
+        },
+        {"property_value": 280_000, "mortgage": -1, "term_months": 300},
+    ]
+
+    with pytest.raises(IncorrectType) as excinfo:
+        CapitalRepaymentMortgage.from_records(records)
+
+    assert excinfo.value.errors == {
+        "property_value": [1],
+        "mortgage": [2],
+        "interest_rate": [2],
+    }
+    assert len(CapitalRepaymentMortgage.from_records(records[:1])) == 1
+    with pytest.raises(IncorrectType) as excinfo:
+        CapitalRepaymentMortgage.from_arrays([1, 2], [1, 0], [1, 1], [1, 1])
+    assert excinfo.value.errors == {"mortgage": [1]}
+    with pytest.raises(IncorrectType):
+        CapitalRepaymentMortgage.from_arrays([1, 2], [1], [1], [1])
+
+
+def test_from_records_csv(tmp_path: object) -> None:
+    """check the rows of a csv.DictReader are parsed as numbers."""
+    path = tmp_path / "loans.csv"
+    path.write_text(
+        "property_value,mortgage,term_months,interest_rate\n"
+        "280000,210000,300,1.8\n"
+    )
+    with open(path, newline="") as file:
+        (mortgage,) = CapitalRepaymentMortgage.from_records(
+            csv.DictReader(file)
+        )
+
+    assert mortgage.summarise() == (
+        CapitalRepaymentMortgage(280_000, 210_000, 300, 1.8).summarise()
+    )
+    with pytest.raises(IncorrectType):
+        CapitalRepaymentMortgage.from_arrays(["280000"], [1], [1], [1])
+
+
+@pytest.mark.parametrize("value", [0, -1, float("nan"), float("inf")])
+def test_mortgage_not_positive(value: float) -> None:
+    """check one by one and bulk construction, and the setters, all reject
+    values which are not finite and positive."""
+    with pytest.raises(IncorrectType):
+        CapitalRepaymentMortgage(280_000, value, 300, 1.8)
+    with pytest.raises(IncorrectType):
+        CapitalRepaymentMortgage.from_arrays([280_000], [value], [300], [1.8])
+
+    mortgage = CapitalRepaymentMortgage(280_000, 210_000, 300, 1.8)
+    for name in ("property_value", "mortgage", "term_months", "interest_rate"):
+        with pytest.raises(IncorrectType):
+            setattr(mortgage, name, value)
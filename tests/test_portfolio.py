@@ -0,0 +1,174 @@
+"""pytest tests for the mortgagepy.portfolio module."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from mortgagepy import CapitalRepaymentMortgage, InterestOnlyMortgage
+from mortgagepy.exceptions import IncorrectType
+from mortgagepy.portfolio import MortgagePortfolio
+
+
+@pytest.fixture
+def portfolio() -> MortgagePortfolio:
+    """MortgagePortfolio fixture of a capital and an interest only
+    mortgage."""
+    return MortgagePortfolio(
+        property_values=[280000, 280000],
+        mortgages=[210000, 210000],
+        term_months=[300, 300],
+        interest_rates=[1.8, 1.8],
+        interest_only=[False, True],
+    )
+
+
+def test_views_behave_like_mortgages(portfolio: MortgagePortfolio) -> None:
+    """check portfolio views give the same results as mortgage objects."""
+    capital, interest_only = portfolio
+
+    assert isinstance(capital, CapitalRepaymentMortgage)
+    assert isinstance(interest_only, InterestOnlyMortgage)
+    assert (
+        capital.summarise()
+        == CapitalRepaymentMortgage(
+            property_value=280000,
+            mortgage=210000,
+            term_months=300,
+            interest_rate=1.8,
+        ).summarise()
+    )
+    assert interest_only.monthly_repayment() == 315.0
+
+
+def test_views_write_to_portfolio(portfolio: MortgagePortfolio) -> None:
+    """check setting an attribute of a view updates the portfolio."""
+    capital = portfolio[0]
+    assert capital.ltv() == 75
+
+    capital.property_value = 420000
+
+    assert portfolio.property_values[0] == 420000
+    assert capital.ltv() == 50
+    assert portfolio[-2].ltv() == 50
+
+
+def test_from_mortgages() -> None:
+    """check a portfolio can be built from mortgage objects."""
+    portfolio = MortgagePortfolio.from_mortgages(
+        [
+            CapitalRepaymentMortgage(280000, 210000, 300, 1.8),
+            InterestOnlyMortgage(200000, 100000, 240, 3.5),
+        ]
+    )
+
+    assert len(portfolio) == 2
+    np.testing.assert_array_equal(portfolio.interest_only, [False, True])
+    assert portfolio.mortgages.dtype == np.float64
+
+
+def test_portfolio_raise() -> None:
+    """check the portfolio raises an exception when passed incorrect
+    columns."""
+    with pytest.raises(IncorrectType):
+        MortgagePortfolio(["test"], [1], [1], [1])
+    with pytest.raises(IncorrectType):
+        MortgagePortfolio([1, 2], [1], [1], [1])
+    with pytest.raises(IncorrectType) as excinfo:
+        MortgagePortfolio([1, 2], [1, np.inf], [0, 1], [1, -1])
+    assert excinfo.value.errors == {
+        "mortgages": [1],
+        "term_months": [0],
+        "interest_rates": [1],
+    }
+
+
+def test_portfolio_from_records() -> None:
+    """check a portfolio built from records validates every row and reads
+    interest only flags."""
+    records = [
+        {
+            "property_value": 280_000,
+            "mortgage": 210_000,
+            "term_months": 300,
+            "interest_rate": 1.8,
+        },
+        {
+            "property_value": "n/a",
+            "mortgage": "150000",
+            "term_months": 240,
+            "interest_rate": 4.5,
+            "interest_only": "true",
+        },
+    ]
+
+    with pytest.raises(IncorrectType) as excinfo:
+        MortgagePortfolio.from_records(records)
+    assert excinfo.value.errors == {"property_value": [1]}
+
+    records[1]["property_value"] = "400000"
+    portfolio = MortgagePortfolio.from_records(records)
+    np.testing.assert_array_equal(portfolio.interest_only, [False, True])
+    np.testing.assert_array_equal(portfolio.term_months, [300, 240])
+    np.testing.assert_array_equal(portfolio.property_values, [280_000, 4e5])
+
+
+def test_mortgages_have_no_instance_dict() -> None:
+    """check mortgage objects use slots rather than an instance dict."""
+    mortgage = CapitalRepaymentMortgage(280000, 210000, 300, 1.8)
+
+    assert not hasattr(mortgage, "__dict__")
+
+
+def test_aggregates(portfolio: MortgagePortfolio) -> None:
+    """check the portfolio aggregates match the individual mortgages."""
+    portfolio.mortgages[1] = 70000
+    portfolio.interest_rates[1] = 5.4
+
+    assert portfolio.total_balance() == 280000
+    assert portfolio.weighted_average_rate() == pytest.approx(2.7)
+    assert portfolio.weighted_average_term() == 300
+    np.testing.assert_array_equal(
+        portfolio.monthly_repayments(),
+        [m.monthly_repayment() for m in portfolio],
+    )
+    assert portfolio.summarise()["monthly repayments (£)"] == 1184.79
+
+
+def test_ltv_distribution(portfolio: MortgagePortfolio) -> None:
+    """check mortgages are counted in their loan to value band."""
+    portfolio.mortgages[1] = 252000
+
+    distribution = portfolio.ltv_distribution(bands=(75, 90))
+
+    assert distribution == {
+        "<=75%": {"mortgages": 1, "balance (£)": 210000},
+        "75-90%": {"mortgages": 1, "balance (£)": 252000},
+        ">90%": {"mortgages": 0, "balance (£)": 0},
+    }
+
+
+def test_cash_flows(portfolio: MortgagePortfolio) -> None:
+    """check the projected cash flows repay the whole portfolio."""
+    cash_flows = portfolio.cash_flows()
+    capital = portfolio[0].schedule()
+
+    assert len(cash_flows["interest"]) == 300
+    assert cash_flows["opening_balance"][0] == 420000
+    assert cash_flows["closing_balance"][-1] == 0
+    assert cash_flows["interest"][0] == next(capital).interest + 315
+    assert cash_flows["principal"].sum() == pytest.approx(420000)
+
+
+def test_cash_flows_start_date(portfolio: MortgagePortfolio) -> None:
+    """check cash flows are projected from an explicit start date, shared
+    or per mortgage."""
+    start_date = date(2024, 2, 1)
+    cash_flows = portfolio.cash_flows(start_date="2024-02-01")
+    (row, *_) = portfolio[0].schedule(start_date=start_date)
+
+    assert cash_flows["interest"][0] == row.interest + 315
+    for key, values in portfolio.cash_flows(
+        start_date=[start_date, date(2030, 1, 1)]
+    ).items():
+        np.testing.assert_array_equal(values, cash_flows[key])
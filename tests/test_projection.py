@@ -0,0 +1,74 @@
+"""pytest test cases for the mortgagepy.projection module."""
+
+from datetime import date
+
+import pytest
+
+from mortgagepy.calculator import capital_overpayment
+from mortgagepy.exceptions import IncorrectType
+from mortgagepy.projection import OverpaymentProjection
+
+
+@pytest.mark.parametrize(
+    "lump_sum_payment, lump_sum_payment_month", [(0, 1), (20_000, 30)]
+)
+def test_result_matches_capital_overpayment(
+    lump_sum_payment: float, lump_sum_payment_month: int
+) -> None:
+    """check the base projection and a change from the first month agree
+    with capital_overpayment."""
+    projection = OverpaymentProjection(
+        200_000, 3.5, 300, 100, lump_sum_payment, lump_sum_payment_month
+    )
+
+    assert projection.result() == capital_overpayment(
+        200_000, 3.5, 300, 100, lump_sum_payment, lump_sum_payment_month
+    )
+    assert projection.reproject(250, from_month=1) == capital_overpayment(
+        200_000, 3.5, 300, 250, lump_sum_payment, lump_sum_payment_month
+    )
+
+
+@pytest.mark.parametrize("from_month", [1, 12, 13, 100, 299, 300])
+def test_reproject_matches_full_projection(from_month: int) -> None:
+    """check resuming from a checkpoint agrees with projecting from month 1."""
+    projection = OverpaymentProjection(
+        200_000, 3.5, 300, 100, 10_000, 50, checkpoint_every=12
+    )
+    full_projection = OverpaymentProjection(
+        200_000, 3.5, 300, 100, 10_000, 50, checkpoint_every=1_000
+    )
+
+    for monthly_overpayment in (0, 100, 500):
+        assert projection.reproject(monthly_overpayment, from_month) == (
+            full_projection.reproject(monthly_overpayment, from_month)
+        )
+
+
+def test_reproject_edge_cases() -> None:
+    """check changes after the mortgage is repaid and invalid months."""
+    projection = OverpaymentProjection(50_000, 3.5, 300, 1_000)
+    months_to_repay = projection.result()["time to repay (months)"]
+
+    assert projection.reproject(0, months_to_repay + 1) == (
+        projection.result()
+    )
+    assert projection.reproject(0, months_to_repay) != projection.result()
+
+    with pytest.raises(IncorrectType):
+        projection.reproject(100, 0)
+    with pytest.raises(IncorrectType):
+        OverpaymentProjection(50_000, 3.5, 300, checkpoint_every=0)
+
+
+def test_start_date() -> None:
+    """check a projection from an explicit start date matches
+    capital_overpayment from the same month."""
+    start_date = date(2027, 12, 1)
+    projection = OverpaymentProjection(
+        200_000, 3.5, 300, 100, start_date="2027-12-31"
+    )
+
+    assert projection.reproject(250, from_month=1) == capital_overpayment(
+        200_000, 3.5, 300, 250, start_date=start_date
+    )
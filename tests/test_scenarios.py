@@ -0,0 +1,88 @@
+"""pytest tests for the mortgagepy.scenarios module."""
+
+from datetime import date
+
+import pytest
+
+from mortgagepy import CapitalRepaymentMortgage, InterestOnlyMortgage
+from mortgagepy.calculator import capital_overpayment
+from mortgagepy.exceptions import IncorrectType
+from mortgagepy.scenarios import run_overpayment_scenarios
+
+STRATEGIES = [
+    {},
+    {"monthly_overpayment": 100},
+    {"lump_sum_payment": 10_000, "lump_sum_payment_month": 12},
+]
+
+
+@pytest.fixture
+def loans() -> list:
+    """fixture of capital repayment mortgages."""
+    return [
+        CapitalRepaymentMortgage(
+            property_value=300_000,
+            mortgage=100_000 + 10_000 * i,
+            term_months=120 + 12 * i,
+            interest_rate=1.5 + 0.25 * i,
+        )
+        for i in range(10)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_overpayment_scenarios_matches_serial(
+    loans: list, workers: int
+) -> None:
+    """check scenarios give the same results as serial projections."""
+    results = run_overpayment_scenarios(
+        loans, STRATEGIES, workers=workers, chunk_size=3
+    )
+    expected = {
+        (loan_index, strategy_index): capital_overpayment(
+            mortgage=loan.mortgage,
+            interest_rate=loan.interest_rate,
+            mortgage_length_months=loan.term_months,
+            **strategy,
+        )
+        for loan_index, loan in enumerate(loans)
+        for strategy_index, strategy in enumerate(STRATEGIES)
+    }
+
+    assert {
+        (loan_index, strategy_index): result
+        for loan_index, strategy_index, result in results
+    } == expected
+
+
+def test_run_overpayment_scenarios_raise(loans: list) -> None:
+    """check an unknown strategy key raises an exception."""
+    with pytest.raises(IncorrectType):
+        list(run_overpayment_scenarios(loans, [{"overpayment": 100}]))
+
+
+def test_run_overpayment_scenarios_interest_only(loans: list) -> None:
+    """check books with interest only loans are rejected rather than
+    projected as if they were being repaid."""
+    loans.append(InterestOnlyMortgage(300_000, 200_000, 300, 4.0))
+
+    with pytest.raises(IncorrectType, match=r"indices \[10\]"):
+        list(run_overpayment_scenarios(loans, [{"monthly_overpayment": 0}]))
+
+
+def test_run_overpayment_scenarios_start_dates(loans: list) -> None:
+    """check loans are projected from their own start dates."""
+    start_dates = [date(2020 + i, 1 + i, 1) for i in range(len(loans))]
+    results = run_overpayment_scenarios(
+        loans, STRATEGIES[1:2], workers=1, chunk_size=4, start_date=start_dates
+    )
+
+    for loan_index, _, result in results:
+        loan = loans[loan_index]
+        assert result == capital_overpayment(
+            loan.mortgage,
+            loan.interest_rate,
+            loan.term_months,
+            100,
+            start_date=start_dates[loan_index],
+        )
@@ -0,0 +1,167 @@
+"""pytest test cases for the mortgagepy.schedule module."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from mortgagepy.batch import SCHEDULE_FIELDS
+from mortgagepy.calculator import capital_overpayment
+from mortgagepy.schedule import (
+    amortisation_schedule,
+    iter_schedule,
+    to_arrow,
+    to_records,
+)
+
+
+def test_amortisation_schedule_single_mortgage() -> None:
+    """check a single mortgage schedule agrees with capital_overpayment."""
+    schedule = amortisation_schedule(
+        mortgages=200_000,
+        interest_rates=3.5,
+        mortgage_length_months=300,
+        monthly_overpayment=100,
+    )
+    overpayment = capital_overpayment(
+        mortgage=200_000,
+        interest_rate=3.5,
+        mortgage_length_months=300,
+        monthly_overpayment=100,
+    )
+
+    assert schedule["months_to_repay"] == overpayment["time to repay (months)"]
+    assert schedule["interest"].shape == (schedule["months_to_repay"],)
+    assert (
+        round(schedule["interest"].sum(), 2)
+        == (overpayment["total interest paid (£)"])
+    )
+    assert schedule["opening_balance"][0] == 200_000
+    assert schedule["closing_balance"][-1] == 0
+    np.testing.assert_allclose(
+        schedule["opening_balance"][1:], schedule["closing_balance"][:-1]
+    )
+
+
+def test_amortisation_schedule_balances() -> None:
+    """check every month of a batch schedule balances."""
+    schedule = amortisation_schedule(
+        mortgages=[100_000, 250_000],
+        interest_rates=[4.5, 2.1],
+        mortgage_length_months=[120, 300],
+        lump_sum_payment=[0, 20_000],
+        lump_sum_payment_month=12,
+    )
+
+    assert schedule["interest"].shape == (2, 300)
+    assert schedule["months_to_repay"][0] == 120
+    assert schedule["months_to_repay"][1] < 300
+    np.testing.assert_allclose(
+        schedule["opening_balance"] - schedule["closing_balance"],
+        schedule["principal"] + schedule["overpayment"],
+    )
+    assert schedule["overpayment"][1, 11] == 20_000
+    assert not schedule["interest"][0, 120:].any()
+
+
+def test_iter_schedule_matches_amortisation_schedule() -> None:
+    """check the lazy schedule agrees with the array schedule."""
+    rows = list(
+        iter_schedule(
+            mortgage=150_000,
+            interest_rate=4.2,
+            mortgage_length_months=240,
+            monthly_overpayment=75,
+            lump_sum_payment=5_000,
+            lump_sum_payment_month=3,
+        )
+    )
+    schedule = amortisation_schedule(
+        mortgages=150_000,
+        interest_rates=4.2,
+        mortgage_length_months=240,
+        monthly_overpayment=75,
+        lump_sum_payment=5_000,
+        lump_sum_payment_month=3,
+    )
+
+    assert len(rows) == schedule["months_to_repay"]
+    for field in SCHEDULE_FIELDS:
+        np.testing.assert_array_equal(
+            [getattr(row, field) for row in rows], schedule[field]
+        )
+
+
+def test_iter_schedule_lump_sum_repays_mortgage() -> None:
+    """check a lump sum bigger than the balance ends the schedule."""
+    rows = list(iter_schedule(1_000, 5, 12, lump_sum_payment=2_000))
+
+    assert len(rows) == 1
+    assert rows[0].overpayment == 1_000
+    assert rows[0].closing_balance == 0
+
+
+def test_to_records_batch() -> None:
+    """check a batch schedule flattens to one record per month repaid."""
+    schedule = amortisation_schedule(
+        mortgages=[100_000, 50_000],
+        interest_rates=3,
+        mortgage_length_months=[24, 12],
+    )
+    records = to_records(schedule)
+
+    assert records.dtype.names == (
+        "loan",
+        "month",
+        "date",
+        *SCHEDULE_FIELDS,
+    )
+    assert len(records) == 36
+    np.testing.assert_array_equal(records["loan"][23:25], [0, 1])
+    np.testing.assert_array_equal(records["month"][23:25], [24, 1])
+    assert records["date"][0] == records["date"][24]
+    np.testing.assert_array_equal(
+        records["interest"][:24], schedule["interest"][0]
+    )
+
+
+def test_to_arrow_single() -> None:
+    """check a single mortgage schedule converts to an arrow table."""
+    pa = pytest.importorskip("pyarrow")
+    schedule = amortisation_schedule(
+        mortgages=100_000, interest_rates=3, mortgage_length_months=24
+    )
+    table = to_arrow(schedule)
+
+    assert table.num_rows == 24
+    assert table.column_names == ["month", "date", *SCHEDULE_FIELDS]
+    assert table.schema.field("interest").type == pa.float64()
+    np.testing.assert_array_equal(
+        table.column("closing_balance").to_numpy(),
+        schedule["closing_balance"],
+    )
+
+
+def test_schedule_start_dates() -> None:
+    """check schedules are dated from an explicit start date, shared or per
+    mortgage."""
+    rows = list(iter_schedule(100_000, 3.5, 24, start_date=date(2024, 11, 9)))
+    assert rows[0].date == date(2024, 11, 1)
+    assert rows[2].date == date(2025, 1, 1)
+    assert list(iter_schedule(100_000, 3.5, 24, start_date="2024-11")) == rows
+
+    schedule = amortisation_schedule(
+        [100_000, 50_000],
+        3.5,
+        [24, 12],
+        start_date=[date(2024, 11, 9), date(2025, 2, 1)],
+    )
+    assert schedule["date"].shape == (2, 24)
+    assert schedule["date"][1, 0] == np.datetime64("2025-02-01")
+    np.testing.assert_array_equal(
+        schedule["interest"][0, :24], [row.interest for row in rows]
+    )
+
+    records = to_records(schedule)
+    assert len(records) == 36
+    assert records["date"][24] == np.datetime64("2025-02-01")
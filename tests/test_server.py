@@ -0,0 +1,146 @@
+"""pytest test cases for the mortgagepy.server module."""
+
+import asyncio
+import json
+
+import pytest
+
+from mortgagepy.mortgage import CapitalRepaymentMortgage, InterestOnlyMortgage
+from mortgagepy.server import QuoteBatcher, QuoteServer
+
+
+async def _request(
+    app: QuoteServer, method: str, path: str, body: object = None
+) -> tuple:
+    """Send a single request to the app in-process."""
+    messages = [
+        {
+            "type": "http.request",
+            "body": b"" if body is None else json.dumps(body).encode(),
+        }
+    ]
+    response = {}
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        else:
+            response["body"] = json.loads(message["body"])
+
+    scope = {"type": "http", "method": method, "path": path}
+    await app(scope, receive, send)
+    return response["status"], response["body"]
+
+
+def test_quote_matches_summarise() -> None:
+    """check concurrent quotes are batched and match summarise."""
+    app = QuoteServer(max_wait=0.01)
+    loans = [
+        (180_000, 130_500, 300, 6.89),
+        (250_000, 210_000, 240, 1.8),
+        (400_000, 200_000, 300, 3.5),
+    ]
+
+    async def quote_all() -> list:
+        return await asyncio.gather(
+            *(
+                _request(
+                    app,
+                    "POST",
+                    "/quote",
+                    dict(
+                        zip(
+                            (
+                                "property_value",
+                                "mortgage",
+                                "term_months",
+                                "interest_rate",
+                            ),
+                            loan,
+                        ),
+                        interest_only=index == 2,
+                    ),
+                )
+                for index, loan in enumerate(loans)
+            )
+        )
+
+    responses = asyncio.run(quote_all())
+
+    assert [status for status, _ in responses] == [200, 200, 200]
+    assert responses[0][1] == CapitalRepaymentMortgage(*loans[0]).summarise()
+    assert responses[1][1] == CapitalRepaymentMortgage(*loans[1]).summarise()
+    assert responses[2][1] == InterestOnlyMortgage(*loans[2]).summarise()
+    assert app.batcher.batches == 1
+
+    status, metrics = asyncio.run(_request(app, "GET", "/metrics"))
+    assert status == 200
+    assert metrics["quotes"] == 3
+    assert metrics["batches"] == 1
+    assert 0 < metrics["p50 (ms)"] <= metrics["p99 (ms)"]
+
+
+def test_max_batch_size() -> None:
+    """check a full batch is priced without waiting for the timer."""
+    batcher = QuoteBatcher(max_batch_size=2, max_wait=60)
+    quote = {
+        "property_value": 180_000,
+        "mortgage": 130_500,
+        "term_months": 300,
+        "interest_rate": 6.89,
+    }
+
+    async def quote_all() -> list:
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.quote(quote) for _ in range(4))), 5
+        )
+
+    assert len(asyncio.run(quote_all())) == 4
+    assert batcher.batches == 2
+
+    with pytest.raises(ValueError):
+        QuoteBatcher(max_batch_size=0)
+
+
+@pytest.mark.parametrize(
+    "method, path, body, status",
+    [
+        ("POST", "/quote", {"mortgage": 100_000}, 400),
+        (
+            "POST",
+            "/quote",
+            {
+                "property_value": 180_000,
+                "mortgage": "130500",
+                "term_months": 300,
+                "interest_rate": 6.89,
+            },
+            400,
+        ),
+        ("POST", "/quote", [1, 2], 400),
+        (
+            "POST",
+            "/quote",
+            {
+                "property_value": float("inf"),
+                "mortgage": float("nan"),
+                "term_months": 300,
+                "interest_rate": 6.89,
+            },
+            400,
+        ),
+        ("GET", "/quote", None, 405),
+        ("GET", "/missing", None, 404),
+    ],
+)
+def test_errors(method: str, path: str, body: object, status: int) -> None:
+    """check invalid requests are rejected."""
+    response_status, response = asyncio.run(
+        _request(QuoteServer(), method, path, body)
+    )
+
+    assert response_status == status
+    assert "error" in response
@@ -0,0 +1,143 @@
+"""pytest test cases for the mortgagepy.solvers module."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from mortgagepy import batch
+from mortgagepy.calculator import (
+    monthly_capital_repayment,
+    total_cost_of_mortgage,
+)
+from mortgagepy.exceptions import IncorrectType
+from mortgagepy.solvers import (
+    Solution,
+    break_even_rate,
+    implied_rate,
+    max_mortgage,
+    required_term,
+)
+
+
+@pytest.fixture
+def loans() -> tuple:
+    """Random mortgages, rates, terms and their repayments."""
+    rng = np.random.default_rng(7)
+    mortgages = np.round(rng.uniform(50_000, 1_000_000, 20_000), 2)
+    interest_rates = np.round(rng.uniform(0.5, 12, 20_000), 2)
+    terms = rng.integers(12, 480, 20_000).astype(np.float64)
+    repayments = batch.monthly_capital_repayment(
+        mortgages, interest_rates, terms
+    )
+    return mortgages, interest_rates, terms, repayments
+
+
+def test_max_mortgage_scalar() -> None:
+    """check the maximum mortgage is the largest affordable to the penny."""
+    solution = max_mortgage(913.21, 6.89, 300)
+
+    assert isinstance(solution, Solution)
+    assert solution.converged is True
+    assert monthly_capital_repayment(solution.value, 6.89, 300) <= 913.21
+    assert monthly_capital_repayment(solution.value + 0.01, 6.89, 300) > (
+        913.21
+    )
+
+
+def test_max_mortgage_array(loans: tuple) -> None:
+    """check the maximum mortgage of every applicant."""
+    mortgages, interest_rates, terms, repayments = loans
+
+    solution = max_mortgage(repayments, interest_rates, terms)
+
+    assert solution.converged.all()
+    assert (solution.value >= mortgages).all()
+    assert (
+        batch.monthly_capital_repayment(solution.value, interest_rates, terms)
+        <= repayments
+    ).all()
+    assert (
+        batch.monthly_capital_repayment(
+            solution.value + 0.01, interest_rates, terms
+        )
+        > repayments
+    ).all()
+
+
+def test_required_term(loans: tuple) -> None:
+    """check the required term is the shortest affordable term."""
+    mortgages, interest_rates, terms, repayments = loans
+
+    solution = required_term(repayments, mortgages, interest_rates)
+
+    assert solution.converged.all()
+    assert (solution.value <= terms).all()
+    assert (
+        batch.monthly_capital_repayment(
+            mortgages, interest_rates, solution.value
+        )
+        <= repayments
+    ).all()
+    assert (
+        batch.monthly_capital_repayment(
+            mortgages, interest_rates, solution.value - 1
+        )
+        > repayments
+    ).all()
+
+    assert required_term(500, 50_000, 0) == Solution(100.0, 0, True)
+    # the payment does not cover the interest
+    assert required_term(100, 100_000, 3) == Solution(np.inf, 0, False)
+
+
+def test_implied_rate(loans: tuple) -> None:
+    """check Newton's method recovers the rate from unrounded repayments."""
+    mortgages, interest_rates, terms, _ = loans
+    r = interest_rates / 1200
+    repayments = mortgages * r / (1 - (1 + r) ** -terms)
+
+    solution = implied_rate(repayments, mortgages, terms)
+
+    assert solution.converged.all()
+    assert solution.iterations.max() < 10
+    np.testing.assert_allclose(solution.value, interest_rates, rtol=1e-9)
+
+    solution = implied_rate(100, 100_000, 300)
+    assert np.isnan(solution.value)
+    assert solution.converged is False
+
+
+def test_break_even_rate() -> None:
+    """check both products cost the same at the break-even rate."""
+    solution = break_even_rate(
+        200_000, 4.5, 60, fees=0, other_fees=999, tol=1e-15
+    )
+
+    assert solution.converged is True
+    assert solution.value < 4.5
+    assert total_cost_of_mortgage(200_000, solution.value, 60) + 999 == (
+        pytest.approx(total_cost_of_mortgage(200_000, 4.5, 60), abs=0.6)
+    )
+
+    solution = break_even_rate([200_000, 300_000], [4.5, 5], 300, 1000, 0)
+    assert (solution.value > [4.5, 5]).all()
+
+
+def test_solvers_raise() -> None:
+    """check terms, payments and rates which are not finite and positive
+    are rejected up front."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for args in ((913.21, 6.89, 0), (0, 6.89, 300), (913.21, np.nan, 300)):
+            with pytest.raises(IncorrectType):
+                max_mortgage(*args)
+        with pytest.raises(IncorrectType) as excinfo:
+            max_mortgage(913.21, 6.89, [300, np.inf, -1])
+        assert excinfo.value.errors == {"mortgage_length_months": [1, 2]}
+        with pytest.raises(IncorrectType):
+            required_term(500, 50_000, -1)
+        with pytest.raises(IncorrectType):
+            implied_rate(913.21, 130_500, 0)
+        with pytest.raises(IncorrectType):
+            break_even_rate(200_000, np.inf, 60)
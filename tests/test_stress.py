@@ -0,0 +1,95 @@
+"""pytest test cases for the mortgagepy.stress module."""
+
+import numpy as np
+import pytest
+
+from mortgagepy import batch
+from mortgagepy.exceptions import IncorrectType
+from mortgagepy.mortgage import CapitalRepaymentMortgage
+from mortgagepy.stress import (
+    STRESS_KEYS,
+    run_stress_tests,
+    stress_test,
+    vasicek_paths,
+)
+
+
+def test_vasicek_paths() -> None:
+    """check paths are seeded, floored and revert to the mean."""
+    paths = vasicek_paths(6, 3, 1.0, 0.5, n_paths=2_000, n_months=240, seed=1)
+
+    assert paths.shape == (2_000, 240)
+    assert (paths[:, 0] == 6).all()
+    assert paths.min() >= 0.01
+    assert abs(paths[:, -1].mean() - 3) < 0.1
+    np.testing.assert_array_equal(
+        paths, vasicek_paths(6, 3, 1.0, 0.5, 2_000, 240, seed=1)
+    )
+
+    with pytest.raises(IncorrectType):
+        vasicek_paths(6, 3, 0, 0.5, 10, 10)
+
+
+def test_stress_test_flat_paths() -> None:
+    """check flat rate paths give the single rate projection."""
+    result = stress_test(200_000, 300, np.full((3, 300), 4.5))
+
+    expected = batch.capital_overpayment(200_000, 4.5, 300)
+    np.testing.assert_array_equal(
+        result["total interest paid (£)"],
+        expected["total interest paid (£)"][0],
+    )
+    np.testing.assert_array_equal(
+        result["max monthly repayment (£)"],
+        batch.monthly_capital_repayment(200_000, 4.5, 300),
+    )
+    np.testing.assert_array_equal(result["payment shock (%)"], 0)
+
+
+def test_stress_test_chunks() -> None:
+    """check the results do not depend on the chunk size."""
+    paths = vasicek_paths(4.5, 4, 0.3, 1.2, n_paths=50, n_months=300, seed=2)
+
+    result = stress_test(200_000, 300, paths, chunk_size=7)
+    expected = stress_test(200_000, 300, paths, chunk_size=50)
+
+    for key in STRESS_KEYS:
+        np.testing.assert_array_equal(result[key], expected[key])
+    assert (result["payment shock (%)"] >= 0).all()
+
+    with pytest.raises(IncorrectType):
+        stress_test(200_000, 300, paths[0])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_stress_tests(workers: int) -> None:
+    """check every loan is stress tested against the paths."""
+    paths = vasicek_paths(4.5, 4, 0.3, 1.2, n_paths=20, n_months=300, seed=3)
+    loans = [
+        CapitalRepaymentMortgage(300_000, 200_000, 300, 4.5),
+        CapitalRepaymentMortgage(250_000, 150_000, 240, 4.5),
+    ]
+
+    results = dict(run_stress_tests(loans, paths, workers=workers))
+
+    assert sorted(results) == [0, 1]
+    for loan, result in zip(loans, (results[0], results[1])):
+        expected = stress_test(loan.mortgage, loan.term_months, paths)
+        for key in STRESS_KEYS:
+            np.testing.assert_array_equal(result[key], expected[key])
+
+
+def test_run_stress_tests_start_date() -> None:
+    """check an explicit start date is used for every loan."""
+    paths = vasicek_paths(4.5, 4, 0.3, 1.2, n_paths=5, n_months=120, seed=4)
+    loans = [CapitalRepaymentMortgage(300_000, 200_000, 120, 4.5)]
+
+    ((_, result),) = run_stress_tests(
+        loans, paths, workers=1, start_date="2028-02-01"
+    )
+    expected = stress_test(
+        200_000, 120, paths, start_date=np.datetime64("2028-02")
+    )
+
+    for key in STRESS_KEYS:
+        np.testing.assert_array_equal(result[key], expected[key])